@@ -4,6 +4,7 @@ import { useRouter, useFocusEffect } from 'expo-router';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import FontAwesome from '@expo/vector-icons/FontAwesome';
 import { breedImages } from '@/utils/breedImages';
+import { Relaxation, getPrecomputedMatches } from '@/utils/questionnaireResults';
 import { useFlow } from '@/contexts/FlowContext';
 import { useBreeds } from '@/hooks/useDatabase';
 import { useBreedMatcher } from '@/hooks/useBreedMatcher';
@@ -33,6 +34,29 @@ const COMMON_SHELTER_BREEDS = [
   'Boston Terrier',
 ];
 
+// How relaxed answers are named in the results note
+const RELAXATION_LABELS: { [column: string]: string } = {
+  size: 'size',
+  energy_level: 'energy',
+  good_with_kids: 'kids',
+  good_with_pets: 'other pets',
+  grooming_needs: 'grooming',
+};
+
+const joinLabels = (columns: string[]) => columns.map(column => RELAXATION_LABELS[column] ?? column).join(' and ');
+
+const describeRelaxation = (relaxation: Relaxation): string | null => {
+  if (!relaxation) return null;
+  const parts: string[] = [];
+  if (relaxation.widened.length > 0) {
+    parts.push(`we widened your ${joinLabels(relaxation.widened)} answer${relaxation.widened.length > 1 ? 's' : ''} to the nearest levels`);
+  }
+  if (relaxation.dropped.length > 0) {
+    parts.push(`we left out your ${joinLabels(relaxation.dropped)} answer${relaxation.dropped.length > 1 ? 's' : ''}`);
+  }
+  return parts.length > 0 ? `Few breeds matched every answer, so ${parts.join(' and ')} to suggest more.` : null;
+};
+
 export default function FlowResultsScreen() {
   const router = useRouter();
   const { preferences } = useFlow();
@@ -40,6 +64,7 @@ export default function FlowResultsScreen() {
   const { findBestMatches, isMatching } = useBreedMatcher();
   const { isInitialized } = useDatabaseContext();
   const [matches, setMatches] = useState<any[]>([]);
+  const [relaxation, setRelaxation] = useState<Relaxation>(null);
   const [favorites, setFavorites] = useState<Set<number>>(new Set());
   
   const screenWidth = Dimensions.get('window').width;
@@ -63,7 +88,16 @@ export default function FlowResultsScreen() {
     }
 
     try {
+      // Flow answers have precomputed results; anything else goes through the matcher
+      const precomputed = getPrecomputedMatches(breeds, preferences);
+      if (precomputed && precomputed.matches.length > 0) {
+        setRelaxation(precomputed.relaxation);
+        setMatches(precomputed.matches);
+        return;
+      }
+
       const foundMatches = await findBestMatches(breeds, preferences);
+      setRelaxation(null);
       // console.log('foundMatches', foundMatches);
       setMatches(foundMatches);
     } catch (error) {
@@ -129,6 +163,10 @@ export default function FlowResultsScreen() {
             <>
               <Text style={styles.title}>Match Results</Text>
               <Text style={styles.subtitle}>We found some amazing dogs that could be your perfect companion! Each of these breeds matches your lifestyle and preferences.</Text>
+
+              {describeRelaxation(relaxation) && (
+                <Text style={styles.relaxationText}>{describeRelaxation(relaxation)}</Text>
+              )}
               
               <View style={styles.adoptionMessage}>
                 <Text style={styles.adoptionMessageText}>
@@ -294,6 +332,13 @@ const styles = StyleSheet.create({
     marginBottom: 40,
     opacity: 0.8,
   },
+  relaxationText: {
+    fontSize: 15,
+    color: Colors.light.textCharcoal,
+    textAlign: 'center',
+    marginBottom: 24,
+    fontStyle: 'italic',
+  },
   summaryContainer: {
     backgroundColor: 'white',
     padding: 20,
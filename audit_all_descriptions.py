@@ -2,259 +2,281 @@
 """
 Comprehensive audit of all dog breed descriptions.
 This script checks for:
-1. Descriptions that don't match the breed name
-2. Incorrect weight/height information
-3. Wrong temperament descriptions
-4. Mismatched breed characteristics
-5. Generic or placeholder descriptions
+1. Descriptions that mention a different breed instead of their own (a
+   designer mix may name both of its parent breeds)
+2. Missing, generic or placeholder descriptions
+
+Verdicts are cached per record, keyed on a hash of the breed name, the
+description and the audit rules, so a re-run only audits records that
+changed. Those are split into chunks and audited on a process pool.
+
+Usage:
+    python audit_all_descriptions.py [--data seeder/dog_breeds_bulldog_fixed.json] [--workers N] [--no-cache]
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from breed_mention_scanner import BREED_ALIASES, BreedMentionScanner, load_known_breed_names
+from instrumentation import instrumented, stage
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_bulldog_fixed.json'
+REPORT_FILE = 'description_audit_report.md'
+CACHE_FILE = 'seeder/build/description_audit_cache.json'
+
+# Bump when audit_breed's checks change, so cached verdicts are thrown away
+AUDIT_RULES_VERSION = 2
+
+DEFAULT_CHUNK_SIZE = 2000
+PARALLEL_MIN_RECORDS = 5000   # Fewer changed records than this are audited in-process
+NAME_CHANGE_LIMIT = 200       # More breed names added/removed than this re-audits everything
+PREFILTER_MAX_RECORDS = 200   # Up to this many changed records, skip names they can't mention
+
+LISTING_ID = re.compile(r'\s+#\d+$')
 
-def load_breed_data():
+# Text create_fallback_entry() uses when a breed had no AKC match
+PLACEHOLDER_PHRASES = [
+    'is a wonderful breed that can make a great companion',
+    'is a wonderful breed suitable for adoption',
+]
+
+# Parent breeds of the designer mixes; a mix's description may name its parents
+# as long as it names both (one parent alone is that parent's own description)
+DESIGNER_PARENTS = {
+    'Aussiedoodle': ('Australian Shepherd', 'Poodle'),
+    'Bernedoodle': ('Bernese Mountain Dog', 'Poodle'),
+    'Cavapoo': ('Cavalier King Charles Spaniel', 'Poodle'),
+    'Chiweenie': ('Chihuahua', 'Dachshund'),
+    'Cockapoo': ('Cocker Spaniel', 'Poodle'),
+    'Frenchton': ('French Bulldog', 'Boston Terrier'),
+    'Goldendoodle': ('Golden Retriever', 'Poodle'),
+    'Havapoo': ('Havanese', 'Poodle'),
+    'Huskydoodle': ('Siberian Husky', 'Poodle'),
+    'Labradoodle': ('Labrador Retriever', 'Poodle'),
+    'Maltipoo': ('Maltese', 'Poodle'),
+    'Morkie': ('Maltese', 'Yorkshire Terrier'),
+    'Newfypoo': ('Newfoundland', 'Poodle'),
+    'Peekapoo': ('Pekingese', 'Poodle'),
+    'Pitsky': ('American Pit Bull Terrier', 'Siberian Husky'),
+    'Pomsky': ('Pomeranian', 'Siberian Husky'),
+    'Puggle': ('Pug', 'Beagle'),
+    'Sheepadoodle': ('Old English Sheepdog', 'Poodle'),
+    'Shihpoo': ('Shih Tzu', 'Poodle'),
+    'Shorkie': ('Shih Tzu', 'Yorkshire Terrier'),
+    'Yorkipoo': ('Yorkshire Terrier', 'Poodle'),
+}
+
+def load_breed_data(input_file=BREED_DATA_FILE):
     """Load the current breed data."""
-    with open('seeder/dog_breeds_bulldog_fixed.json', 'r') as f:
-        return json.load(f)
+    return list(read_records(input_file))
+
+def corpus_names(breeds):
+    """Distinct breed names in the corpus, with listing numbers ("Beagle #0000042") removed."""
+    return {LISTING_ID.sub('', b['breed']) for b in breeds}
+
+def build_scanner(breeds, descriptions=None):
+    """Breed-name automaton over every known name, built once for the whole corpus.
+
+    With `descriptions`, corpus names that appear in none of them are left out,
+    which keeps the automaton small when only a few records need auditing.
+    """
+    known_names = load_known_breed_names()
+    names = corpus_names(breeds) - set(known_names)
+    if descriptions is not None:
+        text = '\n'.join(descriptions)
+        names = {name for name in names if name in text}
+    return BreedMentionScanner(known_names + sorted(names))
+
+@instrumented('audit_breed')
+def audit_breed(breed, scanner):
+    """Run every check on one breed's description; returns the issues found."""
+    breed_name = breed['breed']
+    description = breed.get('description', '')
+    
+    issues = []
+    
+    # Check 1: Description mentions wrong breed name
+    if description and breed_name not in description:
+        foreign = scanner.foreign_mentions(description, breed_name)
+        parents = set(DESIGNER_PARENTS.get(breed_name, ()))
+        if parents and parents <= {m.breed for m in foreign}:
+            foreign = [m for m in foreign if m.breed not in parents]
+        if foreign:
+            mentioned = ', '.join(f"{m.text} (at {m.start})" for m in foreign)
+            issues.append({
+                'breed': breed_name,
+                'type': 'Wrong breed',
+                'details': f"Mentions {mentioned}"
+            })
+    
+    # Check 2: Missing or placeholder description
+    if not description.strip():
+        issues.append({
+            'breed': breed_name,
+            'type': 'Missing',
+            'details': 'No description'
+        })
+    elif any(phrase in description for phrase in PLACEHOLDER_PHRASES):
+        issues.append({
+            'breed': breed_name,
+            'type': 'Placeholder',
+            'details': 'Generic fallback description'
+        })
+    
+    return issues
+
+# Verdict cache
+
+def rules_hash():
+    """Hash of everything besides the record that decides its verdict (corpus names are tracked separately)."""
+    rules = [AUDIT_RULES_VERSION, PLACEHOLDER_PHRASES, load_known_breed_names(), BREED_ALIASES, DESIGNER_PARENTS]
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+
+def verdict_key(rules, breed):
+    text = f"{rules}\0{breed['breed']}\0{breed.get('description', '')}"
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def load_cache(cache_file, rules):
+    """Cached verdicts for the current rules (empty if missing or built with other rules)."""
+    if not cache_file or not os.path.exists(cache_file):
+        return {'corpus_names': [], 'verdicts': {}}
+    with open(cache_file, 'r') as f:
+        cache = json.load(f)
+    if cache.get('rules') != rules:
+        return {'corpus_names': [], 'verdicts': {}}
+    return cache
+
+def save_cache(cache_file, rules, names, verdicts):
+    os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+    temp_file = f"{cache_file}.tmp"
+    with open(temp_file, 'w') as f:
+        json.dump({'rules': rules, 'corpus_names': sorted(names), 'verdicts': verdicts}, f, separators=(',', ':'))
+    os.replace(temp_file, cache_file)
+
+# Parallel audit of changed records
+
+_worker_scanner = None
+
+def _init_worker(scanner):
+    global _worker_scanner
+    _worker_scanner = scanner
+
+def _audit_chunk(chunk):
+    return [audit_breed(breed, _worker_scanner) for breed in chunk]
+
+def audit_records(breeds, scanner, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Issues per record, in order; large batches are chunked across a process pool."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(breeds) < PARALLEL_MIN_RECORDS:
+        return [audit_breed(breed, scanner) for breed in breeds]
 
-def audit_descriptions():
+    # Workers only need the fields audit_breed reads
+    slim = [{'breed': b['breed'], 'description': b.get('description', '')} for b in breeds]
+    chunks = [slim[i:i + chunk_size] for i in range(0, len(slim), chunk_size)]
+    results = []
+    # On fork the scanner is inherited, not pickled per worker
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scanner,)) as pool:
+        for chunk_issues in pool.map(_audit_chunk, chunks):
+            results.extend(chunk_issues)
+    return results
+
+def write_report(report_file, breeds, issues_found, correct_descriptions):
+    """Write the markdown report; returns False when the existing report is already identical."""
+    lines = ["# 🔍 Dog Breed Description Audit Report\n\n",
+             f"**Total Breeds Audited**: {len(breeds)}\n",
+             f"**Breeds with Issues**: {len(issues_found)}\n",
+             f"**Correct Descriptions**: {len(correct_descriptions)}\n\n"]
+    
+    if issues_found:
+        lines.append("## 🚫 Breeds with Description Issues:\n\n")
+        lines.append("| Breed Name | Issue Type | Details |\n")
+        lines.append("|------------|------------|---------|\n")
+        
+        for issue in issues_found:
+            lines.append(f"| {issue['breed']} | {issue['type']} | {issue['details']} |\n")
+    
+    lines.append(f"\n## ✅ Breeds with Correct Descriptions:\n\n")
+    for breed in correct_descriptions:
+        lines.append(f"- {breed}\n")
+    report = ''.join(lines)
+    
+    if os.path.exists(report_file):
+        with open(report_file, 'r') as f:
+            if f.read() == report:
+                return False
+    with open(report_file, 'w') as f:
+        f.write(report)
+    return True
+
+def audit_descriptions(input_file=BREED_DATA_FILE, report_file=REPORT_FILE, cache_file=CACHE_FILE,
+                       workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
     """Audit all breed descriptions for accuracy."""
-    breeds = load_breed_data()
+    breeds = load_breed_data(input_file)
     
     print(f"🔍 Auditing descriptions for {len(breeds)} dog breeds...")
     
     issues_found = []
     correct_descriptions = []
     
-    # Common issues to check for
-    for breed in breeds:
-        breed_name = breed['breed']
-        description = breed.get('description', '')
-        
-        issues = []
-        
-        # Check 1: Description mentions wrong breed name
-        if description and breed_name not in description:
-            # Check if it mentions a completely different breed
-            wrong_breed_patterns = [
-                r'Basset Fauve de Bretagne',
-                r'Rafeiro do Alentejo',
-                r'Manchester Terrier',
-                r'Staffordshire Bull Terrier',
-                r'American Pit Bull Terrier',
-                r'American Staffordshire Terrier',
-                r'Bull Terrier',
-                r'Standard Bull Terrier',
-                r'Miniature Bull Terrier',
-                r'English Bulldog',
-                r'American Bulldog',
-                r'Alapaha Blue Blood Bulldog',
-                r'French Bulldog',
-                r'Bulldog',
-                r'Yorkshire Terrier',
-                r'Chihuahua',
-                r'Maltese',
-                r'Pomeranian',
-                r'Shih Tzu',
-                r'Boston Terrier',
-                r'Jack Russell Terrier',
-                r'Scottish Terrier',
-                r'Cairn Terrier',
-                r'Norwich Terrier',
-                r'Norfolk Terrier',
-                r'Silky Terrier',
-                r'Skye Terrier',
-                r'Dandie Dinmont Terrier',
-                r'West Highland White Terrier',
-                r'Manchester Terrier',
-                r'Rat Terrier',
-                r'Glen of Imaal Terrier',
-                r'Tibetan Terrier',
-                r'Lakeland Terrier',
-                r'Sealyham Terrier',
-                r'Smooth Fox Terrier',
-                r'Toy Manchester Terrier',
-                r'Toy Fox Terrier',
-                r'Cocker Spaniel',
-                r'Cavalier King Charles Spaniel',
-                r'Shetland Sheepdog',
-                r'Pembroke Welsh Corgi',
-                r'Cardigan Welsh Corgi',
-                r'Bolognese',
-                r'Puggle',
-                r'Yorkipoo',
-                r'Maltipoo',
-                r'Cockapoo',
-                r'Cavapoo',
-                r'Chiweenie',
-                r'Labrador Retriever',
-                r'Golden Retriever',
-                r'German Shepherd',
-                r'Border Collie',
-                r'Australian Shepherd',
-                r'Boxer',
-                r'Poodle',
-                r'Rottweiler',
-                r'Doberman Pinscher',
-                r'Akita',
-                r'Siberian Husky',
-                r'Alaskan Malamute',
-                r'Samoyed',
-                r'Chow Chow',
-                r'Shar Pei',
-                r'Bernese Mountain Dog',
-                r'Collie',
-                r'Rhodesian Ridgeback',
-                r'Dalmatian',
-                r'Vizsla',
-                r'Weimaraner',
-                r'Newfoundland',
-                r'Saint Bernard',
-                r'Mastiff',
-                r'Neapolitan Mastiff',
-                r'Tibetan Mastiff',
-                r'Cane Corso',
-                r'Boerboel',
-                r'Belgian Malinois',
-                r'Belgian Sheepdog',
-                r'Belgian Tervuren',
-                r'Belgian Laekenois',
-                r'Dutch Shepherd',
-                r'Briard',
-                r'Beauceron',
-                r'Berger Picard',
-                r'Polish Lowland Sheepdog',
-                r'Old English Sheepdog',
-                r'Greater Swiss Mountain Dog',
-                r'Leonberger',
-                r'Spanish Mastiff',
-                r'Goldendoodle',
-                r'Labradoodle',
-                r'Aussiedoodle',
-                r'Schnoodle',
-                r'Pitsky',
-                r'Sheepadoodle',
-                r'Huskydoodle',
-                r'Alusky',
-                r'Morkie',
-                r'Bernedoodle',
-                r'Newfypoo',
-                r'Shorkie',
-                r'Havapoo',
-                r'Peekapoo',
-                r'Shihpoo',
-                r'Brittany',
-                r'English Springer Spaniel',
-                r'English Cocker Spaniel',
-                r'Field Spaniel',
-                r'Welsh Springer Spaniel',
-                r'Clumber Spaniel',
-                r'Sussex Spaniel',
-                r'Irish Water Spaniel',
-                r'English Setter',
-                r'Irish Setter',
-                r'Gordon Setter',
-                r'Pointer',
-                r'German Shorthaired Pointer',
-                r'German Wirehaired Pointer',
-                r'Basset Hound',
-                r'American Eskimo Dog',
-                r'Australian Cattle Dog',
-                r'Basenji',
-                r'Whippet',
-                r'Greyhound',
-                r'Saluki',
-                r'Afghan Hound',
-                r'Borzoi',
-                r'Irish Wolfhound',
-                r'Scottish Deerhound',
-                r'Great Dane',
-                r'Chow Chow',
-                r'Shar Pei',
-                r'Bernese Mountain Dog',
-                r'Collie',
-                r'Rhodesian Ridgeback',
-                r'Dalmatian',
-                r'Vizsla',
-                r'Weimaraner',
-                r'Newfoundland',
-                r'Saint Bernard',
-                r'Mastiff',
-                r'Neapolitan Mastiff',
-                r'Tibetan Mastiff',
-                r'Cane Corso',
-                r'Boerboel',
-                r'Belgian Malinois',
-                r'Belgian Sheepdog',
-                r'Belgian Tervuren',
-                r'Belgian Laekenois',
-                r'Dutch Shepherd',
-                r'Briard',
-                r'Beauceron',
-                r'Berger Picard',
-                r'Polish Lowland Sheepdog',
-                r'Old English Sheepdog',
-                r'Greater Swiss Mountain Dog',
-                r'Leonberger',
-                r'Spanish Mastiff',
-                r'Goldendoodle',
-                r'Labradoodle',
-                r'Aussiedoodle',
-                r'Schnoodle',
-                r'Pitsky',
-                r'Sheepadoodle',
-                r'Huskydoodle',
-                r'Alusky',
-                r'Morkie',
-                r'Bernedoodle',
-                r'Newfypoo',
-                r'Shorkie',
-                r'Havapoo',
-                r'Peekapoo',
-                r'Shihpoo',
-                r'Brittany',
-                r'English Springer Spaniel',
-                r'English Cocker Spaniel',
-                r'Field Spaniel',
-                r'Welsh Springer Spaniel',
-                r'Clumber Spaniel',
-                r'Sussex Spaniel',
-                r'Irish Water Spaniel',
-                r'English Setter',
-                r'Irish Setter',
-                r'Gordon Setter',
-                r'Pointer',
-                r'German Shorthaired Pointer',
-                r'German Wirehaired Pointer',
-                r'Basset Hound',
-                r'American Eskimo Dog',
-                r'Australian Cattle Dog',
-                r'Basenji',
-                r'Whippet',
-                r'Greyhound',
-                r'Saluki',
-                r'Afghan Hound',
-                r'Borzoi',
-                r'Irish Wolfhound',
-                r'Scottish Deerhound',
-                r'Great Dane',
-                r'Chow Chow',
-                r'Shar Pei',
-                r'Bernese Mountain Dog',
-                r'Collie',
-                r'Rhodesian Ridgeback',
-                r'Dalmatian',
-                r'Vizsla',
-                r'Weimaraner',
-                r'Newfoundland',
-                r'Saint Bernard',
-                r'Mastiff',
-                r'Neapolitan Mastiff',
-                r'Tibetan Mastiff',
-                r'Cane Corso',
-                r'Boerboel',
-                r'Belgian Malinois',
-                r'Breeds with issues found: {len(issues_found)}")
+    rules = rules_hash()
+    cache = load_cache(cache_file, rules)
+    cached = cache['verdicts']
+    names = corpus_names(breeds)
+    
+    # A new or removed breed name changes what counts as a foreign mention, so
+    # cached verdicts for descriptions containing that name are stale
+    changed_names = names.symmetric_difference(cache['corpus_names'])
+    if len(changed_names) > NAME_CHANGE_LIMIT:
+        cached = {}
+    
+    started = time.perf_counter()
+    keys = [verdict_key(rules, breed) for breed in breeds]
+    verdicts = {}
+    misses = []
+    for position, (key, breed) in enumerate(zip(keys, breeds)):
+        issues = cached.get(key)
+        if issues is not None and changed_names:
+            description = breed.get('description', '')
+            if any(name in description for name in changed_names):
+                issues = None
+        if issues is None:
+            misses.append(position)
+        else:
+            verdicts[key] = issues
+    
+    print(f"♻️  {len(breeds) - len(misses)} cached verdicts, {len(misses)} records to audit")
+    
+    with stage('audit_descriptions'):
+        if misses:
+            changed = [breeds[position] for position in misses]
+            descriptions = None
+            if len(changed) <= PREFILTER_MAX_RECORDS:
+                descriptions = [breed.get('description', '') for breed in changed]
+            scanner = build_scanner(breeds, descriptions)
+            for position, issues in zip(misses, audit_records(changed, scanner, workers, chunk_size)):
+                verdicts[keys[position]] = issues
+    
+    for key, breed in zip(keys, breeds):
+        issues = verdicts[key]
+        if issues:
+            issues_found.extend(issues)
+        else:
+            correct_descriptions.append(breed['breed'])
+    
+    if cache_file and (misses or changed_names or len(verdicts) != len(cache['verdicts'])):
+        # Only verdicts for the current records are kept
+        save_cache(cache_file, rules, names, verdicts)
+    
+    print(f"⏱️  Audit finished in {time.perf_counter() - started:.2f}s")
+    
+    print(f"\n📊 Audit Results:")
+    print(f"🚫 Breeds with issues found: {len(issues_found)}")
     print(f"✅ Correct descriptions: {len(correct_descriptions)}")
     
     if issues_found:
@@ -269,34 +291,29 @@ def audit_descriptions():
             print(f"{breed} {issue_type} {details}")
     
     # Save detailed audit report
-    report_file = 'description_audit_report.md'
-    with open(report_file, 'w') as f:
-        f.write("# 🔍 Dog Breed Description Audit Report\n\n")
-        f.write(f"**Total Breeds Audited**: {len(breeds)}\n")
-        f.write(f"**Breeds with Issues**: {len(issues_found)}\n")
-        f.write(f"**Correct Descriptions**: {len(correct_descriptions)}\n\n")
-        
-        if issues_found:
-            f.write("## 🚫 Breeds with Description Issues:\n\n")
-            f.write("| Breed Name | Issue Type | Details |\n")
-            f.write("|------------|------------|---------|\n")
-            
-            for issue in issues_found:
-                f.write(f"| {issue['breed']} | {issue['type']} | {issue['details']} |\n")
-        
-        f.write(f"\n## ✅ Breeds with Correct Descriptions:\n\n")
-        for breed in correct_descriptions:
-            f.write(f"- {breed}\n")
-    
-    print(f"\n💾 Detailed audit report saved to: {report_file}")
+    if write_report(report_file, breeds, issues_found, correct_descriptions):
+        print(f"\n💾 Detailed audit report saved to: {report_file}")
+    else:
+        print(f"\n📄 Audit report unchanged: {report_file}")
     
     return issues_found, correct_descriptions
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Audit every breed description.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--report', default=REPORT_FILE, help=f"report file (default: {REPORT_FILE})")
+    parser.add_argument('--cache', default=CACHE_FILE, help=f"verdict cache (default: {CACHE_FILE})")
+    parser.add_argument('--no-cache', action='store_true', help="audit every record and leave the cache alone")
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"records per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+    
     print("🔍 Auditing all dog breed descriptions...")
     
     try:
-        issues_found, correct_descriptions = audit_descriptions()
+        issues_found, correct_descriptions = audit_descriptions(
+            args.data, args.report, None if args.no_cache else args.cache, args.workers, args.chunk_size)
         
         if issues_found:
             print(f"\n⚠️  Action needed:")
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for the breed data scripts.
+Run from the repo root, e.g. `python -m benchmarks.bench_breed_matcher`.
+"""
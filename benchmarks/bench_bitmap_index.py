@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark questionnaire filtering with the bitmap index against a plain scan.
+Runs random searchBreeds-style filter sets over the real breed data and over a
+synthetic listing table (rows drawn from the real breeds), checks the bitmap
+results match reference_rows, and prints per-query latency.
+
+Usage:
+    python -m benchmarks.bench_bitmap_index [--rows 1000000] [--queries 50]
+"""
+
+import argparse
+import random
+import time
+
+from breed_bitmap_index import BREED_DATA_FILE, BitmapIndex, BOOLEAN_ATTRIBUTES, reference_rows
+from record_stream import read_records
+
+CHOICES = {
+    'size': ['Toy', 'Small', 'Medium', 'Large'],
+    'energy_level': ['Low', 'Moderate', 'High'],
+    'trainability': ['Low', 'Medium', 'High'],
+    'grooming_needs': ['Low', 'Medium', 'High'],
+}
+COMPANION_CHOICES = ['Companion', 'Guardian', 'Both']
+
+
+def random_filters(rng):
+    """A questionnaire submission: some attributes left open, some narrowed."""
+    filters = {}
+    for attribute, values in CHOICES.items():
+        if rng.random() < 0.6:
+            filters[attribute] = rng.sample(values, rng.randint(1, len(values) - 1))
+    if rng.random() < 0.3:
+        filters['companion_or_guardian'] = rng.choice(COMPANION_CHOICES)
+    for attribute in BOOLEAN_ATTRIBUTES:
+        if rng.random() < 0.4:
+            filters[attribute] = rng.random() < 0.7
+    filters['prioritize_adoptable'] = rng.random() < 0.5
+    return filters
+
+
+def time_queries(evaluate, queries):
+    started = time.perf_counter()
+    results = [evaluate(filters) for filters in queries]
+    return results, (time.perf_counter() - started) / len(queries)
+
+
+def run(label, records, queries):
+    started = time.perf_counter()
+    index = BitmapIndex.build(records)
+    build_seconds = time.perf_counter() - started
+
+    scan_results, scan_per = time_queries(lambda filters: reference_rows(records, filters), queries)
+    bitmap_results, bitmap_per = time_queries(index.rows, queries)
+    _, count_per = time_queries(index.count, queries)
+
+    mismatches = sum(1 for a, b in zip(scan_results, bitmap_results) if a != b)
+    if mismatches:
+        raise AssertionError(f"{label}: bitmap index disagrees with the scan on {mismatches} queries")
+
+    print(f"{label.ljust(15)} {build_seconds:10.2f} {scan_per * 1000:10.3f} {bitmap_per * 1000:11.3f} "
+          f"{count_per * 1000:10.3f} {scan_per / bitmap_per:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the questionnaire bitmap index.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="synthetic listing rows")
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    breeds = sorted(read_records(BREED_DATA_FILE), key=lambda record: record['breed'])
+    queries = [random_filters(rng) for _ in range(args.queries)]
+
+    print(f"\n{'Table'.ljust(15)} {'Build (s)'.rjust(10)} {'Scan (ms)'.rjust(10)} "
+          f"{'Bitmap (ms)'.rjust(11)} {'Count (ms)'.rjust(10)} {'Speedup'.rjust(8)}")
+    print("-" * 69)
+
+    run(f"{len(breeds)} breeds", breeds, queries)
+    # Listings share the breed dicts, so the table costs one reference per row
+    listings = [rng.choice(breeds) for _ in range(args.rows)]
+    run(f"{args.rows:,} rows", listings, queries)
+
+    print(f"\n✅ Bitmap results matched the scan for all {len(queries)} queries")
+
+
+if __name__ == "__main__":
+    main()
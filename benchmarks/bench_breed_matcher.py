@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark the linear find_best_match scan against BreedNameIndex.
+Builds synthetic AKC-style registries (real AKC names padded with generated
+names), checks both matchers agree on every target, and prints per-lookup
+latency at each registry size.
+
+Usage:
+    python -m benchmarks.bench_breed_matcher [--sizes 10000 100000] [--targets 200]
+"""
+
+import argparse
+import random
+import time
+
+from seeder.fix_breed_data import BreedNameIndex, find_best_match, load_akc_data
+
+AKC_FILE = 'seeder/akc-data-latest.csv'
+BREED_NAMES_FILE = 'breed_names.txt'
+
+PREFIXES = ['American', 'English', 'Northern', 'Alpine', 'Royal', 'Miniature', 'Standard',
+            'Coastal', 'Highland', 'Silver', 'Black', 'Red', 'Spotted', 'Wirehaired', 'Smooth']
+BASES = ['Terrier', 'Hound', 'Spaniel', 'Retriever', 'Shepherd', 'Mastiff', 'Setter',
+         'Pointer', 'Collie', 'Sheepdog', 'Spitz', 'Bulldog', 'Pinscher', 'Schnauzer']
+SHELTER_LABELS = ['Lab Mix', 'Pit Bull', 'Pitbull', 'Husky', 'Shepherd Mix', 'Chihuahua Mix',
+                  'Yorkie', 'Boxer Mix', 'Terrier', 'Hound Mix', 'Doodle', 'Heeler']
+
+
+def build_registry(akc_breeds, size, rng):
+    """Real AKC rows first (so they keep priority), then generated names."""
+    registry = dict(akc_breeds)
+    template = next(iter(akc_breeds.values()))
+    while len(registry) < size:
+        name = f"{rng.choice(PREFIXES)} {rng.choice(BASES)} {rng.randrange(10 ** 6)}"
+        registry.setdefault(name, template)
+    return registry
+
+
+def load_targets(count, rng):
+    with open(BREED_NAMES_FILE, 'r', encoding='utf-8') as f:
+        names = [line.strip() for line in f if line.strip()]
+    targets = names + SHELTER_LABELS
+    rng.shuffle(targets)
+    return targets[:count]
+
+
+def time_lookups(match, targets):
+    started = time.perf_counter()
+    results = [match(target) for target in targets]
+    return results, (time.perf_counter() - started) / len(targets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark breed-name matching.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--targets', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    akc_breeds = load_akc_data(AKC_FILE)
+    targets = load_targets(args.targets, rng)
+
+    print(f"\n{'Registry'.ljust(10)} {'Build (s)'.rjust(10)} {'Linear (ms)'.rjust(12)} "
+          f"{'Indexed (ms)'.rjust(13)} {'Speedup'.rjust(8)}")
+    print("-" * 57)
+
+    for size in args.sizes:
+        registry = build_registry(akc_breeds, size, rng)
+
+        started = time.perf_counter()
+        index = BreedNameIndex(registry)
+        build_seconds = time.perf_counter() - started
+
+        linear_results, linear_per = time_lookups(lambda t: find_best_match(t, registry), targets)
+        indexed_results, indexed_per = time_lookups(index.find_best_match, targets)
+
+        mismatches = [t for t, a, b in zip(targets, linear_results, indexed_results) if a is not b]
+        if mismatches:
+            raise AssertionError(f"Indexed matcher disagrees on {len(mismatches)} targets: {mismatches[:5]}")
+
+        print(f"{str(size).ljust(10)} {build_seconds:10.2f} {linear_per * 1000:12.3f} "
+              f"{indexed_per * 1000:13.3f} {linear_per / indexed_per:7.0f}x")
+
+    print(f"\n✅ Indexed results matched the linear scan for all {len(targets)} targets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the breed data pipeline stages.
+Generates scaled datasets (180 / 10k / 1M by default) either by cycling the
+real breed records or from synthetic_data's seeded generator, times each stage's core function and records throughput and peak
+traced memory. Results are written as JSON; --compare flags stages that got
+slower or hungrier than a stored baseline.
+
+Each stage runs for at most --budget seconds per dataset size (split over
+--repeat passes, fastest kept), so slow stages report throughput over the
+records they got through instead of stalling the suite. Peak memory comes
+from a separate tracemalloc'd pass over the same number of records, so
+tracing overhead doesn't skew the timings.
+
+Usage:
+    python -m benchmarks.bench_stages [--sizes 180 10000 1000000] [--budget 10] [--dataset synthetic]
+    python -m benchmarks.bench_stages --save-baseline       # store results as the baseline
+    python -m benchmarks.bench_stages --compare             # exit 1 on regressions
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple
+
+from audit_all_descriptions import audit_breed, build_scanner
+from fix_sizes_by_weight import extract_weight_from_description
+from image_manifest import ImageResolver, build_manifest
+from record_stream import read_records
+from seeder.add_shelter_scores import get_shelter_score
+from seeder.fix_breed_data import BreedNameIndex, load_akc_data
+from synthetic_data import SyntheticGenerator
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+AKC_FILE = 'seeder/akc-data-latest.csv'
+RESULTS_FILE = 'benchmarks/results/latest.json'
+BASELINE_FILE = 'benchmarks/results/baseline.json'
+
+DEFAULT_SIZES = [180, 10_000, 1_000_000]
+DEFAULT_BUDGET = 10.0           # Seconds per stage per dataset size
+DEFAULT_REPEAT = 3              # Timed passes per stage; the fastest one is reported
+REGRESSION_THRESHOLD = 0.20     # Flag >20% lower throughput or >20% higher peak memory
+MEMORY_NOISE_BYTES = 64 * 1024  # Peak-memory changes smaller than this are ignored
+SYNTHETIC_POOL = 50_000         # Distinct synthetic records generated per size, then cycled
+
+
+class BenchStage(NamedTuple):
+    """A stage's core function, applied to records one at a time."""
+    name: str
+    setup: Callable[[List[Dict]], object]        # Built once per run, outside the timing
+    process: Callable[[object, Dict], object]    # (state, record) -> result
+
+
+def scaled_records(breeds: List[Dict], size: int) -> Iterator[Dict]:
+    """`size` records cycling through `breeds` (shared values, no copies of the text)."""
+    return itertools.islice(itertools.cycle(breeds), size)
+
+
+def dataset(breeds: List[Dict], size: int, kind: str, seed: int = 42) -> List[Dict]:
+    """Records to cycle through for one size: the real breeds, or a synthetic pool."""
+    if kind == 'real':
+        return breeds
+    # Generated up front so generation isn't timed; the pool is capped to bound memory
+    return list(SyntheticGenerator(breeds, seed).generate(min(size, SYNTHETIC_POOL)))
+
+
+STAGES = [
+    BenchStage('find_best_match',
+               lambda breeds: BreedNameIndex(load_akc_data(AKC_FILE)),
+               lambda index, breed: index.find_best_match(breed['breed'])),
+    BenchStage('get_shelter_score',
+               lambda breeds: None,
+               lambda _, breed: get_shelter_score(breed['breed'])),
+    BenchStage('extract_weight_from_description',
+               lambda breeds: None,
+               lambda _, breed: extract_weight_from_description(breed.get('description', ''))),
+    BenchStage('audit_descriptions',
+               build_scanner,
+               lambda scanner, breed: audit_breed(breed, scanner)),
+    BenchStage('identify_missing_images',
+               lambda breeds: ImageResolver(build_manifest()),   # Cached manifest is gitignored; refresh it
+               lambda resolver, breed: resolver.resolve(breed)),
+]
+
+
+def timed_pass(process, state, breeds: List[Dict], size: int, budget: float):
+    """(records processed, seconds) for one pass, stopping at the time budget."""
+    processed = 0
+    started = time.perf_counter()
+    deadline = started + budget
+    for record in scaled_records(breeds, size):
+        process(state, record)
+        processed += 1
+        # Checking the clock every record costs more than the cheap stages themselves
+        if processed % 64 == 0 and time.perf_counter() > deadline:
+            break
+    return processed, time.perf_counter() - started
+
+
+def run_stage(stage: BenchStage, breeds: List[Dict], size: int, budget: float,
+              repeat: int = DEFAULT_REPEAT) -> Dict:
+    state = stage.setup(breeds)
+    process = stage.process
+
+    # Best of `repeat` passes, sharing the budget, to keep scheduler noise out of the baseline
+    passes = [timed_pass(process, state, breeds, size, budget / repeat) for _ in range(repeat)]
+    processed, elapsed = max(passes, key=lambda p: p[0] / p[1] if p[1] else 0)
+
+    tracemalloc.start()
+    try:
+        for record in scaled_records(breeds, processed):
+            process(state, record)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'stage': stage.name,
+        'size': size,
+        'records_processed': processed,
+        'truncated': processed < size,
+        'seconds': round(elapsed, 6),
+        'records_per_second': round(processed / elapsed, 1) if elapsed else None,
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_suite(sizes: Iterable[int], budget: float, stages: Iterable[str] = None,
+              repeat: int = DEFAULT_REPEAT, kind: str = 'real') -> Dict:
+    templates = list(read_records(BREED_DATA_FILE))
+    selected = [stage for stage in STAGES if not stages or stage.name in stages]
+
+    print(f"\n{'Stage'.ljust(34)} {'Size'.rjust(9)} {'Records'.rjust(9)} "
+          f"{'Rec/s'.rjust(12)} {'Peak MB'.rjust(9)}")
+    print("-" * 77)
+
+    results = []
+    for size in sizes:
+        breeds = dataset(templates, size, kind)
+        for stage in selected:
+            result = run_stage(stage, breeds, size, budget, repeat)
+            results.append(result)
+            marker = '*' if result['truncated'] else ' '
+            print(f"{stage.name.ljust(34)} {size:9,} {result['records_processed']:9,}{marker}"
+                  f"{result['records_per_second']:12,.0f} {result['peak_memory_bytes'] / 1e6:9.2f}")
+
+    print("\n* stopped at the time budget; throughput is over the records processed")
+    return {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'dataset': kind,
+        'budget_seconds': budget,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def save_results(report: Dict, output_file: str):
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results saved to: {output_file}")
+
+
+def compare(report: Dict, baseline: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Regressions against the baseline, matched by (stage, size)."""
+    previous = {(r['stage'], r['size']): r for r in baseline['results']}
+    regressions = []
+
+    for result in report['results']:
+        before = previous.get((result['stage'], result['size']))
+        if not before:
+            continue
+        label = f"{result['stage']} @ {result['size']:,}"
+
+        if before['records_per_second'] and result['records_per_second']:
+            ratio = result['records_per_second'] / before['records_per_second']
+            if ratio < 1 - threshold:
+                regressions.append(f"{label}: throughput {ratio:.0%} of baseline "
+                                   f"({result['records_per_second']:,.0f} vs {before['records_per_second']:,.0f} rec/s)")
+
+        # Peak memory only compares when both runs covered the same records
+        if before['records_processed'] == result['records_processed'] and before['peak_memory_bytes']:
+            growth = result['peak_memory_bytes'] / before['peak_memory_bytes']
+            increase = result['peak_memory_bytes'] - before['peak_memory_bytes']
+            if growth > 1 + threshold and increase > MEMORY_NOISE_BYTES:
+                regressions.append(f"{label}: peak memory {growth:.0%} of baseline "
+                                   f"({result['peak_memory_bytes']:,} vs {before['peak_memory_bytes']:,} bytes)")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the breed data pipeline stages.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help="seconds per stage per size")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="timed passes per stage (best is kept)")
+    parser.add_argument('--dataset', choices=['real', 'synthetic'], default='real',
+                        help="cycle the real breeds or a seeded synthetic pool")
+    parser.add_argument('--stages', nargs='+', choices=[stage.name for stage in STAGES])
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="also store these results as the baseline")
+    parser.add_argument('--compare', action='store_true', help="flag regressions against the baseline")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.budget, args.stages, args.repeat, args.dataset)
+    save_results(report, args.output)
+    if args.save_baseline:
+        save_results(report, args.baseline)
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"⚠️  No baseline at {args.baseline}; run with --save-baseline first")
+            raise SystemExit(1)
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('dataset', 'real') != report['dataset']:
+            print(f"⚠️  Baseline was run on the {baseline.get('dataset', 'real')} dataset, not {report['dataset']}")
+            raise SystemExit(1)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            raise SystemExit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
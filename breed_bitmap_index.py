@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Precomputed bitmap index for the questionnaire filters.
+Stores one bitset per (attribute, value) pair - size, energy level,
+trainability, grooming needs, companion/guardian and each yes/no flag - so a
+search becomes a few bitwise ANDs/ORs instead of a scan with IN/equality
+predicates. Rows are sorted by breed name, so walking the set bits returns
+results in the same order as DatabaseManager.searchBreeds.
+
+Usage:
+    python breed_bitmap_index.py [--data seeder/dog_breeds_with_shelter_scores.json] [--output ...]
+"""
+
+import argparse
+import base64
+import json
+import os
+from typing import Dict, Iterable, Iterator, List
+
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+INDEX_FILE = 'seeder/build/breed_bitmap_index.json'
+INDEX_VERSION = 1
+
+CATEGORICAL_ATTRIBUTES = ['size', 'energy_level', 'trainability', 'grooming_needs', 'companion_or_guardian']
+BOOLEAN_ATTRIBUTES = ['good_with_kids', 'good_with_pets', 'senior_friendly', 'special_needs_possible']
+
+# Bit positions set in each byte value, for turning a bitset back into row ids
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _bool_key(value) -> str:
+    return 'true' if value else 'false'
+
+
+def iter_bits(mask: int, row_count: int) -> Iterator[int]:
+    """Row ids set in `mask`, ascending."""
+    data = mask.to_bytes((row_count + 7) // 8, 'little')
+    for position, byte in enumerate(data):
+        if byte:
+            base = position * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+class BitmapIndex:
+    """Bitsets (Python ints, bit i = row i) for every attribute value."""
+
+    def __init__(self, names: List[str], bitmaps: Dict[str, Dict[str, int]], score_order: List[int]):
+        self.names = names
+        self.bitmaps = bitmaps
+        self.score_order = score_order   # Row ids by shelter score (desc), then row order
+        self.row_count = len(names)
+        self.all_rows = (1 << self.row_count) - 1
+
+    @classmethod
+    def build(cls, records: Iterable[Dict]) -> 'BitmapIndex':
+        """Index `records` in the order given (sort them first to control result order)."""
+        names = []
+        scores = []
+        bitmaps = {attribute: {} for attribute in CATEGORICAL_ATTRIBUTES + BOOLEAN_ATTRIBUTES}
+
+        # Collect row ids per value first; setting bits one at a time on big ints is quadratic
+        rows = {attribute: {} for attribute in bitmaps}
+        for row_id, record in enumerate(records):
+            names.append(record['breed'])
+            scores.append(record.get('shelter_availability_score', 5))
+            for attribute in CATEGORICAL_ATTRIBUTES:
+                rows[attribute].setdefault(record.get(attribute), []).append(row_id)
+            for attribute in BOOLEAN_ATTRIBUTES:
+                rows[attribute].setdefault(_bool_key(record.get(attribute)), []).append(row_id)
+
+        for attribute, values in rows.items():
+            for value, row_ids in values.items():
+                bitmaps[attribute][value] = cls._bits_from_rows(row_ids, len(names))
+
+        score_order = sorted(range(len(names)), key=lambda row_id: -scores[row_id])
+        return cls(names, bitmaps, score_order)
+
+    @classmethod
+    def from_breed_file(cls, input_file: str = BREED_DATA_FILE) -> 'BitmapIndex':
+        return cls.build(sorted(read_records(input_file), key=lambda record: record['breed']))
+
+    @staticmethod
+    def _bits_from_rows(row_ids: List[int], row_count: int) -> int:
+        data = bytearray((row_count + 7) // 8)
+        for row_id in row_ids:
+            data[row_id >> 3] |= 1 << (row_id & 7)
+        return int.from_bytes(data, 'little')
+
+    # Evaluation
+
+    def _any_of(self, attribute: str, values: Iterable[str]) -> int:
+        mask = 0
+        for value in values:
+            mask |= self.bitmaps[attribute].get(value, 0)
+        return mask
+
+    def mask(self, filters: Dict) -> int:
+        """Bitset of rows matching the searchBreeds-style `filters`."""
+        mask = self.all_rows
+        for attribute in CATEGORICAL_ATTRIBUTES:
+            value = filters.get(attribute)
+            if not value:
+                continue  # Empty list / missing means "any", as in searchBreeds
+            mask &= self._any_of(attribute, [value] if isinstance(value, str) else value)
+        for attribute in BOOLEAN_ATTRIBUTES:
+            value = filters.get(attribute)
+            if value is not None:
+                mask &= self.bitmaps[attribute].get(_bool_key(value), 0)
+        return mask
+
+    def count(self, filters: Dict) -> int:
+        return self.mask(filters).bit_count()
+
+    def rows(self, filters: Dict) -> List[int]:
+        """Matching row ids, ordered like searchBreeds (by score first if prioritize_adoptable)."""
+        mask = self.mask(filters)
+        if filters.get('prioritize_adoptable'):
+            data = mask.to_bytes((self.row_count + 7) // 8, 'little')
+            return [row_id for row_id in self.score_order if data[row_id >> 3] >> (row_id & 7) & 1]
+        return list(iter_bits(mask, self.row_count))
+
+    def search(self, filters: Dict) -> List[str]:
+        return [self.names[row_id] for row_id in self.rows(filters)]
+
+    # Serialization
+
+    def to_dict(self) -> Dict:
+        width = (self.row_count + 7) // 8
+        encode = lambda bits: base64.b64encode(bits.to_bytes(width, 'little')).decode('ascii')
+        return {
+            'version': INDEX_VERSION,
+            'row_count': self.row_count,
+            'breeds': self.names,
+            'score_order': self.score_order,
+            'bitmaps': {
+                attribute: {str(value): encode(bits) for value, bits in sorted(values.items(), key=lambda kv: str(kv[0]))}
+                for attribute, values in self.bitmaps.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BitmapIndex':
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported bitmap index version: {data.get('version')}")
+        decode = lambda text: int.from_bytes(base64.b64decode(text), 'little')
+        bitmaps = {
+            attribute: {value: decode(bits) for value, bits in values.items()}
+            for attribute, values in data['bitmaps'].items()
+        }
+        return cls(data['breeds'], bitmaps, data['score_order'])
+
+    def save(self, output_file: str = INDEX_FILE):
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        with open(output_file, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, input_file: str = INDEX_FILE) -> 'BitmapIndex':
+        with open(input_file, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+def reference_rows(records: List[Dict], filters: Dict) -> List[int]:
+    """
+    Plain scan that mirrors the SQL in DatabaseManager.searchBreeds.
+    Used to check the bitmap results; `records` must be in the index's row order.
+    """
+    def matches(record: Dict) -> bool:
+        for attribute in CATEGORICAL_ATTRIBUTES:
+            value = filters.get(attribute)
+            if value and record.get(attribute) not in ([value] if isinstance(value, str) else value):
+                return False
+        for attribute in BOOLEAN_ATTRIBUTES:
+            value = filters.get(attribute)
+            if value is not None and bool(record.get(attribute)) != bool(value):
+                return False
+        return True
+
+    row_ids = [row_id for row_id, record in enumerate(records) if matches(record)]
+    if filters.get('prioritize_adoptable'):
+        row_ids.sort(key=lambda row_id: -records[row_id].get('shelter_availability_score', 5))
+    return row_ids
+
+
+def build_index(input_file: str = BREED_DATA_FILE, output_file: str = INDEX_FILE) -> BitmapIndex:
+    index = BitmapIndex.from_breed_file(input_file)
+    index.save(output_file)
+    bitmap_count = sum(len(values) for values in index.bitmaps.values())
+    print(f"🧮 Indexed {index.row_count} breeds into {bitmap_count} bitmaps")
+    print(f"💾 Saved bitmap index to: {output_file}")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the questionnaire bitmap index.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--output', default=INDEX_FILE, help=f"index file (default: {INDEX_FILE})")
+    args = parser.parse_args()
+
+    try:
+        build_index(args.data, args.output)
+    except Exception as e:
+        print(f"❌ Error building bitmap index: {e}")
+        import traceback
+        traceback.print_exc()
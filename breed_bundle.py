@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Compact binary bundle of the breed data for the app.
+database.ts used to import the pretty-printed JSON, which the app had to
+parse on every launch even when nothing was reseeded. The bundle is a
+binary asset read only when a reseed is due:
+
+- categorical columns become one-byte codes into per-column level lists
+- the yes/no columns are bit flags in one byte
+- breed names, image file names and level names share a deduplicated
+  string table, and identical descriptions are stored once
+- descriptions are optionally word-coded: split into words, punctuation and
+  spaces, each token written as a varint index into a token table ordered by
+  frequency, so common words take one byte
+
+Layout (little-endian; varints are unsigned LEB128):
+
+    "BRDB", u8 format, u8 flags, 32-byte dataset hash (data_versioning)
+    varint record count
+    string table:      varint count, varint byte length per string, UTF-8 bytes
+    levels:            per CATEGORICAL_FIELDS column: varint count, varint string ids
+    token table:       (flags & WORD_CODED) string table of description tokens
+    descriptions:      varint count, then per description either a varint
+                       string id or a varint token count and varint token ids
+    records:           varint breed, u8 code per categorical column (255 = null),
+                       u8 flags, u8 shelter score (0 = null), varint image, varint description
+
+utils/breedBundle.ts is the app's decoder; decode() here is the reference.
+
+Usage:
+    python breed_bundle.py [--data seeder/dog_breeds_with_shelter_scores.json] [--output assets/data/breeds.bin]
+    python breed_bundle.py --compare        # size and parse time against the JSON
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import struct
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from breed_ranking import ORDINAL_ATTRIBUTES, ROLE_LEVELS
+from data_versioning import RECORD_FIELDS, dataset_hash, hash_records
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+BUNDLE_FILE = 'assets/data/breeds.bin'
+MAGIC = b'BRDB'
+BUNDLE_FORMAT = 1
+
+WORD_CODED = 1   # Header flag: descriptions are token-coded
+
+# Code order within each column; values not listed are appended in first-seen order
+CATEGORICAL_FIELDS = {
+    'size': ORDINAL_ATTRIBUTES['size'],
+    'energy_level': ORDINAL_ATTRIBUTES['energy_level'],
+    'trainability': ORDINAL_ATTRIBUTES['trainability'],
+    'grooming_needs': ORDINAL_ATTRIBUTES['grooming_needs'],
+    'companion_or_guardian': ROLE_LEVELS,
+}
+FLAG_FIELDS = ['good_with_kids', 'good_with_pets', 'senior_friendly', 'special_needs_possible']
+NULL_CODE = 255
+
+# A word with its leading space, a run of other punctuation, or a lone space
+TOKEN = re.compile(r' ?\w+|[^\w ]+| ')
+
+
+def write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def write_strings(out: bytearray, strings: List[str]):
+    encoded = [s.encode('utf-8') for s in strings]
+    write_varint(out, len(encoded))
+    for data in encoded:
+        write_varint(out, len(data))
+    for data in encoded:
+        out += data
+
+
+def read_strings(data: bytes, position: int) -> Tuple[List[str], int]:
+    count, position = read_varint(data, position)
+    lengths = []
+    for _ in range(count):
+        length, position = read_varint(data, position)
+        lengths.append(length)
+    strings = []
+    for length in lengths:
+        strings.append(data[position:position + length].decode('utf-8'))
+        position += length
+    return strings, position
+
+
+class StringTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def add(self, text: str) -> int:
+        return self.ids.setdefault(text, len(self.ids))
+
+    @property
+    def strings(self) -> List[str]:
+        return list(self.ids)
+
+
+def encode(records: Iterable[Dict], word_coded: bool = True) -> bytes:
+    records = list(records)
+    strings = StringTable()
+
+    levels = {field: list(order) for field, order in CATEGORICAL_FIELDS.items()}
+    for record in records:
+        for field, values in levels.items():
+            value = record.get(field)
+            if value is not None and value not in values:
+                values.append(value)
+    if any(len(values) >= NULL_CODE for values in levels.values()):
+        raise ValueError("Too many distinct values for a one-byte categorical code")
+
+    descriptions = StringTable()
+    for record in records:
+        descriptions.add(record.get('description') or '')
+    tokenized = [TOKEN.findall(text) for text in descriptions.strings]
+    token_ids = {}
+    if word_coded:
+        # Most frequent tokens get the smallest (one-byte) varints
+        counts = Counter(token for tokens in tokenized for token in tokens)
+        token_ids = {token: i for i, (token, _) in enumerate(counts.most_common())}
+
+    body = bytearray()
+    write_varint(body, len(descriptions.ids))
+    for text, tokens in zip(descriptions.strings, tokenized):
+        if word_coded:
+            write_varint(body, len(tokens))
+            for token in tokens:
+                write_varint(body, token_ids[token])
+        else:
+            write_varint(body, strings.add(text))
+
+    for record in records:
+        write_varint(body, strings.add(record['breed']))
+        for field, values in levels.items():
+            value = record.get(field)
+            body.append(NULL_CODE if value is None else values.index(value))
+        body.append(sum(1 << bit for bit, field in enumerate(FLAG_FIELDS) if record.get(field)))
+        body.append(record.get('shelter_availability_score') or 0)
+        write_varint(body, strings.add(record.get('image_filename') or ''))
+        write_varint(body, descriptions.ids[record.get('description') or ''])
+
+    level_ids = {field: [strings.add(value) for value in values] for field, values in levels.items()}
+
+    out = bytearray(MAGIC)
+    out += struct.pack('<BB', BUNDLE_FORMAT, WORD_CODED if word_coded else 0)
+    out += bytes.fromhex(dataset_hash(hash_records(records)))
+    write_varint(out, len(records))
+    write_strings(out, strings.strings)
+    for field in CATEGORICAL_FIELDS:
+        write_varint(out, len(level_ids[field]))
+        for string_id in level_ids[field]:
+            write_varint(out, string_id)
+    if word_coded:
+        write_strings(out, list(token_ids))
+    return bytes(out + body)
+
+
+def decode(data: bytes) -> Tuple[str, List[Dict]]:
+    """Reference decoder: (dataset hash, records with the JSON's fields and 1/0 flags)."""
+    if data[:4] != MAGIC:
+        raise ValueError("Not a breed bundle")
+    bundle_format, flags = struct.unpack_from('<BB', data, 4)
+    if bundle_format != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported breed bundle format: {bundle_format}")
+    data_hash = data[6:38].hex()
+    position = 38
+
+    count, position = read_varint(data, position)
+    strings, position = read_strings(data, position)
+    levels = {}
+    for field in CATEGORICAL_FIELDS:
+        size, position = read_varint(data, position)
+        values = []
+        for _ in range(size):
+            string_id, position = read_varint(data, position)
+            values.append(strings[string_id])
+        levels[field] = values
+    tokens = []
+    if flags & WORD_CODED:
+        tokens, position = read_strings(data, position)
+
+    description_count, position = read_varint(data, position)
+    descriptions = []
+    for _ in range(description_count):
+        if flags & WORD_CODED:
+            length, position = read_varint(data, position)
+            parts = []
+            for _ in range(length):
+                token_id, position = read_varint(data, position)
+                parts.append(tokens[token_id])
+            descriptions.append(''.join(parts))
+        else:
+            string_id, position = read_varint(data, position)
+            descriptions.append(strings[string_id])
+
+    records = []
+    for _ in range(count):
+        record = {}
+        string_id, position = read_varint(data, position)
+        record['breed'] = strings[string_id]
+        for field, values in levels.items():
+            code = data[position]
+            position += 1
+            record[field] = None if code == NULL_CODE else values[code]
+        flag_byte, score = data[position], data[position + 1]
+        position += 2
+        for bit, field in enumerate(FLAG_FIELDS):
+            record[field] = (flag_byte >> bit) & 1
+        record['shelter_availability_score'] = score or None
+        string_id, position = read_varint(data, position)
+        record['image_filename'] = strings[string_id]
+        description_id, position = read_varint(data, position)
+        record['description'] = descriptions[description_id]
+        records.append({field: record[field] for field in RECORD_FIELDS})
+    return data_hash, records
+
+
+def build_bundle(input_file: str = BREED_DATA_FILE, output_file: str = BUNDLE_FILE,
+                 word_coded: bool = True) -> bytes:
+    records = list(read_records(input_file))
+    data = encode(records, word_coded)
+
+    # Every record must survive the round trip exactly
+    _, decoded = decode(data)
+    expected = [{field: record.get(field) for field in RECORD_FIELDS} for record in records]
+    if decoded != expected:
+        mismatch = next(i for i, (a, b) in enumerate(zip(decoded, expected)) if a != b)
+        raise ValueError(f"Bundle round trip changed record {mismatch}: {expected[mismatch]['breed']}")
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    temp_file = f"{output_file}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, output_file)
+    print(f"📦 Bundled {len(records)} breeds into {output_file} ({len(data):,} bytes)")
+    return data
+
+
+def _best_time(function, repeat: int = 20) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def compare(input_file: str = BREED_DATA_FILE):
+    """Print size and parse time of the JSON against both bundle variants."""
+    with open(input_file, 'rb') as f:
+        json_bytes = f.read()
+    records = json.loads(json_bytes)
+    variants = [
+        ('JSON (as bundled today)', json_bytes, lambda: json.loads(json_bytes)),
+        ('JSON (minified)', json.dumps(records, separators=(',', ':'), ensure_ascii=False).encode('utf-8'), None),
+    ]
+    for label, word_coded in [('Bundle (plain descriptions)', False), ('Bundle (word-coded)', True)]:
+        data = encode(records, word_coded)
+        variants.append((label, data, lambda data=data: decode(data)))
+
+    print(f"{'Format'.ljust(30)} {'Bytes':>9} {'Gzipped':>9} {'Parse (Python)':>15}")
+    for label, data, parse in variants:
+        parse_time = f"{_best_time(parse) * 1000:.2f}ms" if parse else '-'
+        print(f"{label.ljust(30)} {len(data):>9,} {len(gzip.compress(data, 9)):>9,} {parse_time:>15}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the binary breed bundle the app seeds from.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--output', default=BUNDLE_FILE, help=f"bundle file (default: {BUNDLE_FILE})")
+    parser.add_argument('--plain', action='store_true', help="store descriptions as plain strings")
+    parser.add_argument('--compare', action='store_true', help="compare sizes and parse times with the JSON")
+    args = parser.parse_args()
+
+    try:
+        if args.compare:
+            compare(args.data)
+        else:
+            build_bundle(args.data, args.output, not args.plain)
+    except Exception as e:
+        print(f"❌ Error building breed bundle: {e}")
+        import traceback
+        traceback.print_exc()
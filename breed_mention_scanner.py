@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Single-pass breed mention scanner.
+Builds an Aho-Corasick automaton once over every known breed name and alias,
+then reports all breed mentions in a description (with positions) in one
+linear pass over the text, instead of running one regex per breed.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+BREED_NAMES_FILE = 'breed_names.txt'
+
+# Breeds we check descriptions against that aren't in our 180-breed list
+EXTRA_BREED_NAMES = [
+    'Basset Fauve de Bretagne', 'Rafeiro do Alentejo', 'Bull Terrier', 'Standard Bull Terrier',
+    'Cardigan Welsh Corgi', 'Siberian Husky', 'Chow Chow', 'Shar Pei', 'Dalmatian', 'Beauceron',
+    'English Cocker Spaniel', 'Welsh Springer Spaniel', 'Gordon Setter', 'Saluki', 'Afghan Hound',
+    'Borzoi', 'Scottish Deerhound', 'Pug',
+]
+
+# Common shelter/owner names for breeds -> canonical breed name
+BREED_ALIASES = {
+    'Pit Bull': 'American Pit Bull Terrier',
+    'Pitbull': 'American Pit Bull Terrier',
+    'Staffy': 'Staffordshire Bull Terrier',
+    'Yorkie': 'Yorkshire Terrier',
+    'Westie': 'West Highland White Terrier',
+    'Frenchie': 'French Bulldog',
+    'Sheltie': 'Shetland Sheepdog',
+    'Doxie': 'Dachshund',
+    'Husky': 'Siberian Husky',
+    'Lab': 'Labrador Retriever',
+    'Labrador': 'Labrador Retriever',
+    'GSD': 'German Shepherd',
+    'German Shepherd Dog': 'German Shepherd',
+    'Aussie': 'Australian Shepherd',
+    'Heeler': 'Australian Cattle Dog',
+    'Blue Heeler': 'Australian Cattle Dog',
+    'Dobie': 'Doberman Pinscher',
+    'Doberman': 'Doberman Pinscher',
+    'Rottie': 'Rottweiler',
+    'Cavalier': 'Cavalier King Charles Spaniel',
+    'St. Bernard': 'Saint Bernard',
+    'Newfie': 'Newfoundland',
+    'Malinois': 'Belgian Malinois',
+}
+
+
+class BreedMention(NamedTuple):
+    start: int   # Offset of the first character of the mention
+    end: int     # Offset just past the mention
+    text: str    # The mention as written in the description
+    breed: str   # Canonical breed name
+
+
+def load_known_breed_names(names_file: str = BREED_NAMES_FILE) -> List[str]:
+    """Breed names from breed_names.txt plus the extra breeds we audit against."""
+    with open(names_file, 'r', encoding='utf-8') as f:
+        names = [line.strip() for line in f if line.strip()]
+    return names + [name for name in EXTRA_BREED_NAMES if name not in names]
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+class BreedMentionScanner:
+    """Aho-Corasick automaton over breed names and aliases."""
+
+    def __init__(self, breed_names: Iterable[str], aliases: Optional[Dict[str, str]] = None,
+                 ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self.goto = [{}]      # state -> {char: next state}
+        self.fail = [0]
+        self.outputs = [[]]   # state -> [(keyword length, canonical breed)]
+
+        keywords = {name: name for name in breed_names}
+        keywords.update(aliases if aliases is not None else BREED_ALIASES)
+        for keyword, breed in keywords.items():
+            self._add_keyword(keyword, breed)
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword: str, breed: str):
+        if self.ignore_case:
+            keyword = keyword.lower()
+        state = 0
+        for ch in keyword:
+            if ch not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][ch] = len(self.goto) - 1
+            state = self.goto[state][ch]
+        self.outputs[state].append((len(keyword), breed))
+
+    def _build_failure_links(self):
+        """Breadth-first pass linking each state to its longest proper suffix state."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(ch, 0)
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def _raw_matches(self, text: str) -> Iterator[BreedMention]:
+        """Every keyword occurrence on word boundaries (an "s" plural is allowed)."""
+        state = 0
+        for position, ch in enumerate(text):
+            if self.ignore_case:
+                ch = ch.lower()
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+
+            for length, breed in self.outputs[state]:
+                start, end = position + 1 - length, position + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                following = text[end:end + 2]
+                if following and _is_word_char(following[0]):
+                    if not (following[0] == 's' and (len(following) == 1 or not _is_word_char(following[1]))):
+                        continue
+                yield BreedMention(start, end, text[start:end], breed)
+
+    def scan(self, text: str) -> List[BreedMention]:
+        """All breed mentions in `text`, dropping ones nested inside a longer mention."""
+        matches = sorted(self._raw_matches(text), key=lambda m: (m.start, -m.end))
+        mentions = []
+        furthest_end = -1
+        for match in matches:
+            if match.end > furthest_end:
+                mentions.append(match)
+                furthest_end = match.end
+        return mentions
+
+    def foreign_mentions(self, text: str, breed_name: str) -> List[BreedMention]:
+        """Mentions of breeds other than `breed_name` (or a part of its name)."""
+        own_name = breed_name.lower()
+        return [mention for mention in self.scan(text)
+                if mention.breed != breed_name and mention.text.lower() not in own_name]
+
+    def scan_many(self, texts: Iterable[str]) -> Iterator[List[BreedMention]]:
+        """Scan a corpus of descriptions, yielding one mention list per text."""
+        for text in texts:
+            yield self.scan(text)
+
+
+if __name__ == "__main__":
+    import sys
+
+    scanner = BreedMentionScanner(load_known_breed_names())
+    for line in sys.stdin:
+        for mention in scanner.scan(line):
+            print(f"{mention.start}\t{mention.end}\t{mention.text}\t{mention.breed}")
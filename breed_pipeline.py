@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Incremental runner for the breed data pipeline.
+Declares every fix_*.py step as a stage in a DAG, fingerprints each stage's
+inputs (source files, rule scripts and the repo modules they import, and
+upstream snapshots) and only re-runs
+stages whose fingerprint changed since the last successful run. Every breed
+data snapshot a stage writes is also added to the snapshot store (see
+snapshot_store.py) under the stage name, so runs can be diffed record by record,
+and is checked against the breed schema (breed_schema.py) before the stage
+counts as done.
+
+Usage (from the repo root):
+    python breed_pipeline.py                 # build everything that is stale
+    python breed_pipeline.py --force         # rebuild every stage
+    python breed_pipeline.py --only fix_sizes_by_weight
+    python breed_pipeline.py --list          # show stages and their status
+    python breed_pipeline.py --force --report run_report.json --profile add_shelter_scores
+    python breed_pipeline.py --no-snapshots  # don't add outputs to seeder/build/snapshots
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+from seeder import add_shelter_scores as shelter_scores_stage
+from seeder import fix_breed_data as breed_data_stage
+import breed_bitmap_index
+import breed_bundle
+import build_sqlite_db
+import comprehensive_size_check
+import description_shards
+import fix_breed_sizes
+import fix_designer_breeds_and_descriptions
+import fix_final_size_errors
+import fix_image_extensions
+import fix_sizes_by_weight
+import fix_terrier_sizes
+import mix_table
+import questionnaire_results
+import similar_breeds
+import text_search
+from instrumentation import recorder
+from breed_schema import print_violations, validate_file
+from snapshot_store import SnapshotStore
+
+BUILD_DIR = 'seeder/build'
+STATE_FILE = '.pipeline_state.json'
+SNAPSHOT_DIR = 'snapshots'
+BREED_DATA_PREFIX = 'dog_breeds_'   # Stage outputs that are breed records
+
+
+class Stage(NamedTuple):
+    """A single pipeline step: reads `inputs`, writes `output`."""
+    name: str
+    run: Callable[[List[str], str], object]
+    inputs: List[str]   # Source paths, or names of upstream stages
+    output: str         # File name inside the build directory
+    rules: List[str]    # Scripts holding the rule tables for this stage (local imports are followed)
+    extra_outputs: List[str] = []   # Other files or directories the stage writes into the build directory
+
+
+STAGES = [
+    Stage('fix_breed_data',
+          lambda inputs, output: breed_data_stage.main(inputs[0], inputs[1], output),
+          ['breed_names.txt', 'seeder/akc-data-latest.csv'],
+          'dog_breeds_corrected.json',
+          ['seeder/fix_breed_data.py']),
+    Stage('add_shelter_scores',
+          lambda inputs, output: shelter_scores_stage.add_shelter_scores(inputs[0], output),
+          ['fix_breed_data'],
+          'dog_breeds_with_shelter_scores.json',
+          ['seeder/add_shelter_scores.py']),
+    Stage('fix_breed_sizes',
+          lambda inputs, output: fix_breed_sizes.fix_breed_sizes(inputs[0], output),
+          ['add_shelter_scores'],
+          'dog_breeds_sizes_fixed.json',
+          ['fix_breed_sizes.py']),
+    Stage('fix_terrier_sizes',
+          lambda inputs, output: fix_terrier_sizes.fix_terrier_sizes(inputs[0], output),
+          ['fix_breed_sizes'],
+          'dog_breeds_all_sizes_fixed.json',
+          ['fix_terrier_sizes.py']),
+    Stage('comprehensive_size_check',
+          lambda inputs, output: comprehensive_size_check.analyze_and_fix_sizes(inputs[0], output),
+          ['fix_terrier_sizes'],
+          'dog_breeds_completely_fixed.json',
+          ['comprehensive_size_check.py']),
+    Stage('fix_final_size_errors',
+          lambda inputs, output: fix_final_size_errors.fix_remaining_size_errors(inputs[0], output),
+          ['comprehensive_size_check'],
+          'dog_breeds_final_corrected.json',
+          ['fix_final_size_errors.py']),
+    Stage('fix_designer_breeds_and_descriptions',
+          lambda inputs, output: fix_designer_breeds_and_descriptions.fix_designer_breeds_and_descriptions(inputs[0], output),
+          ['fix_final_size_errors'],
+          'dog_breeds_fully_corrected.json',
+          ['fix_designer_breeds_and_descriptions.py']),
+    Stage('fix_sizes_by_weight',
+          lambda inputs, output: fix_sizes_by_weight.fix_sizes_by_weight(inputs[0], output),
+          ['fix_designer_breeds_and_descriptions'],
+          'dog_breeds_weight_corrected.json',
+          ['fix_sizes_by_weight.py']),
+    Stage('fix_image_extensions',
+          lambda inputs, output: fix_image_extensions.fix_image_extensions(inputs[0], output),
+          ['fix_sizes_by_weight'],
+          'dog_breeds_images_fixed.json',
+          ['fix_image_extensions.py']),
+    Stage('description_shards',
+          lambda inputs, output: description_shards.split_descriptions(inputs[0], output),
+          ['fix_image_extensions'],
+          'breed_attributes.jsonl',
+          ['description_shards.py'],
+          [description_shards.SHARD_DIR]),
+    Stage('bitmap_index',
+          lambda inputs, output: breed_bitmap_index.build_index(inputs[0], output),
+          ['description_shards'],
+          'breed_bitmap_index.json',
+          ['breed_bitmap_index.py']),
+    Stage('sqlite_db',
+          lambda inputs, output: build_sqlite_db.build_verified_database(inputs[0], output, inputs[1]),
+          ['fix_image_extensions', 'seeder/akc-data-latest.csv'],
+          'dogmatch.db',
+          ['build_sqlite_db.py', 'data_versioning.py', 'text_search.py']),
+    Stage('mix_table',
+          lambda inputs, output: mix_table.build_mix_table(inputs[0], output),
+          ['seeder/akc-data-latest.csv'],
+          'mix_table.npz',
+          ['mix_table.py', 'breed_table.py', 'seeder/fix_breed_data.py']),
+    Stage('similar_breeds',
+          lambda inputs, output: similar_breeds.build_similarity_index(inputs[0], inputs[1], output),
+          ['description_shards', 'seeder/akc-data-latest.csv'],
+          'similar_breeds.npz',
+          ['similar_breeds.py', 'breed_table.py']),
+    Stage('questionnaire_results',
+          lambda inputs, output: questionnaire_results.build_results(inputs[0], output, inputs[1]),
+          ['description_shards', 'fix_image_extensions'],
+          'questionnaire_results.json',
+          ['questionnaire_results.py', 'breed_ranking.py', 'breed_bitmap_index.py', 'data_versioning.py']),
+    Stage('breed_bundle',
+          lambda inputs, output: breed_bundle.build_bundle(inputs[0], output),
+          ['fix_image_extensions'],
+          'breeds.bin',
+          ['breed_bundle.py', 'data_versioning.py']),
+    Stage('text_index',
+          lambda inputs, output: text_search.build_text_index(inputs[0], inputs[1], output),
+          ['fix_image_extensions', 'seeder/akc-data-latest.csv'],
+          'text_index.npz',
+          ['text_search.py']),
+]
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Return the sha256 of a file's contents, or None if it doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    if os.path.isdir(path):
+        return hash_directory(path)
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_directory(path: str) -> str:
+    """sha256 over every file's relative path and content hash, in sorted order."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode('utf-8'))
+            digest.update(hash_file(file_path).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def local_imports(script: str) -> List[str]:
+    """Repo modules a script imports, directly or through other repo modules."""
+    found: Set[str] = set()
+    pending = [script]
+    while pending:
+        path = pending.pop()
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        modules = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules.append(node.module)
+                # `from package import module` imports a module, not just a name
+                modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+        # Scripts import from the repo root or, like seeder/*.py, their own directory
+        roots = ['.', os.path.dirname(path) or '.']
+        for module in modules:
+            relative = module.replace('.', os.sep)
+            for root in roots:
+                for candidate in (f"{relative}.py", os.path.join(relative, '__init__.py')):
+                    candidate = os.path.normpath(os.path.join(root, candidate))
+                    if os.path.isfile(candidate) and candidate != script and candidate not in found:
+                        found.add(candidate)
+                        pending.append(candidate)
+    return sorted(found)
+
+
+def topological_order(stages: List[Stage]) -> List[Stage]:
+    """Order stages so every stage runs after the stages it depends on."""
+    by_name = {stage.name: stage for stage in stages}
+    pending = {stage.name: [i for i in stage.inputs if i in by_name] for stage in stages}
+    ordered = []
+
+    while pending:
+        ready = [name for name, deps in pending.items() if not deps]
+        if not ready:
+            raise ValueError(f"Cycle in pipeline stages: {sorted(pending)}")
+        for name in ready:
+            ordered.append(by_name[name])
+            del pending[name]
+        for deps in pending.values():
+            deps[:] = [d for d in deps if d not in ready]
+
+    return ordered
+
+
+def select_stages(stages: List[Stage], only: Optional[str]) -> List[Stage]:
+    """Return `only` and everything downstream of it (or all stages)."""
+    if only is None:
+        return stages
+    names = {stage.name for stage in stages}
+    if only not in names:
+        raise ValueError(f"Unknown stage: {only}")
+
+    selected = {only}
+    for stage in stages:
+        if any(i in selected for i in stage.inputs):
+            selected.add(stage.name)
+    return [stage for stage in stages if stage.name in selected]
+
+
+class Pipeline:
+    """Runs stages in dependency order, skipping those whose inputs are unchanged."""
+
+    def __init__(self, stages: List[Stage] = STAGES, build_dir: str = BUILD_DIR,
+                 store: Optional[SnapshotStore] = None):
+        self.stages = topological_order(stages)
+        self.build_dir = build_dir
+        self.store = store
+        self.state_path = os.path.join(build_dir, STATE_FILE)
+        self.state = self.load_state()
+
+    def load_state(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, 'r') as f:
+            return json.load(f)
+
+    def save_state(self):
+        with open(self.state_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+
+    def output_path(self, stage: Stage) -> str:
+        return os.path.join(self.build_dir, stage.output)
+
+    def input_paths(self, stage: Stage) -> List[str]:
+        by_name = {s.name: s for s in self.stages}
+        return [self.output_path(by_name[i]) if i in by_name else i for i in stage.inputs]
+
+    def rule_paths(self, stage: Stage) -> List[str]:
+        """The stage's rule scripts plus every repo module they import."""
+        paths = list(stage.rules)
+        for rule in stage.rules:
+            if rule.endswith('.py') and os.path.exists(rule):
+                paths.extend(path for path in local_imports(rule) if path not in paths)
+        return paths
+
+    def fingerprint(self, stage: Stage) -> str:
+        """Hash of everything that determines a stage's output."""
+        digest = hashlib.sha256(stage.output.encode('utf-8'))
+        for path in self.input_paths(stage) + self.rule_paths(stage):
+            file_hash = hash_file(path)
+            if file_hash is None:
+                raise FileNotFoundError(f"Stage {stage.name} is missing input: {path}")
+            digest.update(path.encode('utf-8'))
+            digest.update(file_hash.encode('utf-8'))
+        return digest.hexdigest()
+
+    def output_hash(self, stage: Stage) -> Optional[str]:
+        """Hash of the stage's output and extra outputs, or None if any is missing."""
+        output_hash = hash_file(self.output_path(stage))
+        if output_hash is None or not stage.extra_outputs:
+            return output_hash
+        digest = hashlib.sha256(output_hash.encode('utf-8'))
+        for extra in stage.extra_outputs:
+            extra_hash = hash_file(os.path.join(self.build_dir, extra))
+            if extra_hash is None:
+                return None
+            digest.update(extra.encode('utf-8'))
+            digest.update(extra_hash.encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_fresh(self, stage: Stage, fingerprint: str) -> bool:
+        """True when the recorded run matches the inputs and the outputs are untouched."""
+        record = self.state.get(stage.name)
+        if not record or record.get('fingerprint') != fingerprint:
+            return False
+        return record.get('output_hash') == self.output_hash(stage)
+
+    def run(self, force: bool = False, only: Optional[str] = None) -> Dict[str, str]:
+        """Build stale stages and return a {stage: 'ran' | 'skipped'} summary."""
+        os.makedirs(self.build_dir, exist_ok=True)
+        summary = {}
+
+        for stage in select_stages(self.stages, only):
+            fingerprint = self.fingerprint(stage)
+
+            if not force and self.is_fresh(stage, fingerprint):
+                print(f"⏭️  {stage.name}: up to date")
+                summary[stage.name] = 'skipped'
+                continue
+
+            print(f"\n▶️  {stage.name}: running")
+            started = time.perf_counter()
+            with recorder.stage(stage.name):
+                stage.run(self.input_paths(stage), self.output_path(stage))
+            elapsed = time.perf_counter() - started
+
+            output_hash = self.output_hash(stage)
+            if output_hash is None:
+                missing = [path for path in [self.output_path(stage)] +
+                           [os.path.join(self.build_dir, extra) for extra in stage.extra_outputs]
+                           if not os.path.exists(path)]
+                raise RuntimeError(f"Stage {stage.name} did not write {', '.join(missing)}")
+            if stage.output.startswith(BREED_DATA_PREFIX):
+                self.validate_output(stage)
+
+            self.state[stage.name] = {
+                'fingerprint': fingerprint,
+                'output_hash': output_hash,
+                'seconds': round(elapsed, 3),
+            }
+            if self.store and stage.output.startswith(BREED_DATA_PREFIX):
+                snapshot = self.store.add_file(self.output_path(stage), stage.name)
+                self.state[stage.name]['snapshot'] = snapshot
+            # Persist after every stage so an interrupted run keeps its progress
+            self.save_state()
+            summary[stage.name] = 'ran'
+
+        return summary
+
+    def validate_output(self, stage: Stage):
+        """Stop the run (before recording the stage as done) if its breed records break the schema."""
+        count, violations = validate_file(self.output_path(stage))
+        if violations:
+            print(f"❌ {stage.name}: {len(violations)} schema violations in {count:,} records")
+            print_violations(violations)
+            raise RuntimeError(f"Stage {stage.name} wrote records that fail the breed schema")
+
+    def status(self) -> Dict[str, str]:
+        """Report which stages would run without running them."""
+        statuses = {}
+        for stage in self.stages:
+            try:
+                fresh = self.is_fresh(stage, self.fingerprint(stage))
+                statuses[stage.name] = 'up to date' if fresh else 'stale'
+            except FileNotFoundError:
+                statuses[stage.name] = 'stale (inputs not built)'
+        return statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the breed dataset incrementally.")
+    parser.add_argument('--force', action='store_true', help="re-run every stage")
+    parser.add_argument('--only', help="run this stage and everything downstream of it")
+    parser.add_argument('--build-dir', default=BUILD_DIR, help=f"output directory (default: {BUILD_DIR})")
+    parser.add_argument('--list', action='store_true', help="show stage status and exit")
+    parser.add_argument('--report', help="write an instrumentation report (JSON) to this file")
+    parser.add_argument('--profile', metavar='STAGE', help="run this stage under cProfile (needs --report)")
+    parser.add_argument('--no-snapshots', action='store_true', help="don't add breed data outputs to the snapshot store")
+    args = parser.parse_args()
+    if args.profile and not args.report:
+        parser.error("--profile needs --report (the profile is written into the report)")
+    if args.profile and args.profile not in {stage.name for stage in STAGES}:
+        parser.error(f"--profile: unknown stage {args.profile}")
+
+    if args.report:
+        recorder.enable(args.report, args.profile)
+
+    store = None if args.no_snapshots else SnapshotStore(os.path.join(args.build_dir, SNAPSHOT_DIR))
+    pipeline = Pipeline(build_dir=args.build_dir, store=store)
+
+    if args.list:
+        for name, status in pipeline.status().items():
+            print(f"{name.ljust(40)} {status}")
+        return
+
+    summary = pipeline.run(force=args.force, only=args.only)
+    ran = [name for name, result in summary.items() if result == 'ran']
+
+    print(f"\n✅ Pipeline complete!")
+    print(f"   Stages run: {len(ran)}")
+    print(f"   Stages skipped: {len(summary) - len(ran)}")
+    print(f"   Output directory: {args.build_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Soft-match ranking of breeds against a questionnaire profile.
+Instead of dropping every breed that misses one answer (searchBreeds applies
+each answer as a hard SQL predicate, so strict profiles come back empty),
+every breed gets a weighted score: full credit for a matching level, partial
+credit by ordinal distance (a Medium dog is closer to Large than Toy is), and
+shelter_availability_score blended in. The breed attributes are held as code
+arrays, so a query is a handful of table lookups over whole columns followed
+by a partial sort for the top N.
+
+Profiles use the searchBreeds filter keys; filters_from_preferences converts
+the app's UserPreferences.
+
+Requires numpy.
+
+Usage:
+    python breed_ranking.py --size Small --energy Low --kids yes --grooming Low --top 10
+    python breed_ranking.py --data seeder/build/synthetic_breeds.jsonl --size Large --adoptable
+"""
+
+import argparse
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+
+ORDINAL_ATTRIBUTES = {
+    'size': ('Toy', 'Small', 'Medium', 'Large', 'Giant'),
+    'energy_level': ('Low', 'Moderate', 'High'),
+    'trainability': ('Low', 'Medium', 'High'),
+    'grooming_needs': ('Low', 'Medium', 'High'),
+}
+ROLE_LEVELS = ('Companion', 'Guardian', 'Both')
+BOOLEAN_ATTRIBUTES = ['good_with_kids', 'good_with_pets', 'senior_friendly', 'special_needs_possible']
+
+# Relative importance, following the bonus points in useBreedMatcher
+DEFAULT_WEIGHTS = {
+    'size': 15.0,
+    'grooming_needs': 15.0,
+    'energy_level': 10.0,
+    'good_with_kids': 8.0,
+    'good_with_pets': 8.0,
+    'trainability': 6.0,
+    'companion_or_guardian': 3.0,
+    'senior_friendly': 1.0,
+    'special_needs_possible': 1.0,
+}
+
+# Credit kept per level of distance; one level off keeps most of the credit
+ORDINAL_FALLOFF = {1: 0.6, 2: 0.2}
+# A "Both" breed fits either role; a Companion for a Guardian request gets little
+ROLE_CREDIT = 0.25
+SHELTER_BLEND = 0.10              # Share of the final score from shelter availability
+ADOPTABLE_SHELTER_BLEND = 0.25    # ... when the profile prioritizes adoptable breeds
+DEFAULT_TOP = 20
+
+
+class RankedBreed(NamedTuple):
+    breed: str
+    score: float                      # Blended score, 0-100
+    match: float                      # Profile match alone, 0-100
+    attribute_scores: Dict[str, float]  # Credit per answered attribute, 0-1
+
+
+def _codes(values: List, levels) -> np.ndarray:
+    """Level positions; unknown values get -1, which indexes each credit table's last (zero) slot."""
+    lookup = {level: code for code, level in enumerate(levels)}
+    return np.fromiter((lookup.get(value, -1) for value in values), dtype=np.int8, count=len(values))
+
+
+def ordinal_credit(levels, wanted: Iterable[str]) -> np.ndarray:
+    """Credit for every level given the wanted ones (plus a trailing 0 for unknown levels)."""
+    wanted_codes = [levels.index(value) for value in wanted if value in levels]
+    credit = np.zeros(len(levels) + 1, dtype=np.float32)
+    for code in range(len(levels)):
+        distance = min((abs(code - w) for w in wanted_codes), default=None)
+        if distance is not None:
+            credit[code] = 1.0 if distance == 0 else ORDINAL_FALLOFF.get(distance, 0.0)
+    return credit
+
+
+def role_credit(wanted: str) -> np.ndarray:
+    credit = np.full(len(ROLE_LEVELS) + 1, ROLE_CREDIT, dtype=np.float32)
+    credit[ROLE_LEVELS.index(wanted)] = 1.0
+    credit[ROLE_LEVELS.index('Both')] = 1.0
+    credit[-1] = 0.0
+    return credit
+
+
+class BreedMatrix:
+    """Breed attributes as parallel code arrays, ready for whole-column scoring."""
+
+    def __init__(self, names: List[str], codes: Dict[str, np.ndarray], shelter_scores: np.ndarray):
+        self.names = names
+        self.codes = codes
+        self.shelter_scores = shelter_scores
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'BreedMatrix':
+        columns = {attribute: [] for attribute in [*ORDINAL_ATTRIBUTES, 'companion_or_guardian', *BOOLEAN_ATTRIBUTES]}
+        names, shelter = [], []
+        for record in records:
+            names.append(record['breed'])
+            shelter.append(record.get('shelter_availability_score') or 5)
+            for attribute, values in columns.items():
+                values.append(record.get(attribute))
+
+        codes = {attribute: _codes(columns[attribute], levels) for attribute, levels in ORDINAL_ATTRIBUTES.items()}
+        codes['companion_or_guardian'] = _codes(columns['companion_or_guardian'], ROLE_LEVELS)
+        for attribute in BOOLEAN_ATTRIBUTES:
+            codes[attribute] = np.array([1 if value else 0 for value in columns[attribute]], dtype=np.int8)
+        return cls(names, codes, np.asarray(shelter, dtype=np.float32))
+
+    @classmethod
+    def from_breed_file(cls, input_file: str = BREED_DATA_FILE) -> 'BreedMatrix':
+        return cls.from_records(read_records(input_file))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def credit_tables(self, filters: Dict) -> Dict[str, np.ndarray]:
+        """Per-attribute credit tables for the answered questions (unanswered ones are skipped)."""
+        tables = {}
+        for attribute, levels in ORDINAL_ATTRIBUTES.items():
+            wanted = filters.get(attribute)
+            if wanted:
+                tables[attribute] = ordinal_credit(levels, [wanted] if isinstance(wanted, str) else wanted)
+        role = filters.get('companion_or_guardian')
+        if role in ROLE_LEVELS:
+            tables['companion_or_guardian'] = role_credit(role)
+        for attribute in BOOLEAN_ATTRIBUTES:
+            wanted = filters.get(attribute)
+            if wanted is not None:
+                tables[attribute] = np.array([0.0, 1.0] if wanted else [1.0, 0.0], dtype=np.float32)
+        return tables
+
+    def scores(self, filters: Dict, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Blended 0-100 score of every row."""
+        return self._score(filters, weights)[0]
+
+    def _score(self, filters: Dict, weights: Optional[Dict[str, float]] = None):
+        weights = weights or DEFAULT_WEIGHTS
+        tables = self.credit_tables(filters)
+        match = np.zeros(len(self), dtype=np.float32)
+        total_weight = 0.0
+        for attribute, table in tables.items():
+            weight = weights.get(attribute, 0.0)
+            if weight:
+                match += weight * table[self.codes[attribute]]
+                total_weight += weight
+        # Nothing answered: every breed is a full match and shelter score decides
+        match = match / total_weight if total_weight else np.ones(len(self), dtype=np.float32)
+
+        blend = ADOPTABLE_SHELTER_BLEND if filters.get('prioritize_adoptable') else SHELTER_BLEND
+        blended = (1 - blend) * match + blend * (self.shelter_scores / 10)
+        return blended * 100, match * 100, tables
+
+    def rank(self, filters: Dict, top: int = DEFAULT_TOP,
+             weights: Optional[Dict[str, float]] = None) -> List[RankedBreed]:
+        """Best `top` breeds for the profile: score, then shelter score, then row order."""
+        scores, match, tables = self._score(filters, weights)
+        take = min(top, len(self))
+        if not take:
+            return []
+        candidates = np.argpartition(-scores, take - 1)[:take] if take < len(self) else np.arange(len(self))
+        # Rows tied with the cut-off score may sit outside the partition; pull them in for a stable order
+        cutoff = scores[candidates].min()
+        candidates = np.union1d(candidates, np.flatnonzero(scores == cutoff))
+        order = np.lexsort((candidates, -self.shelter_scores[candidates], -scores[candidates]))
+        ranked = []
+        for row in candidates[order][:take]:
+            attribute_scores = {attribute: float(table[self.codes[attribute][row]]) for attribute, table in tables.items()}
+            ranked.append(RankedBreed(self.names[row], round(float(scores[row]), 2),
+                                      round(float(match[row]), 2), attribute_scores))
+        return ranked
+
+
+def filters_from_preferences(preferences: Dict) -> Dict:
+    """searchBreeds-style filters from the app's UserPreferences ('Any'/null mean unanswered)."""
+    def level(key):
+        value = preferences.get(key)
+        return None if value in (None, 'Any') else value
+
+    return {
+        'size': level('size'),
+        'energy_level': level('energyLevel'),
+        'trainability': level('trainability'),
+        'grooming_needs': level('groomingNeeds'),
+        'companion_or_guardian': level('role'),
+        'good_with_kids': preferences.get('goodWithKids'),
+        'good_with_pets': preferences.get('goodWithPets'),
+        'senior_friendly': preferences.get('seniorFriendly'),
+        'special_needs_possible': preferences.get('specialNeedsOk'),
+        'prioritize_adoptable': bool(preferences.get('prioritizeAdoptable')),
+    }
+
+
+if __name__ == "__main__":
+    yes_no = {'yes': True, 'no': False}
+    parser = argparse.ArgumentParser(description="Rank breeds against a questionnaire profile.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--size', nargs='+', choices=ORDINAL_ATTRIBUTES['size'])
+    parser.add_argument('--energy', nargs='+', choices=ORDINAL_ATTRIBUTES['energy_level'])
+    parser.add_argument('--trainability', nargs='+', choices=ORDINAL_ATTRIBUTES['trainability'])
+    parser.add_argument('--grooming', nargs='+', choices=ORDINAL_ATTRIBUTES['grooming_needs'])
+    parser.add_argument('--role', choices=ROLE_LEVELS)
+    parser.add_argument('--kids', choices=yes_no)
+    parser.add_argument('--pets', choices=yes_no)
+    parser.add_argument('--adoptable', action='store_true', help="weight shelter availability more")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP)
+    args = parser.parse_args()
+
+    try:
+        started = time.perf_counter()
+        matrix = BreedMatrix.from_breed_file(args.data)
+        loaded = time.perf_counter()
+        filters = {
+            'size': args.size, 'energy_level': args.energy, 'trainability': args.trainability,
+            'grooming_needs': args.grooming, 'companion_or_guardian': args.role,
+            'good_with_kids': yes_no.get(args.kids), 'good_with_pets': yes_no.get(args.pets),
+            'prioritize_adoptable': args.adoptable,
+        }
+        ranked = matrix.rank(filters, args.top)
+        finished = time.perf_counter()
+
+        print(f"🏅 Top {len(ranked)} of {len(matrix):,} breeds "
+              f"(loaded in {loaded - started:.2f}s, ranked in {(finished - loaded) * 1000:.1f}ms)")
+        for position, result in enumerate(ranked, 1):
+            misses = [attribute for attribute, credit in result.attribute_scores.items() if credit < 1]
+            note = f"  partial: {', '.join(misses)}" if misses else ''
+            print(f"   {position:2}. {result.breed:<40} {result.score:6.2f} (match {result.match:6.2f}){note}")
+    except Exception as e:
+        print(f"❌ Error ranking breeds: {e}")
+        import traceback
+        traceback.print_exc()
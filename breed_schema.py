@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Schema for breed records, compiled into a fast validator.
+BREED_SCHEMA lists every field with its rule (allowed levels, 0/1 flag,
+integer range, string). compile_validator() turns it into the source of one
+Python function with every check inlined as a single expression per record,
+so a valid record costs one pass through that expression and no per-field
+function calls. Only records that fail it are checked again field by field to
+report every violation with its record index.
+
+Flags must be the integers 0 and 1, not JSON true/false: database.ts seeds
+them with `=== 1`, so a boolean would silently become "No".
+
+breed_pipeline.py validates every dog_breeds_*.json stage output and stops on
+violations.
+
+Usage:
+    python breed_schema.py seeder/dog_breeds_with_shelter_scores.json [more files...]
+    python breed_schema.py seeder/build/synthetic_breeds.jsonl --limit 20 --workers 8
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from breed_ranking import ORDINAL_ATTRIBUTES, ROLE_LEVELS
+from record_stream import chunked, detect_format, read_records
+
+BATCH_SIZE = 50_000
+DEFAULT_LIMIT = 50
+
+
+class FieldRule(NamedTuple):
+    kind: str                   # 'enum', 'flag', 'int' or 'str'
+    values: tuple = ()          # Allowed values for 'enum'
+    minimum: int = 0            # Range for 'int'
+    maximum: int = 0
+    non_empty: bool = False     # 'str' must have non-whitespace text
+    required: bool = True       # False: the field may be missing or null
+
+
+BREED_SCHEMA: Dict[str, FieldRule] = {
+    'breed': FieldRule('str', non_empty=True),
+    'size': FieldRule('enum', ORDINAL_ATTRIBUTES['size']),
+    'energy_level': FieldRule('enum', ORDINAL_ATTRIBUTES['energy_level']),
+    'good_with_kids': FieldRule('flag'),
+    'good_with_pets': FieldRule('flag'),
+    'trainability': FieldRule('enum', ORDINAL_ATTRIBUTES['trainability']),
+    'grooming_needs': FieldRule('enum', ORDINAL_ATTRIBUTES['grooming_needs']),
+    'companion_or_guardian': FieldRule('enum', ROLE_LEVELS),
+    'senior_friendly': FieldRule('flag'),
+    'special_needs_possible': FieldRule('flag'),
+    'description': FieldRule('str'),
+    'image_filename': FieldRule('str', non_empty=True),
+    # Added by add_shelter_scores, so earlier snapshots don't have it yet
+    'shelter_availability_score': FieldRule('int', minimum=1, maximum=10, required=False),
+}
+
+
+class Violation(NamedTuple):
+    index: int      # Position of the record in the input
+    breed: str
+    field: str
+    message: str
+
+
+def check_field(rule: FieldRule, record: Dict, field: str):
+    """Slow path: what is wrong with one field, or None."""
+    if field not in record or record[field] is None:
+        return None if not rule.required else 'missing'
+    value = record[field]
+    if rule.kind == 'enum':
+        if not isinstance(value, str) or value not in rule.values:
+            return f"{value!r} is not one of {', '.join(rule.values)}"
+    elif rule.kind == 'flag':
+        if type(value) is not int or value not in (0, 1):
+            return f"{value!r} is not 0 or 1"
+    elif rule.kind == 'int':
+        if type(value) is not int or not rule.minimum <= value <= rule.maximum:
+            return f"{value!r} is not an integer from {rule.minimum} to {rule.maximum}"
+    elif rule.kind == 'str':
+        if not isinstance(value, str):
+            return f"{value!r} is not a string"
+        if rule.non_empty and not value.strip():
+            return 'empty'
+    return None
+
+
+def _condition(field: str, rule: FieldRule, constants: Dict) -> str:
+    """One inlined boolean expression that is True when the field is valid."""
+    get = f"(v := record.get({field!r}))"
+    if rule.kind == 'enum':
+        name = f"LEVELS_{len(constants)}"
+        constants[name] = frozenset(rule.values)
+        test = f"type({get}) is str and v in {name}"
+    elif rule.kind == 'flag':
+        test = f"type({get}) is int and 0 <= v <= 1"
+    elif rule.kind == 'int':
+        test = f"type({get}) is int and {rule.minimum} <= v <= {rule.maximum}"
+    elif rule.kind == 'str':
+        test = f"type({get}) is str" + (" and not v.isspace() and v != ''" if rule.non_empty else '')
+    else:
+        raise ValueError(f"Unknown rule kind for {field}: {rule.kind}")
+    if not rule.required:
+        # Missing and null read back as None through record.get
+        test = f"{get} is None or ({test.replace(get, 'v', 1)})"
+    return f"({test})"
+
+
+def compile_validator(schema: Dict[str, FieldRule] = BREED_SCHEMA) -> Callable[[Iterable[Dict], int], List[Violation]]:
+    """
+    Build `validate(records, start=0) -> [Violation]` for a schema.
+    Record indexes start at `start`, so batches of a stream report positions in
+    the whole input.
+    """
+    constants: Dict = {}
+    conditions = [_condition(field, rule, constants) for field, rule in schema.items()]
+    source = "\n".join([
+        "def validate(records, start=0):",
+        "    violations = []",
+        "    for index, record in enumerate(records, start):",
+        "        try:",
+        "            if (type(record) is dict",
+        *[f"                    and {condition}" for condition in conditions],
+        "                    ):",
+        "                continue",
+        "        except TypeError:",
+        "            pass",
+        "        violations.extend(explain(index, record))",
+        "    return violations",
+    ])
+    namespace = {'explain': lambda index, record: explain(schema, index, record), **constants}
+    exec(compile(source, '<breed_schema validator>', 'exec'), namespace)
+    validate = namespace['validate']
+    validate.source = source
+    return validate
+
+
+def explain(schema: Dict[str, FieldRule], index: int, record) -> List[Violation]:
+    """Every violation in one record that failed the compiled check."""
+    if not isinstance(record, dict):
+        return [Violation(index, '', '', f"record is {type(record).__name__}, not an object")]
+    breed = record.get('breed') if isinstance(record.get('breed'), str) else ''
+    violations = []
+    for field, rule in schema.items():
+        message = check_field(rule, record, field)
+        if message:
+            violations.append(Violation(index, breed, field, message))
+    return violations
+
+
+validate_records = compile_validator()
+
+
+def _validate_range(input_file: str, start: int, end: int, batch_size: int) -> Tuple[int, List[Violation]]:
+    """Worker: validate the JSON Lines records starting in bytes [start, end) of a file."""
+    count, violations = 0, []
+    with open(input_file, 'rb') as f:
+        f.seek(start)
+        batch = []
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                batch.append(json.loads(line))
+            if len(batch) == batch_size:
+                violations.extend(validate_records(batch, count))
+                count += len(batch)
+                batch = []
+        violations.extend(validate_records(batch, count))
+        count += len(batch)
+    return count, violations
+
+
+def _line_ranges(input_file: str, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into about `parts` byte ranges that start at line starts."""
+    size = os.path.getsize(input_file)
+    bounds = [0]
+    with open(input_file, 'rb') as f:
+        for part in range(1, parts):
+            f.seek(max(bounds[-1], size * part // parts))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def validate_file(input_file: str, batch_size: int = BATCH_SIZE, workers: int = 1) -> Tuple[int, List[Violation]]:
+    """
+    (record count, violations) for a JSON array or JSON Lines file, read in
+    batches. JSON Lines files are split across `workers` processes by line-aligned
+    byte ranges, since parsing costs far more than validating.
+    """
+    if workers > 1 and detect_format(input_file) == 'jsonl':
+        ranges = _line_ranges(input_file, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_range, *zip(*[(input_file, start, end, batch_size)
+                                                             for start, end in ranges])))
+        count, violations = 0, []
+        for part_count, part_violations in results:
+            violations.extend(violation._replace(index=violation.index + count) for violation in part_violations)
+            count += part_count
+        return count, violations
+
+    count, violations = 0, []
+    for batch in chunked(read_records(input_file), batch_size):
+        violations.extend(validate_records(batch, count))
+        count += len(batch)
+    return count, violations
+
+
+def print_violations(violations: List[Violation], limit: int = DEFAULT_LIMIT):
+    for violation in violations[:limit]:
+        print(f"   #{violation.index:<8} {violation.breed[:40]:<40} {violation.field:<28} {violation.message}")
+    if len(violations) > limit:
+        print(f"   ... {len(violations) - limit} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate breed records against the schema.")
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help="violations to print per file")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processes for JSON Lines files (default: CPU count)")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.files:
+        try:
+            started = time.perf_counter()
+            count, violations = validate_file(path, args.batch_size, args.workers)
+            elapsed = time.perf_counter() - started
+            if violations:
+                failed = True
+                records = len({violation.index for violation in violations})
+                print(f"❌ {path}: {len(violations)} violations in {records} of {count:,} records ({elapsed:.2f}s)")
+                print_violations(violations, args.limit)
+            else:
+                print(f"✅ {path}: {count:,} records valid ({elapsed:.2f}s)")
+        except Exception as e:
+            failed = True
+            print(f"❌ Error validating {path}: {e}")
+            import traceback
+            traceback.print_exc()
+    raise SystemExit(1 if failed else 0)
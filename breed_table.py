@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Columnar, NumPy-backed view of the AKC breed dataset.
+Loads akc-data-latest.csv once into typed arrays and maps whole columns to
+our size/energy/trainability/grooming categories with vectorized binning, so
+re-bucketing every breed after a threshold change is a single array operation.
+
+Requires numpy.
+"""
+
+import csv
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+AKC_FILE = 'seeder/akc-data-latest.csv'
+
+NUMERIC_COLUMNS = [
+    'popularity',
+    'min_height', 'max_height',
+    'min_weight', 'max_weight',
+    'min_expectancy', 'max_expectancy',
+    'grooming_frequency_value',
+    'shedding_value',
+    'energy_level_value',
+    'trainability_value',
+    'demeanor_value',
+]
+
+TEXT_COLUMNS = [
+    'description', 'temperament', 'group',
+    'grooming_frequency_category', 'shedding_category', 'energy_level_category',
+    'trainability_category', 'demeanor_category',
+]
+
+# Upper bounds (inclusive) for each category; these mirror map_size,
+# map_energy_level, map_trainability and map_grooming in seeder/fix_breed_data.py
+SIZE_BINS = ((10, 16, 24), ('Toy', 'Small', 'Medium', 'Large'))        # average height, inches
+ENERGY_BINS = ((0.4, 0.7), ('Low', 'Moderate', 'High'))
+TRAINABILITY_BINS = ((0.4, 0.7), ('Low', 'Medium', 'High'))
+GROOMING_BINS = ((0.4, 0.7), ('Low', 'Medium', 'High'))
+
+# Columns create_breed_entry parses; if any is missing the whole breed gets
+# the create_fallback_entry labels
+CATEGORY_SOURCES = ['min_height', 'max_height', 'energy_level_value', 'trainability_value',
+                    'grooming_frequency_value']
+
+# Labels create_fallback_entry uses when AKC values are missing
+FALLBACK_LABELS = {
+    'size': 'Medium',
+    'energy_level': 'Moderate',
+    'trainability': 'Medium',
+    'grooming_needs': 'Medium',
+}
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_float_array(values: List[str]) -> np.ndarray:
+    """Bulk-convert a column, falling back to per-value parsing if any value is blank."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        return np.array([_parse_float(v) for v in values], dtype=np.float64)
+
+
+class BreedTable:
+    """AKC breed data stored column by column."""
+
+    def __init__(self, names: Sequence[str], numeric: Dict[str, np.ndarray],
+                 text: Optional[Dict[str, List[str]]] = None):
+        self.names = np.asarray(names, dtype=object)
+        self.numeric = numeric
+        self.text = text or {}
+        self.position = {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def from_csv(cls, akc_file: str = AKC_FILE, load_text: bool = True) -> 'BreedTable':
+        """Read the AKC CSV once into float64 columns (missing values become NaN)."""
+        names = []
+        numeric_values = {column: [] for column in NUMERIC_COLUMNS}
+        text_values = {column: [] for column in TEXT_COLUMNS} if load_text else {}
+
+        with open(akc_file, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            numeric_index = [(column, header.index(column)) for column in NUMERIC_COLUMNS]
+            text_index = [(column, header.index(column)) for column in text_values]
+
+            for row in reader:
+                names.append(row[0].strip())  # First column is breed name
+                for column, index in numeric_index:
+                    numeric_values[column].append(row[index])
+                for column, index in text_index:
+                    text_values[column].append(row[index])
+
+        numeric = {column: _to_float_array(values) for column, values in numeric_values.items()}
+        return cls(names, numeric, text_values)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.numeric[name]
+
+    # Vectorized category mapping
+
+    @staticmethod
+    def bucket_codes(values: np.ndarray, bounds: Sequence[float]) -> np.ndarray:
+        """Index of the first bound each value is <= to (len(bounds) if above all)."""
+        return np.digitize(values, bounds, right=True).astype(np.int8)
+
+    @classmethod
+    def bucket(cls, values: np.ndarray, bins, fallback: str) -> np.ndarray:
+        """Map a whole column to category labels; NaN rows get the fallback label."""
+        bounds, labels = bins
+        labels = np.asarray(labels + (fallback,), dtype=object)
+        codes = cls.bucket_codes(values, bounds)
+        codes[np.isnan(values)] = len(labels) - 1
+        return labels[codes]
+
+    def average_height_inches(self) -> np.ndarray:
+        return (self.numeric['min_height'] + self.numeric['max_height']) / 2 / 2.54
+
+    def sizes(self, bins=SIZE_BINS) -> np.ndarray:
+        return self.bucket(self.average_height_inches(), bins, FALLBACK_LABELS['size'])
+
+    def energy_levels(self, bins=ENERGY_BINS) -> np.ndarray:
+        return self.bucket(self.numeric['energy_level_value'], bins, FALLBACK_LABELS['energy_level'])
+
+    def trainability(self, bins=TRAINABILITY_BINS) -> np.ndarray:
+        return self.bucket(self.numeric['trainability_value'], bins, FALLBACK_LABELS['trainability'])
+
+    def grooming_needs(self, bins=GROOMING_BINS) -> np.ndarray:
+        return self.bucket(self.numeric['grooming_frequency_value'], bins, FALLBACK_LABELS['grooming_needs'])
+
+    def incomplete_rows(self) -> np.ndarray:
+        """True for breeds missing any value create_breed_entry needs."""
+        return np.isnan(np.stack([self.numeric[column] for column in CATEGORY_SOURCES])).any(axis=0)
+
+    def categories(self) -> Dict[str, np.ndarray]:
+        """
+        All mapped category columns at once, as create_breed_entry assigns them:
+        a breed missing any source value gets every fallback label, not just the
+        one for the missing column (the single-column methods above do that).
+        """
+        categories = {
+            'size': self.sizes(),
+            'energy_level': self.energy_levels(),
+            'trainability': self.trainability(),
+            'grooming_needs': self.grooming_needs(),
+        }
+        incomplete = self.incomplete_rows()
+        for key, labels in categories.items():
+            labels[incomplete] = FALLBACK_LABELS[key]
+        return categories
+
+    def row(self, name: str) -> Dict:
+        """One breed as a plain dict (numeric values as floats, NaN as None)."""
+        i = self.position[name]
+        record = {'breed': name}
+        for column, values in self.numeric.items():
+            value = values[i]
+            record[column] = None if np.isnan(value) else float(value)
+        for column, values in self.text.items():
+            record[column] = values[i]
+        return record
+
+
+if __name__ == "__main__":
+    from seeder.fix_breed_data import map_energy_level, map_grooming, map_size, map_trainability
+
+    table = BreedTable.from_csv()
+    categories = table.categories()
+    print(f"📊 Loaded {len(table)} breeds into {len(table.numeric)} numeric columns")
+
+    # Cross-check the vectorized mapping against the scalar functions, including
+    # the whole-row fallback create_breed_entry takes when a value is missing
+    mismatches = 0
+    incomplete = table.incomplete_rows()
+    keys = ('size', 'energy_level', 'trainability', 'grooming_needs')
+    for i, name in enumerate(table.names):
+        n = table.numeric
+        if incomplete[i]:
+            expected = tuple(FALLBACK_LABELS[key] for key in keys)
+        else:
+            expected = (
+                map_size(n['min_height'][i], n['max_height'][i]),
+                map_energy_level(n['energy_level_value'][i], ''),
+                map_trainability(n['trainability_value'][i], ''),
+                map_grooming(n['grooming_frequency_value'][i], ''),
+            )
+        actual = tuple(categories[key][i] for key in keys)
+        if expected != actual:
+            mismatches += 1
+            print(f"⚠️  {name}: scalar {expected} vs vectorized {actual}")
+
+    print(f"✅ Vectorized mapping matches scalar functions ({mismatches} mismatches, "
+          f"{int(incomplete.sum())} breeds on fallback labels)")
+    for size, count in zip(*np.unique(categories['size'].astype(str), return_counts=True)):
+        print(f"   {size}: {count} breeds")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Build resized copies of the breed images for the app.
+Generates thumbnail, list and detail tiers from the full-size originals in
+assets/images/breeds on a process pool. A cache keyed on each source file's
+content hash (plus the tier settings) skips images that haven't changed since
+the last run.
+
+The "list" tier is written to assets/images/breeds_resized, which is the folder
+utils/breedImages.ts already requires from.
+
+Requires Pillow.
+
+Usage:
+    python build_image_derivatives.py [--force] [--workers N] [--tiers thumbnail list]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from PIL import Image
+
+SOURCE_DIR = 'assets/images/breeds'
+CACHE_FILE = 'assets/images/.derivatives_cache.json'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Tier name -> (output folder, longest edge in pixels), largest first so each
+# tier can be downscaled from the previous one
+TIERS = {
+    'detail': ('assets/images/breeds_detail', 768),
+    'list': ('assets/images/breeds_resized', 300),
+    'thumbnail': ('assets/images/breeds_thumbnail', 128),
+}
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tier_settings(tiers: List[str]) -> str:
+    """Cache key part for the tier configuration, so resizing rules invalidate old output."""
+    return json.dumps({tier: TIERS[tier] for tier in tiers}, sort_keys=True)
+
+
+def build_derivatives(source: str, tiers: List[str]) -> Tuple[str, Dict[str, List[int]]]:
+    """Worker: decode one original once and write every requested tier."""
+    sizes = {}
+    with Image.open(source) as original:
+        image = original.convert('RGBA' if 'A' in original.getbands() else 'RGB')
+
+    for tier in sorted(tiers, key=lambda t: -TIERS[t][1]):
+        folder, edge = TIERS[tier]
+        image.thumbnail((edge, edge), Image.LANCZOS)
+        os.makedirs(folder, exist_ok=True)
+        image.save(os.path.join(folder, Path(source).name), optimize=True)
+        sizes[tier] = list(image.size)
+
+    return source, sizes
+
+
+def load_cache(cache_file: str) -> Dict:
+    if not os.path.exists(cache_file):
+        return {}
+    with open(cache_file, 'r') as f:
+        return json.load(f)
+
+
+def is_current(entry: Dict, source_hash: str, settings: str, name: str, tiers: List[str]) -> bool:
+    if not entry or entry.get('source_hash') != source_hash or entry.get('settings') != settings:
+        return False
+    return all(os.path.exists(os.path.join(TIERS[tier][0], name)) for tier in tiers)
+
+
+def build_all(source_dir: str = SOURCE_DIR, tiers: List[str] = None, workers: int = None,
+              force: bool = False, cache_file: str = CACHE_FILE) -> Dict[str, int]:
+    """Rebuild stale derivatives in parallel; returns counts of built/skipped images."""
+    tiers = tiers or list(TIERS)
+    settings = tier_settings(tiers)
+    cache = load_cache(cache_file)
+
+    sources = sorted(str(p) for p in Path(source_dir).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+    print(f"🖼️  Found {len(sources)} source images in {source_dir}")
+
+    stale = []
+    for source in sources:
+        name = Path(source).name
+        source_hash = hash_file(source)
+        if force or not is_current(cache.get(name), source_hash, settings, name, tiers):
+            stale.append((source, source_hash))
+
+    print(f"🔧 {len(stale)} images to build, {len(sources) - len(stale)} up to date")
+
+    started = time.perf_counter()
+    hashes = dict(stale)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_derivatives, source, tiers) for source, _ in stale]
+        for future in as_completed(futures):
+            source, sizes = future.result()
+            cache[Path(source).name] = {
+                'source_hash': hashes[source],
+                'settings': settings,
+                'sizes': sizes,
+            }
+            print(f"   ✅ {Path(source).name}: " + ', '.join(f"{t} {w}x{h}" for t, (w, h) in sizes.items()))
+
+    # Forget images whose originals were removed
+    names = {Path(source).name for source in sources}
+    cache = {name: entry for name, entry in cache.items() if name in names}
+
+    with open(cache_file, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+    print(f"\n⏱️  Built {len(stale)} images in {time.perf_counter() - started:.1f}s")
+    return {'built': len(stale), 'skipped': len(sources) - len(stale)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build resized breed image tiers.")
+    parser.add_argument('--source', default=SOURCE_DIR, help=f"originals folder (default: {SOURCE_DIR})")
+    parser.add_argument('--tiers', nargs='+', choices=list(TIERS), help="tiers to build (default: all)")
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="rebuild even if sources are unchanged")
+    args = parser.parse_args()
+
+    build_all(args.source, args.tiers, args.workers, args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Build the prebuilt dogmatch.db that ships with the app.
+Creates the same tables as DatabaseManager.createTables, loads every breed in
+one transaction, adds indexes for the searchBreeds predicates, runs ANALYZE so
+the query planner has statistics, VACUUMs the file, then re-reads it and checks
+every row against the JSON source. A breeds_fts table (FTS5) holds each
+breed's name, description and AKC temperament for full-text search. On first
+launch the app copies this file instead of inserting breeds one at a time.
+
+Usage:
+    python build_sqlite_db.py [--data seeder/dog_breeds_with_shelter_scores.json] [--output assets/data/dogmatch.db]
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+from typing import Dict, List
+
+from breed_table import AKC_FILE
+from data_versioning import stored_value, version_info
+from record_stream import read_records
+from text_search import BreedDocuments
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+DATABASE_FILE = 'assets/data/dogmatch.db'
+
+BREED_COLUMNS = [
+    'breed', 'size', 'energy_level', 'good_with_kids', 'good_with_pets',
+    'trainability', 'grooming_needs', 'companion_or_guardian', 'senior_friendly',
+    'special_needs_possible', 'description', 'image_filename', 'shelter_availability_score',
+]
+
+# Keep in sync with DatabaseManager.createTables
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_version (
+  id INTEGER PRIMARY KEY,
+  version TEXT NOT NULL,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS breeds (
+  id INTEGER PRIMARY KEY,
+  breed TEXT NOT NULL,
+  size TEXT NOT NULL,
+  energy_level TEXT NOT NULL,
+  good_with_kids BOOLEAN NOT NULL,
+  good_with_pets BOOLEAN NOT NULL,
+  trainability TEXT NOT NULL,
+  grooming_needs TEXT NOT NULL,
+  companion_or_guardian TEXT NOT NULL,
+  senior_friendly BOOLEAN NOT NULL,
+  special_needs_possible BOOLEAN NOT NULL,
+  description TEXT NOT NULL,
+  image_filename TEXT NOT NULL,
+  shelter_availability_score INTEGER NOT NULL DEFAULT 5
+);
+
+CREATE TABLE IF NOT EXISTS favorites (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  breed_id INTEGER NOT NULL,
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  FOREIGN KEY (breed_id) REFERENCES breeds (id),
+  UNIQUE(breed_id)
+);
+"""
+
+# searchBreeds filters on the categorical columns (size first: almost every
+# questionnaire sets it) and the yes/no flags, then orders by breed or by
+# shelter score. Every filtered and ordered column is in idx_breeds_search, so
+# predicates are checked from the index and only matching rows touch the table.
+# Its ORDER BY terms are written +breed so the planner can't pick a full scan
+# of idx_breeds_breed just to skip sorting the matches. idx_breeds_breed serves
+# name lookups and the unfiltered list.
+INDEXES = {
+    'idx_breeds_search': 'breeds (size, energy_level, trainability, grooming_needs, companion_or_guardian, '
+                         'good_with_kids, good_with_pets, senior_friendly, special_needs_possible, '
+                         'shelter_availability_score, breed)',
+    'idx_breeds_breed': 'breeds (breed)',
+}
+
+# Full-text search over the same documents text_search.py indexes; rowid is
+# the breed id. createTables creates the same table, and seedBreedData rebuilds
+# it on device with an empty temperament column.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS breeds_fts USING fts5(
+  breed, description, temperament,
+  tokenize = 'porter unicode61'
+);
+"""
+SAMPLE_TEXT_QUERY = 'apartment OR calm OR low OR shedding'
+
+# searchBreeds queries; each must SEARCH an index, not scan the table or an index
+SAMPLE_SEARCHES = [
+    ("size IN ('Small', 'Medium') AND good_with_kids = 1 ORDER BY +breed", 'questionnaire search'),
+    ("size IN ('Large', 'Giant') AND energy_level IN ('Low') ORDER BY +shelter_availability_score DESC, +breed",
+     'adoptable-first search'),
+]
+
+
+def breed_row(breed_id: int, breed: Dict) -> tuple:
+    """One breeds row, converted the way seedBreedData does it."""
+    return (breed_id, *(stored_value(column, breed.get(column)) for column in BREED_COLUMNS))
+
+
+def build_database(input_file: str = BREED_DATA_FILE, output_file: str = DATABASE_FILE,
+                   version: str = None, akc_file: str = AKC_FILE) -> int:
+    """Write a fresh, indexed, analyzed and vacuumed database; returns the breed count."""
+    # The content hash database.ts compares against, so a fresh install doesn't reseed
+    version = version or version_info(input_file)['dataset_hash']
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    temp_file = f"{output_file}.tmp"
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+
+    connection = sqlite3.connect(temp_file)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executescript(FTS_SCHEMA)
+        placeholders = ', '.join('?' * (len(BREED_COLUMNS) + 1))
+        with connection:
+            cursor = connection.executemany(
+                f"INSERT INTO breeds (id, {', '.join(BREED_COLUMNS)}) VALUES ({placeholders})",
+                (breed_row(i + 1, breed) for i, breed in enumerate(read_records(input_file))),
+            )
+            count = cursor.rowcount
+            connection.execute(
+                "INSERT OR REPLACE INTO data_version (id, version, updated_at) VALUES (1, ?, CURRENT_TIMESTAMP)",
+                (version,),
+            )
+            for name, definition in INDEXES.items():
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+            connection.executemany(
+                "INSERT INTO breeds_fts (rowid, breed, description, temperament) VALUES (?, ?, ?, ?)",
+                ((i + 1, *document) for i, document in
+                 enumerate(BreedDocuments(akc_file).documents(read_records(input_file)))),
+            )
+            connection.execute("INSERT INTO breeds_fts (breeds_fts) VALUES ('optimize')")
+
+        connection.execute("ANALYZE")
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+    os.replace(temp_file, output_file)
+    print(f"🗄️  Built {output_file}: {count} breeds, {len(INDEXES)} indexes, data version {version[:12]}")
+    return count
+
+
+def verify_database(input_file: str = BREED_DATA_FILE, output_file: str = DATABASE_FILE) -> List[str]:
+    """Compare every row with the JSON source and check the planner uses the indexes."""
+    problems = []
+    connection = sqlite3.connect(output_file)
+    try:
+        integrity = connection.execute("PRAGMA integrity_check").fetchone()[0]
+        if integrity != 'ok':
+            problems.append(f"integrity_check: {integrity}")
+
+        rows = connection.execute(f"SELECT id, {', '.join(BREED_COLUMNS)} FROM breeds ORDER BY id")
+        expected_count = 0
+        for expected, actual in zip((breed_row(i + 1, b) for i, b in enumerate(read_records(input_file))), rows):
+            expected_count += 1
+            if expected != actual:
+                problems.append(f"row {expected[0]} ({expected[1]}) differs from the JSON source")
+
+        stored_count = connection.execute("SELECT COUNT(*) FROM breeds").fetchone()[0]
+        if stored_count != expected_count:
+            problems.append(f"{stored_count} rows in database, {expected_count} in JSON")
+
+        fts_count = connection.execute("SELECT COUNT(*) FROM breeds_fts").fetchone()[0]
+        if fts_count != stored_count:
+            problems.append(f"{fts_count} rows in breeds_fts, {stored_count} in breeds")
+        text_hits = connection.execute(
+            "SELECT COUNT(*) FROM breeds_fts WHERE breeds_fts MATCH ?", (SAMPLE_TEXT_QUERY,)).fetchone()[0]
+        print(f"   🔎 full-text search '{SAMPLE_TEXT_QUERY}': {text_hits} breeds")
+        if not text_hits:
+            problems.append(f"full-text search for '{SAMPLE_TEXT_QUERY}' found nothing")
+
+        if not connection.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0]:
+            problems.append("sqlite_stat1 is empty (ANALYZE did not run)")
+
+        for where, label in SAMPLE_SEARCHES:
+            plan = ' | '.join(row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN SELECT * FROM breeds WHERE {where}"))
+            print(f"   🔎 {label}: {plan}")
+            if not re.match(r'SEARCH breeds USING (COVERING )?INDEX ', plan):
+                problems.append(f"{label} does not search an index: {plan}")
+    finally:
+        connection.close()
+
+    return problems
+
+
+def build_verified_database(input_file: str = BREED_DATA_FILE, output_file: str = DATABASE_FILE,
+                            akc_file: str = AKC_FILE) -> int:
+    """build_database, then raise if verify_database finds any problem."""
+    count = build_database(input_file, output_file, akc_file=akc_file)
+    problems = verify_database(input_file, output_file)
+    if problems:
+        raise RuntimeError(f"{output_file} failed verification: " + '; '.join(problems))
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the prebuilt dogmatch.db.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--output', default=DATABASE_FILE, help=f"database file (default: {DATABASE_FILE})")
+    parser.add_argument('--akc', default=AKC_FILE, help=f"AKC data for temperaments (default: {AKC_FILE})")
+    args = parser.parse_args()
+
+    try:
+        build_database(args.data, args.output, akc_file=args.akc)
+        problems = verify_database(args.data, args.output)
+        if problems:
+            print(f"❌ Verification failed:")
+            for problem in problems:
+                print(f"   - {problem}")
+            raise SystemExit(1)
+        print(f"✅ Verified {args.output} against {args.data} ({os.path.getsize(args.output):,} bytes)")
+    except SystemExit:
+        raise
+    except Exception as e:
+        print(f"❌ Error building database: {e}")
+        import traceback
+        traceback.print_exc()
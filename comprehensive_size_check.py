@@ -6,9 +6,11 @@ This script reviews every single breed to ensure accurate size classifications.
 
 import json
 
-def load_breed_data():
+from instrumentation import instrumented
+
+def load_breed_data(input_file='seeder/dog_breeds_all_sizes_fixed.json'):
     """Load the current breed data."""
-    with open('seeder/dog_breeds_all_sizes_fixed.json', 'r') as f:
+    with open(input_file, 'r') as f:
         return json.load(f)
 
 def get_breed_size_standards():
@@ -184,9 +186,11 @@ def get_breed_size_standards():
         "Basset Bleu de Gascogne": "Large",      # 35-40 lbs, 12-15 inches
     }
 
-def analyze_and_fix_sizes():
+@instrumented('analyze_and_fix_sizes')
+def analyze_and_fix_sizes(input_file='seeder/dog_breeds_all_sizes_fixed.json',
+                          output_file='seeder/dog_breeds_completely_fixed.json'):
     """Analyze all breeds and fix incorrect size classifications."""
-    breeds = load_breed_data()
+    breeds = load_breed_data(input_file)
     standards = get_breed_size_standards()
     
     print(f"🔍 Analyzing {len(breeds)} breeds for size accuracy...")
@@ -222,7 +226,6 @@ def analyze_and_fix_sizes():
             print(f"   {issue}")
     
     # Save corrected data
-    output_file = 'seeder/dog_breeds_completely_fixed.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
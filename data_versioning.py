@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Content-hash versioning and row-level deltas for the breed data.
+Every record gets a hash of its canonical JSON, and the dataset hash is taken
+over the sorted (breed, record hash) pairs, so any edit - and only an edit -
+changes the version. A delta between two versions lists the inserted, updated
+(changed fields only) and deleted breeds, and can be applied in place to an
+existing dogmatch.db without touching the unchanged rows.
+
+Usage:
+    python data_versioning.py stamp                       # write seeder/data_version.json for the app
+    python data_versioning.py hash FILE
+    python data_versioning.py diff OLD.json NEW.json [-o delta.json]
+    python data_versioning.py apply delta.json [--db assets/data/dogmatch.db]
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+from typing import Dict, Iterable
+
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+VERSION_FILE = 'seeder/data_version.json'
+DATABASE_FILE = 'assets/data/dogmatch.db'
+DELTA_FORMAT = 1
+
+# Columns of the breeds table, in the order of the JSON records
+RECORD_FIELDS = [
+    'breed', 'size', 'energy_level', 'good_with_kids', 'good_with_pets',
+    'trainability', 'grooming_needs', 'companion_or_guardian', 'senior_friendly',
+    'special_needs_possible', 'description', 'image_filename', 'shelter_availability_score',
+]
+FLAG_FIELDS = {'good_with_kids', 'good_with_pets', 'senior_friendly', 'special_needs_possible'}
+DEFAULT_SHELTER_SCORE = 5   # What seedBreedData stores when a record has no score
+
+
+def stored_value(field: str, value):
+    """A field's value as the breeds table stores it (the seedBreedData conversions)."""
+    if field in FLAG_FIELDS:
+        return 1 if value == 1 else 0
+    if field == 'shelter_availability_score':
+        return value or DEFAULT_SHELTER_SCORE
+    return value
+
+
+def stored_record(record: Dict) -> Dict:
+    """A record's RECORD_FIELDS as the breeds table stores them."""
+    return {field: stored_value(field, record.get(field)) for field in RECORD_FIELDS}
+
+
+def record_hash(record: Dict) -> str:
+    """
+    Hash of a record's canonical JSON (key order and whitespace don't matter).
+    Values are hashed as stored, so a JSON file and the database built from it
+    have the same version.
+    """
+    canonical = json.dumps(stored_record(record),
+                           sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def dataset_hash(record_hashes: Dict[str, str]) -> str:
+    """Hash of the whole dataset from its {breed: record hash} map."""
+    digest = hashlib.sha256()
+    for breed in sorted(record_hashes):
+        digest.update(f"{breed}\t{record_hashes[breed]}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def hash_records(records: Iterable[Dict]) -> Dict[str, str]:
+    hashes = {}
+    for record in records:
+        if record['breed'] in hashes:
+            raise ValueError(f"Duplicate breed in dataset: {record['breed']}")
+        hashes[record['breed']] = record_hash(record)
+    return hashes
+
+
+def version_info(input_file: str = BREED_DATA_FILE) -> Dict:
+    """{'dataset_hash', 'record_count', 'records': {breed: hash}} for a data file."""
+    hashes = hash_records(read_records(input_file))
+    return {'dataset_hash': dataset_hash(hashes), 'record_count': len(hashes), 'records': hashes}
+
+
+def stamp_version(input_file: str = BREED_DATA_FILE, output_file: str = VERSION_FILE) -> str:
+    """Write the version file database.ts compares against; returns the dataset hash."""
+    info = version_info(input_file)
+    with open(output_file, 'w') as f:
+        json.dump({'dataset_hash': info['dataset_hash'], 'record_count': info['record_count']}, f, indent=2)
+        f.write('\n')
+    print(f"🔖 Data version {info['dataset_hash'][:12]} ({info['record_count']} breeds) -> {output_file}")
+    return info['dataset_hash']
+
+
+def diff_records(old_records: Iterable[Dict], new_records: Iterable[Dict]) -> Dict:
+    """Delta that turns the old dataset into the new one, keyed by breed."""
+    old = {record['breed']: record for record in old_records}
+    old_hashes = hash_records(old.values())
+    new_hashes = {}
+    inserted, updated = [], []
+
+    for record in new_records:
+        breed = record['breed']
+        new_hashes[breed] = record_hash(record)
+        if breed not in old:
+            inserted.append(stored_record(record))
+        elif new_hashes[breed] != old_hashes[breed]:
+            new_values, old_values = stored_record(record), stored_record(old[breed])
+            changes = {field: value for field, value in new_values.items() if value != old_values[field]}
+            updated.append({'breed': breed, 'changes': changes})
+
+    deleted = [breed for breed in old if breed not in new_hashes]
+    return {
+        'format': DELTA_FORMAT,
+        'from': dataset_hash(old_hashes),
+        'to': dataset_hash(new_hashes),
+        'inserted': inserted,
+        'updated': updated,
+        'deleted': deleted,
+    }
+
+
+def database_hashes(connection: sqlite3.Connection) -> Dict[str, str]:
+    """Record hashes of the rows currently in a breeds table."""
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(f"SELECT {', '.join(RECORD_FIELDS)} FROM breeds")
+    hashes = hash_records(dict(row) for row in rows)
+    connection.row_factory = None
+    return hashes
+
+
+def apply_delta(delta: Dict, db_file: str = DATABASE_FILE) -> Dict[str, int]:
+    """
+    Apply a delta to an existing dogmatch.db in one transaction.
+    The database content must hash to the delta's 'from' version. Existing rows
+    keep their ids (favorites point at them); new breeds get ids after the
+    current maximum, and favorites of deleted breeds are removed with them.
+    The breeds_fts full-text table, if present, is kept in step.
+    """
+    if delta.get('format') != DELTA_FORMAT:
+        raise ValueError(f"Unsupported delta format: {delta.get('format')}")
+
+    connection = sqlite3.connect(db_file)
+    try:
+        current = dataset_hash(database_hashes(connection))
+        if current == delta['to']:
+            print(f"✅ {db_file} is already at version {delta['to'][:12]}")
+            return {'inserted': 0, 'updated': 0, 'deleted': 0}
+        if current != delta['from']:
+            raise ValueError(f"{db_file} is at version {current[:12]}, delta expects {delta['from'][:12]}")
+
+        has_fts = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'breeds_fts'").fetchone()
+        with connection:
+            for breed in delta['deleted']:
+                connection.execute(
+                    "DELETE FROM favorites WHERE breed_id IN (SELECT id FROM breeds WHERE breed = ?)", (breed,))
+                if has_fts:
+                    connection.execute(
+                        "DELETE FROM breeds_fts WHERE rowid IN (SELECT id FROM breeds WHERE breed = ?)", (breed,))
+                connection.execute("DELETE FROM breeds WHERE breed = ?", (breed,))
+
+            for update in delta['updated']:
+                changes = update['changes']
+                assignments = ', '.join(f"{field} = ?" for field in changes)
+                connection.execute(f"UPDATE breeds SET {assignments} WHERE breed = ?",
+                                   (*changes.values(), update['breed']))
+                if has_fts and 'description' in changes:
+                    connection.execute(
+                        "UPDATE breeds_fts SET description = ? WHERE rowid IN (SELECT id FROM breeds WHERE breed = ?)",
+                        (changes['description'], update['breed']))
+
+            next_id = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM breeds").fetchone()[0]
+            for offset, record in enumerate(delta['inserted']):
+                connection.execute(
+                    f"INSERT INTO breeds (id, {', '.join(RECORD_FIELDS)}) "
+                    f"VALUES ({', '.join('?' * (len(RECORD_FIELDS) + 1))})",
+                    (next_id + offset, *(record[field] for field in RECORD_FIELDS)),
+                )
+            if has_fts and delta['inserted']:
+                from text_search import BreedDocuments  # Needs numpy and the AKC data
+                connection.executemany(
+                    "INSERT INTO breeds_fts (rowid, breed, description, temperament) VALUES (?, ?, ?, ?)",
+                    ((next_id + offset, *document) for offset, document in
+                     enumerate(BreedDocuments().documents(delta['inserted']))),
+                )
+
+            applied = dataset_hash(database_hashes(connection))
+            if applied != delta['to']:
+                raise ValueError(f"Delta produced version {applied[:12]}, expected {delta['to'][:12]}")
+            connection.execute(
+                "INSERT OR REPLACE INTO data_version (id, version, updated_at) VALUES (1, ?, CURRENT_TIMESTAMP)",
+                (delta['to'],),
+            )
+    finally:
+        connection.close()
+
+    counts = {key: len(delta[key]) for key in ('inserted', 'updated', 'deleted')}
+    print(f"✅ Applied delta to {db_file}: {counts['inserted']} inserted, "
+          f"{counts['updated']} updated, {counts['deleted']} deleted")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-hash versioning for the breed data.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    stamp = commands.add_parser('stamp', help="write the app's data version file")
+    stamp.add_argument('--data', default=BREED_DATA_FILE)
+    stamp.add_argument('--output', default=VERSION_FILE)
+
+    hash_command = commands.add_parser('hash', help="print a data file's dataset hash")
+    hash_command.add_argument('file')
+
+    diff = commands.add_parser('diff', help="write the delta between two data files")
+    diff.add_argument('old')
+    diff.add_argument('new')
+    diff.add_argument('-o', '--output', help="delta file (default: print to stdout)")
+
+    apply = commands.add_parser('apply', help="apply a delta to a SQLite database in place")
+    apply.add_argument('delta')
+    apply.add_argument('--db', default=DATABASE_FILE)
+
+    args = parser.parse_args()
+
+    if args.command == 'stamp':
+        stamp_version(args.data, args.output)
+    elif args.command == 'hash':
+        info = version_info(args.file)
+        print(f"{info['dataset_hash']}  {args.file} ({info['record_count']} records)")
+    elif args.command == 'diff':
+        delta = diff_records(read_records(args.old), read_records(args.new))
+        text = json.dumps(delta, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text)
+            print(f"📦 Delta {delta['from'][:12]} -> {delta['to'][:12]}: {len(delta['inserted'])} inserted, "
+                  f"{len(delta['updated'])} updated, {len(delta['deleted'])} deleted -> {args.output}")
+        else:
+            print(text)
+    elif args.command == 'apply':
+        with open(args.delta, 'r', encoding='utf-8') as f:
+            apply_delta(json.load(f), args.db)
+
+
+if __name__ == "__main__":
+    main()
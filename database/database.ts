@@ -1,5 +1,6 @@
 import * as SQLite from 'expo-sqlite';
-import breedData from '../seeder/dog_breeds_with_shelter_scores.json';
+import dataVersion from '../seeder/data_version.json';
+import { loadBreedBundle } from '../utils/breedBundle';
 
 export interface DogBreed {
   id: number;
@@ -29,6 +30,16 @@ class DatabaseManager {
 
   async initializeDatabase(forceSeed: boolean = false): Promise<void> {
     try {
+      // On first launch, copy the prebuilt database (built by build_sqlite_db.py) instead of
+      // seeding row by row. An existing database is never overwritten, so favorites are kept.
+      try {
+        await SQLite.importDatabaseFromAssetAsync('dogmatch.db', {
+          assetId: require('../assets/data/dogmatch.db'),
+        });
+      } catch (error) {
+        // // // // console.warn('Prebuilt database unavailable, falling back to seeding:', error);
+      }
+
       this.db = await SQLite.openDatabaseAsync('dogmatch.db');
       
       // Create tables
@@ -107,14 +118,36 @@ class DatabaseManager {
         UNIQUE(breed_id)
       );
     `);
+
+    // Indexes for the searchBreeds predicates (keep in sync with INDEXES in build_sqlite_db.py)
+    await this.db.execAsync(`
+      CREATE INDEX IF NOT EXISTS idx_breeds_search ON breeds (
+        size, energy_level, trainability, grooming_needs, companion_or_guardian,
+        good_with_kids, good_with_pets, senior_friendly, special_needs_possible,
+        shelter_availability_score, breed
+      );
+      CREATE INDEX IF NOT EXISTS idx_breeds_breed ON breeds (breed);
+      DROP INDEX IF EXISTS idx_breeds_adoptable;
+    `);
+
+    // Full-text search table (keep in sync with FTS_SCHEMA in build_sqlite_db.py); rowid is the breed id
+    await this.db.execAsync(`
+      CREATE VIRTUAL TABLE IF NOT EXISTS breeds_fts USING fts5(
+        breed, description, temperament,
+        tokenize = 'porter unicode61'
+      );
+    `);
   }
 
   private async seedBreedData(): Promise<void> {
     if (!this.db) throw new Error('Database not initialized');
 
-    // Clear existing data before reseeding
-    await this.db.execAsync('DELETE FROM breeds');
-    // // // // console.log('🗑️  Cleared existing breed data');
+    // The breed data ships as a binary bundle (breed_bundle.py), decoded only when reseeding.
+    // Loaded before clearing the table so a bad bundle leaves the current data in place.
+    const { datasetHash, breeds: breedData } = await loadBreedBundle();
+    if (datasetHash !== dataVersion.dataset_hash) {
+      throw new Error('assets/data/breeds.bin does not match the data version; run `python breed_bundle.py`');
+    }
 
     // // // // console.log(`🌱 Seeding breed data... Found ${breedData.length} breeds to seed`);
     // // console.log(`📊 First breed sample: ${breedData[0]?.breed} - ${breedData[0]?.size} - ${breedData[0]?.description?.substring(0, 50)}...`);
@@ -140,29 +173,43 @@ class DatabaseManager {
         special_needs_possible, description, image_filename, shelter_availability_score
       ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     `);
+    // The bundle has no AKC temperaments, so a reseeded full-text row leaves that column empty
+    const ftsStatement = await this.db.prepareAsync(
+      "INSERT INTO breeds_fts (rowid, breed, description, temperament) VALUES (?, ?, ?, '')"
+    );
 
+    const db = this.db;
     try {
-      for (let i = 0; i < breedData.length; i++) {
-        const breed = breedData[i];
-        // // // // console.log(`Seeding breed ${i + 1}: ${breed.breed}`);
+      // One transaction for the whole import instead of an implicit one per row;
+      // the breeds and their full-text rows are cleared and rebuilt together
+      await this.db.withTransactionAsync(async () => {
+        await db.execAsync('DELETE FROM breeds; DELETE FROM breeds_fts;');
+        // // // // console.log('🗑️  Cleared existing breed data');
+
+        for (let i = 0; i < breedData.length; i++) {
+          const breed = breedData[i];
+          // // // // console.log(`Seeding breed ${i + 1}: ${breed.breed}`);
         
-        await insertStatement.executeAsync([
-          i + 1, // Generate ID starting from 1
-          breed.breed,
-          breed.size,
-          breed.energy_level,
-          breed.good_with_kids === 1, // Convert 1/0 to boolean
-          breed.good_with_pets === 1, // Convert 1/0 to boolean
-          breed.trainability,
-          breed.grooming_needs,
-          breed.companion_or_guardian,
-          breed.senior_friendly === 1, // Convert 1/0 to boolean
-          breed.special_needs_possible === 1, // Convert 1/0 to boolean
-          breed.description,
-          breed.image_filename,
-          breed.shelter_availability_score || 5 // Use provided score or default to 5
-        ]);
-      }
+          await insertStatement.executeAsync([
+            i + 1, // Generate ID starting from 1
+            breed.breed,
+            breed.size,
+            breed.energy_level,
+            breed.good_with_kids === 1, // Convert 1/0 to boolean
+            breed.good_with_pets === 1, // Convert 1/0 to boolean
+            breed.trainability,
+            breed.grooming_needs,
+            breed.companion_or_guardian,
+            breed.senior_friendly === 1, // Convert 1/0 to boolean
+            breed.special_needs_possible === 1, // Convert 1/0 to boolean
+            breed.description,
+            breed.image_filename,
+            breed.shelter_availability_score || 5 // Use provided score or default to 5
+          ]);
+          await ftsStatement.executeAsync([i + 1, breed.breed, breed.description]);
+        }
+        await db.execAsync("INSERT INTO breeds_fts (breeds_fts) VALUES ('optimize')");
+      });
       
       // // // // console.log(`Successfully seeded ${breedData.length} breeds`);
     } catch (error) {
@@ -170,15 +217,15 @@ class DatabaseManager {
       throw error;
     } finally {
       await insertStatement.finalizeAsync();
+      await ftsStatement.finalizeAsync();
     }
   }
 
   // Version management methods
   private getDataVersion(): string {
-    // Create a version based on breed count and a hash of the data
-    // Update this version whenever you change the breed data
-    const DATA_VERSION = '1.2.0'; // Increment this when you update breed data
-    return DATA_VERSION;
+    // Content hash of the breed data, written by `python data_versioning.py stamp`,
+    // so any change to the data changes the version without a manual bump
+    return dataVersion.dataset_hash;
   }
 
   private async getStoredVersion(): Promise<string> {
@@ -290,16 +337,44 @@ class DatabaseManager {
       params.push(filters.special_needs_possible);
     }
 
-    // Add shelter availability priority if requested
+    // Add shelter availability priority if requested. The unary + keeps the planner
+    // on idx_breeds_search for the filters instead of scanning an index in sort order.
     if (filters.prioritize_adoptable) {
-      query += ' ORDER BY shelter_availability_score DESC, breed';
+      query += ' ORDER BY +shelter_availability_score DESC, +breed';
     } else {
-      query += ' ORDER BY breed';
+      query += ' ORDER BY +breed';
     }
 
     return await this.db.getAllAsync<DogBreed>(query, params);
   }
 
+  // Full-text search over names, descriptions and temperaments (breeds_fts is prebuilt by
+  // build_sqlite_db.py and rebuilt, without temperaments, by seedBreedData). Words are
+  // OR'ed and ranked by BM25, name matches weighted double.
+  async searchBreedsByText(text: string, limit: number = 20): Promise<DogBreed[]> {
+    if (!this.db) throw new Error('Database not initialized');
+
+    const words = text.toLowerCase().match(/[a-z0-9]+/g) ?? [];
+    if (words.length === 0) return [];
+
+    try {
+      return await this.db.getAllAsync<DogBreed>(
+        `SELECT b.* FROM breeds_fts
+         JOIN breeds b ON b.id = breeds_fts.rowid
+         WHERE breeds_fts MATCH ?
+         ORDER BY bm25(breeds_fts, 2.0, 1.0, 1.0), b.breed
+         LIMIT ?`,
+        [words.map(word => `"${word}"`).join(' OR '), limit]
+      );
+    } catch (error) {
+      // Full-text query failed (e.g. SQLite built without FTS5): fall back to matching names
+      return await this.db.getAllAsync<DogBreed>(
+        `SELECT * FROM breeds WHERE ${words.map(() => 'breed LIKE ?').join(' OR ')} ORDER BY breed LIMIT ?`,
+        [...words.map(word => `%${word}%`), limit]
+      );
+    }
+  }
+
   // Favorites queries
   async getFavorites(): Promise<(DogBreed & { favorited_at: string })[]> {
     if (!this.db) throw new Error('Database not initialized');
@@ -382,6 +457,7 @@ class DatabaseManager {
     
     await this.db.execAsync('DELETE FROM favorites');
     await this.db.execAsync('DELETE FROM breeds');
+    await this.db.execAsync('DELETE FROM breeds_fts');
     // // // // console.log('Database cleared');
   }
 
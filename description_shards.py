@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Split the breed data into an attributes-only file and description shards.
+Descriptions are most of the bytes in a breed record but are only read on
+detail screens, while the questionnaire and results path filters on the
+attributes alone. This writes:
+
+    breed_attributes.jsonl       every field except the description, plus the
+                                 breed id (1-based, the id the app seeds with)
+    descriptions/shard-NNNN.txt  descriptions back to back as UTF-8, about
+                                 SHARD_BYTES per shard
+    descriptions/index.bin       "BDSI", u32 count, then one fixed-width entry
+                                 per id: u32 shard, u64 offset, u32 length
+
+Because index entries have a fixed width, reading one description is two
+seeks: entry `id` in the index, then its byte range in the shard. Nothing else
+is parsed, so reading attributes or single descriptions doesn't get slower or
+bigger as the text grows. Both files are written in one streaming pass.
+
+Usage:
+    python description_shards.py [--data seeder/dog_breeds_with_shelter_scores.json] [--output seeder/build/breed_attributes.jsonl]
+    python description_shards.py --get 42 [--output ...]
+"""
+
+import argparse
+import os
+import shutil
+import struct
+import time
+from typing import Dict, Iterator, Optional
+
+from record_stream import RecordWriter, read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+ATTRIBUTES_FILE = 'seeder/build/breed_attributes.jsonl'
+SHARD_DIR = 'descriptions'
+INDEX_FILE = 'index.bin'
+INDEX_MAGIC = b'BDSI'
+INDEX_HEADER = struct.Struct('<4sI')
+INDEX_ENTRY = struct.Struct('<IQI')   # shard, offset, length
+SHARD_BYTES = 4 << 20
+
+
+def shard_dir_for(attributes_file: str) -> str:
+    return os.path.join(os.path.dirname(attributes_file) or '.', SHARD_DIR)
+
+
+def shard_path(shard_dir: str, shard: int) -> str:
+    return os.path.join(shard_dir, f"shard-{shard:04d}.txt")
+
+
+def split_descriptions(input_file: str = BREED_DATA_FILE, output_file: str = ATTRIBUTES_FILE,
+                       shard_bytes: int = SHARD_BYTES) -> Dict[str, int]:
+    """
+    Write the attributes file, shards and index in one pass; returns counts.
+    Shards and index are written to a temporary directory that replaces the old
+    one only once complete, so a failed run never leaves an index pointing at
+    missing or half-written shards.
+    """
+    shard_dir = shard_dir_for(output_file)
+    temp_dir = f"{shard_dir}.tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+
+    started = time.perf_counter()
+    shard, offset, text_bytes = 0, 0, 0
+    temp_output = f"{output_file}.tmp"
+    shard_file = open(shard_path(temp_dir, shard), 'wb')
+    index_file = open(os.path.join(temp_dir, INDEX_FILE), 'wb')
+    index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, 0))   # Count is filled in at the end
+    count = 0
+
+    try:
+        with RecordWriter(temp_output, 'jsonl', ensure_ascii=False) as writer:
+            for count, record in enumerate(read_records(input_file), 1):
+                data = (record.get('description') or '').encode('utf-8')
+                if offset and offset + len(data) > shard_bytes:
+                    shard_file.close()
+                    shard, offset = shard + 1, 0
+                    shard_file = open(shard_path(temp_dir, shard), 'wb')
+                shard_file.write(data)
+                index_file.write(INDEX_ENTRY.pack(shard, offset, len(data)))
+                offset += len(data)
+                text_bytes += len(data)
+                writer.write({'id': count, **{key: value for key, value in record.items() if key != 'description'}})
+        index_file.seek(0)
+        index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, count))
+    except BaseException:
+        shard_file.close()
+        index_file.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        if os.path.exists(temp_output):
+            os.remove(temp_output)
+        raise
+    shard_file.close()
+    index_file.close()
+
+    # Swap the shard directory in, then the attributes file whose ids it indexes
+    old_dir = f"{shard_dir}.old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(shard_dir):
+        os.rename(shard_dir, old_dir)
+    os.rename(temp_dir, shard_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    os.replace(temp_output, output_file)
+
+    print(f"✂️  Split {count:,} breeds in {time.perf_counter() - started:.2f}s: "
+          f"{os.path.getsize(output_file):,} bytes of attributes -> {output_file}, "
+          f"{text_bytes:,} bytes of descriptions in {shard + 1} shard(s) -> {shard_dir}")
+    return {'records': count, 'shards': shard + 1, 'attribute_bytes': os.path.getsize(output_file),
+            'description_bytes': text_bytes}
+
+
+class DescriptionShards:
+    """Reads single descriptions by breed id without loading the others."""
+
+    def __init__(self, attributes_file: str = ATTRIBUTES_FILE):
+        self.shard_dir = shard_dir_for(attributes_file)
+        self.index = open(os.path.join(self.shard_dir, INDEX_FILE), 'rb')
+        magic, self.count = INDEX_HEADER.unpack(self.index.read(INDEX_HEADER.size))
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not a description index: {self.index.name}")
+        self.shards = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get(self, breed_id: int) -> Optional[str]:
+        """Description of breed `breed_id` (1-based), or None past the end."""
+        if not 1 <= breed_id <= self.count:
+            return None
+        self.index.seek(INDEX_HEADER.size + (breed_id - 1) * INDEX_ENTRY.size)
+        shard, offset, length = INDEX_ENTRY.unpack(self.index.read(INDEX_ENTRY.size))
+        if shard not in self.shards:
+            self.shards[shard] = open(shard_path(self.shard_dir, shard), 'rb')
+        shard_file = self.shards[shard]
+        shard_file.seek(offset)
+        return shard_file.read(length).decode('utf-8')
+
+    def close(self):
+        self.index.close()
+        for shard_file in self.shards.values():
+            shard_file.close()
+
+    def __enter__(self) -> 'DescriptionShards':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_attributes(attributes_file: str = ATTRIBUTES_FILE) -> Iterator[Dict]:
+    """Attribute records (with 'id'), streamed; descriptions are never read."""
+    return read_records(attributes_file)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Split breed data into attributes and description shards.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--output', default=ATTRIBUTES_FILE, help=f"attributes file (default: {ATTRIBUTES_FILE})")
+    parser.add_argument('--shard-bytes', type=int, default=SHARD_BYTES,
+                        help=f"target shard size (default: {SHARD_BYTES:,})")
+    parser.add_argument('--get', type=int, nargs='+', metavar='ID', help="print descriptions from existing shards")
+    args = parser.parse_args()
+
+    try:
+        if args.get:
+            with DescriptionShards(args.output) as shards:
+                for breed_id in args.get:
+                    started = time.perf_counter()
+                    description = shards.get(breed_id)
+                    elapsed = (time.perf_counter() - started) * 1000
+                    print(f"📖 #{breed_id} ({elapsed:.3f}ms): {description if description is not None else '(no such breed)'}")
+        else:
+            split_descriptions(args.data, args.output, args.shard_bytes)
+    except Exception as e:
+        print(f"❌ Error splitting descriptions: {e}")
+        import traceback
+        traceback.print_exc()
@@ -7,11 +7,15 @@ This script corrects breeds that are incorrectly labeled as small when they shou
 import json
 import re
 
-def fix_breed_sizes():
+from instrumentation import instrumented
+
+@instrumented('fix_breed_sizes')
+def fix_breed_sizes(input_file='seeder/dog_breeds_with_shelter_scores.json',
+                    output_file='seeder/dog_breeds_sizes_fixed.json'):
     """Fix incorrect size classifications for various dog breeds."""
     
     # Load the breed data
-    with open('seeder/dog_breeds_with_shelter_scores.json', 'r') as f:
+    with open(input_file, 'r') as f:
         breeds = json.load(f)
     
     print(f"🔍 Loaded {len(breeds)} breeds")
@@ -89,7 +93,6 @@ def fix_breed_sizes():
     print(f"   Bulldog fixes: {bulldog_fixes}")
     
     # Save the corrected data
-    output_file = 'seeder/dog_breeds_sizes_fixed.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
@@ -6,14 +6,15 @@ This script corrects the final size classifications and fixes mismatched descrip
 
 import json
 
-def load_breed_data():
+def load_breed_data(input_file='seeder/dog_breeds_final_corrected.json'):
     """Load the current breed data."""
-    with open('seeder/dog_breeds_final_corrected.json', 'r') as f:
+    with open(input_file, 'r') as f:
         return json.load(f)
 
-def fix_designer_breeds_and_descriptions():
+def fix_designer_breeds_and_descriptions(input_file='seeder/dog_breeds_final_corrected.json',
+                                         output_file='seeder/dog_breeds_fully_corrected.json'):
     """Fix designer breed sizes and incorrect descriptions."""
-    breeds = load_breed_data()
+    breeds = load_breed_data(input_file)
     
     print(f"🔍 Fixing designer breed sizes and descriptions...")
     print(f"📊 Found {len(breeds)} breeds to review")
@@ -94,7 +95,6 @@ def fix_designer_breeds_and_descriptions():
     print(f"   Total changes made: {changes_made}")
     
     # Save corrected data
-    output_file = 'seeder/dog_breeds_fully_corrected.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
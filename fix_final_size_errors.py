@@ -6,14 +6,18 @@ This script corrects the size errors that were identified.
 
 import json
 
-def load_breed_data():
+from instrumentation import instrumented
+
+def load_breed_data(input_file='seeder/dog_breeds_completely_fixed.json'):
     """Load the current breed data."""
-    with open('seeder/dog_breeds_completely_fixed.json', 'r') as f:
+    with open(input_file, 'r') as f:
         return json.load(f)
 
-def fix_remaining_size_errors():
+@instrumented('fix_remaining_size_errors')
+def fix_remaining_size_errors(input_file='seeder/dog_breeds_completely_fixed.json',
+                              output_file='seeder/dog_breeds_final_corrected.json'):
     """Fix the remaining incorrect size classifications."""
-    breeds = load_breed_data()
+    breeds = load_breed_data(input_file)
     
     print(f"🔍 Fixing remaining size classification errors...")
     print(f"📊 Found {len(breeds)} breeds to review")
@@ -59,7 +63,6 @@ def fix_remaining_size_errors():
     print(f"   Changes made: {changes_made}")
     
     # Save corrected data
-    output_file = 'seeder/dog_breeds_final_corrected.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
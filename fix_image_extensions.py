@@ -6,14 +6,15 @@ The data has .jpg extensions but actual images are .png files.
 
 import json
 
-def load_breed_data():
+def load_breed_data(input_file='seeder/dog_breeds_descriptions_fixed.json'):
     """Load the current breed data."""
-    with open('seeder/dog_breeds_descriptions_fixed.json', 'r') as f:
+    with open(input_file, 'r') as f:
         return json.load(f)
 
-def fix_image_extensions():
+def fix_image_extensions(input_file='seeder/dog_breeds_descriptions_fixed.json',
+                         output_file='seeder/dog_breeds_images_fixed.json'):
     """Fix image filename extensions from .jpg to .png."""
-    breeds = load_breed_data()
+    breeds = load_breed_data(input_file)
     
     print(f"🔧 Fixing image filename extensions for {len(breeds)} dog breeds...")
     
@@ -40,7 +41,6 @@ def fix_image_extensions():
     print(f"   Extensions fixed: {changes_made}")
     
     # Save corrected data
-    output_file = 'seeder/dog_breeds_images_fixed.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
@@ -9,46 +9,23 @@ Using the proper classification:
 - Giant: 100+ pounds
 """
 
-import json
-import re
+from instrumentation import instrumented
+from record_stream import chunked, read_records, write_records
+from size_extraction import extract_sizes, extract_sizes_batch
 
-def load_breed_data():
-    """Load the current breed data."""
-    with open('seeder/dog_breeds_fully_corrected.json', 'r') as f:
-        return json.load(f)
+# Descriptions are size-extracted in batches of this many records
+BATCH_SIZE = 1000
+
+def load_breed_data(input_file='seeder/dog_breeds_fully_corrected.json'):
+    """Stream the current breed data one record at a time."""
+    return read_records(input_file)
 
 def extract_weight_from_description(description):
-    """Extract weight range from breed description."""
-    # Look for weight patterns like "weighs 20-30 pounds" or "20 to 30 lbs"
-    weight_patterns = [
-        r'weighs?\s*(\d+)\s*[-–]\s*(\d+)\s*pounds?',  # weighs 20-30 pounds
-        r'(\d+)\s*[-–]\s*(\d+)\s*pounds?',             # 20-30 pounds
-        r'(\d+)\s*to\s*(\d+)\s*pounds?',                # 20 to 30 pounds
-        r'(\d+)\s*[-–]\s*(\d+)\s*lbs?',                 # 20-30 lbs
-        r'(\d+)\s*to\s*(\d+)\s*lbs?',                   # 20 to 30 lbs
-        r'(\d+)\s*pounds?',                              # 20 pounds (single weight)
-        r'(\d+)\s*lbs?',                                 # 20 lbs (single weight)
-    ]
-    
-    for pattern in weight_patterns:
-        matches = re.findall(pattern, description, re.IGNORECASE)
-        if matches:
-            if len(matches[0]) == 2:  # Range like 20-30
-                try:
-                    min_weight = int(matches[0][0])
-                    max_weight = int(matches[0][1])
-                    return min_weight, max_weight
-                except ValueError:
-                    continue
-            elif len(matches[0]) == 1:  # Single weight like 20
-                try:
-                    weight = int(matches[0])
-                    return weight, weight
-                except ValueError:
-                    continue
-    
-    return None, None
+    """Extract weight range (in pounds) from breed description."""
+    weight = extract_sizes(description).weight_lb
+    return weight if weight else (None, None)
 
+@instrumented('classify_size_by_weight')
 def classify_size_by_weight(min_weight, max_weight):
     """Classify size based on weight range."""
     if min_weight is None or max_weight is None:
@@ -68,12 +45,47 @@ def classify_size_by_weight(min_weight, max_weight):
     else:
         return "Giant"
 
-def fix_sizes_by_weight():
+def correct_sizes(breeds, stats):
+    """Yield each breed with its size re-derived from weight; counts go into `stats`."""
+    for batch in chunked(breeds, BATCH_SIZE):
+        # Extract weights for the whole batch in one pass
+        sizes = extract_sizes_batch(breed.get('description', '') for breed in batch)
+        
+        for breed, size_info in zip(batch, sizes):
+            breed_name = breed['breed']
+            old_size = breed['size']
+            min_weight, max_weight = size_info.weight_lb or (None, None)
+            
+            if min_weight is not None and max_weight is not None:
+                new_size = classify_size_by_weight(min_weight, max_weight)
+                
+                if old_size != new_size:
+                    print(f"🔧 Fixing {breed_name}: {old_size} → {new_size} (Weight: {min_weight}-{max_weight} lbs)")
+                    breed['size'] = new_size
+                    stats['changes_made'] += 1
+                else:
+                    print(f"✅ {breed_name}: Already correct ({new_size}) - Weight: {min_weight}-{max_weight} lbs")
+            else:
+                # For breeds without clear weight info, use breed-specific knowledge
+                new_size = get_size_from_breed_knowledge(breed_name, old_size)
+                if new_size != old_size:
+                    print(f"🔧 Fixing {breed_name}: {old_size} → {new_size} (Based on breed knowledge)")
+                    breed['size'] = new_size
+                    stats['changes_made'] += 1
+                else:
+                    print(f"✅ {breed_name}: Using existing size ({old_size}) - No weight info found")
+            
+            # Track size distribution
+            current_size = breed['size']
+            stats['size_distribution'][current_size] = stats['size_distribution'].get(current_size, 0) + 1
+            yield breed
+
+@instrumented('fix_sizes_by_weight')
+def fix_sizes_by_weight(input_file='seeder/dog_breeds_fully_corrected.json',
+                        output_file='seeder/dog_breeds_weight_corrected.json'):
     """Fix all breed size classifications based on weight."""
-    breeds = load_breed_data()
-    
     print(f"🔍 Fixing size classifications based on weight standards...")
-    print(f"📊 Found {len(breeds)} breeds to review")
+    print(f"📊 Streaming breeds from {input_file}")
     
     # Define the correct weight standards
     weight_standards = {
@@ -88,54 +100,21 @@ def fix_sizes_by_weight():
     for size, standard in weight_standards.items():
         print(f"   {size}: {standard}")
     
-    changes_made = 0
-    size_distribution = {}
+    stats = {'changes_made': 0, 'size_distribution': {}}
     
-    for breed in breeds:
-        breed_name = breed['breed']
-        old_size = breed['size']
-        description = breed.get('description', '')
-        
-        # Extract weight from description
-        min_weight, max_weight = extract_weight_from_description(description)
-        
-        if min_weight is not None and max_weight is not None:
-            new_size = classify_size_by_weight(min_weight, max_weight)
-            
-            if old_size != new_size:
-                print(f"🔧 Fixing {breed_name}: {old_size} → {new_size} (Weight: {min_weight}-{max_weight} lbs)")
-                breed['size'] = new_size
-                changes_made += 1
-            else:
-                print(f"✅ {breed_name}: Already correct ({new_size}) - Weight: {min_weight}-{max_weight} lbs")
-        else:
-            # For breeds without clear weight info, use breed-specific knowledge
-            new_size = get_size_from_breed_knowledge(breed_name, old_size)
-            if new_size != old_size:
-                print(f"🔧 Fixing {breed_name}: {old_size} → {new_size} (Based on breed knowledge)")
-                breed['size'] = new_size
-                changes_made += 1
-            else:
-                print(f"✅ {breed_name}: Using existing size ({old_size}) - No weight info found")
-        
-        # Track size distribution
-        current_size = breed['size']
-        size_distribution[current_size] = size_distribution.get(current_size, 0) + 1
+    # Corrected records are written as soon as each batch is processed
+    total = write_records(output_file, correct_sizes(load_breed_data(input_file), stats))
+    size_distribution = stats['size_distribution']
     
     print(f"\n📊 Summary:")
-    print(f"   Total breeds reviewed: {len(breeds)}")
-    print(f"   Changes made: {changes_made}")
+    print(f"   Total breeds reviewed: {total}")
+    print(f"   Changes made: {stats['changes_made']}")
     
     print(f"\n📏 Final size distribution:")
     for size in ['Toy', 'Small', 'Medium', 'Large', 'Giant']:
         count = size_distribution.get(size, 0)
         print(f"   {size}: {count} breeds")
     
-    # Save corrected data
-    output_file = 'seeder/dog_breeds_weight_corrected.json'
-    with open(output_file, 'w') as f:
-        json.dump(breeds, f, indent=2)
-    
     print(f"\n💾 Corrected data saved to: {output_file}")
     
     return output_file
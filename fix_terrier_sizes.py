@@ -6,11 +6,15 @@ This script corrects breeds that are incorrectly labeled as small when they shou
 
 import json
 
-def fix_terrier_sizes():
+from instrumentation import instrumented
+
+@instrumented('fix_terrier_sizes')
+def fix_terrier_sizes(input_file='seeder/dog_breeds_sizes_fixed.json',
+                      output_file='seeder/dog_breeds_all_sizes_fixed.json'):
     """Fix incorrect size classifications for terrier breeds and pit bulls."""
     
     # Load the breed data
-    with open('seeder/dog_breeds_sizes_fixed.json', 'r') as f:
+    with open(input_file, 'r') as f:
         breeds = json.load(f)
     
     print(f"🔍 Loaded {len(breeds)} breeds")
@@ -99,7 +103,6 @@ def fix_terrier_sizes():
     print(f"   Pit Bull/Staffordshire fixes: {pit_bull_fixes}")
     
     # Save the corrected data
-    output_file = 'seeder/dog_breeds_all_sizes_fixed.json'
     with open(output_file, 'w') as f:
         json.dump(breeds, f, indent=2)
     
@@ -4,67 +4,37 @@ Identify which dog breeds don't have corresponding images.
 This script checks the breed data against the actual image files.
 """
 
-import json
-import os
 from pathlib import Path
 
-def load_breed_data():
-    """Load the current breed data."""
-    with open('seeder/dog_breeds_fully_corrected.json', 'r') as f:
-        return json.load(f)
+from image_manifest import IMAGE_DIR, build_manifest, clean_name, resolve_images
+from record_stream import read_records
 
-def get_existing_images():
-    """Get list of existing image files in the assets folder."""
-    assets_path = Path('assets/images/breeds')
-    
-    if not assets_path.exists():
-        print(f"❌ Assets folder not found: {assets_path}")
-        return set()
-    
-    # Get all image files
-    image_files = set()
-    for ext in ['*.png', '*.jpg', '*.jpeg']:
-        for img_file in assets_path.glob(ext):
-            # Remove extension and convert to lowercase for comparison
-            filename = img_file.stem.lower().replace('_', ' ').replace('-', ' ')
-            image_files.add(filename)
+def load_breed_data(input_file='seeder/dog_breeds_fully_corrected.json'):
+    """Stream the current breed data one record at a time."""
+    return read_records(input_file)
+
+def get_existing_images(image_dir=IMAGE_DIR):
+    """Get the image manifest for the folder the app requires images from."""
+    if not Path(image_dir).exists():
+        print(f"❌ Assets folder not found: {image_dir}")
+        return {}
     
-    return image_files
+    # Only headers of new or changed files are read; the rest come from the manifest cache
+    return build_manifest(image_dir)
 
 def identify_missing_images():
     """Identify breeds without images."""
-    breeds = load_breed_data()
     existing_images = get_existing_images()
     
-    print(f"🔍 Analyzing {len(breeds)} breeds for missing images...")
+    print(f"🔍 Analyzing breeds for missing images...")
     print(f"📁 Found {len(existing_images)} existing images")
     
-    missing_images = []
-    has_images = []
+    breeds = list(load_breed_data())
+    total_breeds = len(breeds)
     
-    for breed in breeds:
-        breed_name = breed['breed']
-        image_filename = breed.get('image_filename', '')
-        
-        # Check if breed has an image file
-        if image_filename:
-            # Remove extension and convert to lowercase for comparison
-            clean_filename = image_filename.lower().replace('_', ' ').replace('-', ' ').replace('.jpg', '').replace('.png', '').replace('.jpeg', '')
-            
-            if clean_filename in existing_images:
-                has_images.append(breed_name)
-            else:
-                missing_images.append({
-                    'breed': breed_name,
-                    'expected_image': image_filename,
-                    'clean_name': clean_filename
-                })
-        else:
-            missing_images.append({
-                'breed': breed_name,
-                'expected_image': 'NO_IMAGE_FILENAME',
-                'clean_name': breed_name.lower()
-            })
+    # Same resolution the generated utils/breedImages.ts uses
+    resolved, missing_images = resolve_images(breeds, existing_images)
+    has_images = [breed['breed'] for breed in breeds if breed['breed'] in resolved]
     
     print(f"\n📊 Results:")
     print(f"   ✅ Breeds with images: {len(has_images)}")
@@ -83,7 +53,7 @@ def identify_missing_images():
     
     # Show some examples of existing images for reference
     print(f"\n📸 Sample of existing images:")
-    sample_images = list(existing_images)[:10]
+    sample_images = [clean_name(name) for name in sorted(existing_images)[:10]]
     for img in sample_images:
         print(f"   ✅ {img}")
     
@@ -92,17 +62,17 @@ def identify_missing_images():
     
     # Generate a summary report
     print(f"\n📋 Summary Report:")
-    print(f"   Total breeds: {len(breeds)}")
-    print(f"   Breeds with images: {len(has_images)} ({len(has_images)/len(breeds)*100:.1f}%)")
-    print(f"   Breeds missing images: {len(missing_images)} ({len(missing_images)/len(breeds)*100:.1f}%)")
+    print(f"   Total breeds: {total_breeds}")
+    print(f"   Breeds with images: {len(has_images)} ({len(has_images)/total_breeds*100:.1f}%)")
+    print(f"   Breeds missing images: {len(missing_images)} ({len(missing_images)/total_breeds*100:.1f}%)")
     
     # Save detailed report to file
     report_file = 'missing_images_report.md'
     with open(report_file, 'w') as f:
         f.write("# 🚫 Missing Dog Breed Images Report\n\n")
-        f.write(f"**Total Breeds**: {len(breeds)}\n")
-        f.write(f"**Breeds with Images**: {len(has_images)} ({len(has_images)/len(breeds)*100:.1f}%)\n")
-        f.write(f"**Breeds Missing Images**: {len(missing_images)} ({len(missing_images)/len(breeds)*100:.1f}%)\n\n")
+        f.write(f"**Total Breeds**: {total_breeds}\n")
+        f.write(f"**Breeds with Images**: {len(has_images)} ({len(has_images)/total_breeds*100:.1f}%)\n")
+        f.write(f"**Breeds Missing Images**: {len(missing_images)} ({len(missing_images)/total_breeds*100:.1f}%)\n\n")
         
         f.write("## ❌ Breeds Missing Images:\n\n")
         f.write("| Breed Name | Expected Image | Clean Name |\n")
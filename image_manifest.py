@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Header-only image manifest for the bundled breed images.
+Reads just the PNG/JPEG headers (format, dimensions) plus the byte size and a
+content hash for each image, caching entries by mtime/size so a warm run only
+stats the files. utils/breedImages.ts and the missing-image report are both
+generated from this one manifest.
+
+Usage:
+    python image_manifest.py                 # refresh manifest, regenerate breedImages.ts
+    python image_manifest.py --check         # exit non-zero if breedImages.ts is out of date
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import unicodedata
+from typing import Dict, Iterable, Optional, Tuple
+
+from record_stream import read_records
+
+IMAGE_DIR = 'assets/images/breeds_resized'
+MANIFEST_NAME = '.image_manifest.json'   # Kept inside the directory it describes
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+BREED_IMAGES_TS = 'utils/breedImages.ts'
+REQUIRE_PREFIX = '@/assets/images/breeds_resized'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG start-of-frame markers carry the dimensions (C4, C8 and CC are not frames)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# Breeds with more than one candidate image where we picked a specific one
+IMAGE_OVERRIDES = {
+    'German Shepherd': 'german_shepherd_dog.png',
+    'Plott Hound': 'plott.png',
+}
+
+BREED_IMAGES_FOOTER = """
+// Function to get breed image with error handling
+export const getBreedImage = (imageFilename: string, breedName: string) => {
+  if (!breedName) return null;
+
+  // Convert breed name to lowercase for case-insensitive lookup
+  const breedKey = breedName.toLowerCase();
+  const image = breedImages[breedKey];
+
+  if (!image) {
+    // console.log(`Image not found for breed: "${breedName}" (key: "${breedKey}")`);
+    return null;
+  }
+
+  return image;
+};
+"""
+
+
+def read_image_header(path: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """(format, width, height) from the file header without decoding pixels."""
+    with open(path, 'rb') as f:
+        head = f.read(26)
+        if head.startswith(PNG_SIGNATURE) and head[12:16] == b'IHDR':
+            width, height = struct.unpack('>II', head[16:24])
+            return 'png', width, height
+
+        if head.startswith(b'\xff\xd8'):
+            # Walk the JPEG segments until we reach a start-of-frame marker
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue  # Markers without a length field
+                length_bytes = f.read(2)
+                if len(length_bytes) < 2:
+                    break
+                length = struct.unpack('>H', length_bytes)[0]
+                if marker[1] in JPEG_SOF_MARKERS:
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return 'jpeg', width, height
+                f.seek(length - 2, os.SEEK_CUR)
+            return 'jpeg', None, None
+
+    return None, None, None
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_file_for(image_dir: str = IMAGE_DIR) -> str:
+    return os.path.join(image_dir, MANIFEST_NAME)
+
+
+def load_manifest(image_dir: str = IMAGE_DIR, manifest_file: Optional[str] = None) -> Dict[str, Dict]:
+    manifest_file = manifest_file or manifest_file_for(image_dir)
+    if not os.path.exists(manifest_file):
+        return {}
+    with open(manifest_file, 'r') as f:
+        return json.load(f)
+
+
+def build_manifest(image_dir: str = IMAGE_DIR, manifest_file: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Refresh the manifest of one image directory; only files whose mtime or size
+    changed are re-read. Each directory has its own manifest file, so scanning
+    another directory never reuses or overwrites these entries.
+    """
+    manifest_file = manifest_file or manifest_file_for(image_dir)
+    previous = load_manifest(image_dir, manifest_file)
+    manifest = {}
+    refreshed = 0
+
+    with os.scandir(image_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            stat = entry.stat()
+            cached = previous.get(entry.name)
+            if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['bytes'] == stat.st_size:
+                manifest[entry.name] = cached
+                continue
+
+            image_format, width, height = read_image_header(entry.path)
+            manifest[entry.name] = {
+                'format': image_format,
+                'width': width,
+                'height': height,
+                'bytes': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': hash_file(entry.path),
+            }
+            refreshed += 1
+
+    if refreshed or manifest.keys() != previous.keys():
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"📁 Manifest: {len(manifest)} images ({refreshed} re-read)")
+    return manifest
+
+
+def clean_name(filename: str) -> str:
+    """
+    Extension-less, lowercase name with _ and - as spaces, accents stripped and
+    apostrophes dropped (how the scripts compare names), so "Cirneco dell’Etna"
+    matches cirneco_delletna.png.
+    """
+    stem = unicodedata.normalize('NFKD', os.path.splitext(filename)[0])
+    stem = ''.join(char for char in stem if not unicodedata.combining(char))
+    return stem.lower().replace('_', ' ').replace('-', ' ').replace("'", '').replace('\u2019', '')
+
+
+class ImageResolver:
+    """
+    Matches breeds to image files in a manifest.
+    Uses IMAGE_OVERRIDES first, then the record's image_filename (ignoring
+    extension), then the breed name, then a unique file whose name extends it
+    or that it extends (e.g. the data's german_shepherd.jpg -> german_shepherd_dog.png).
+    """
+
+    def __init__(self, manifest: Dict[str, Dict]):
+        self.manifest = manifest
+        self.by_clean_name = {clean_name(name): name for name in manifest}
+
+    def resolve(self, breed: Dict) -> Optional[str]:
+        """Image file for a breed record, or None if it has none."""
+        match = IMAGE_OVERRIDES.get(breed['breed'])
+        if match in self.manifest:
+            return match
+
+        candidates = [clean_name(breed.get('image_filename', '')), clean_name(breed['breed'])]
+        for candidate in candidates:
+            if candidate in self.by_clean_name:
+                return self.by_clean_name[candidate]
+
+        for candidate in filter(None, candidates):
+            related = [name for clean, name in self.by_clean_name.items()
+                       if clean.startswith(candidate + ' ') or candidate.startswith(clean + ' ')]
+            if len(related) == 1:
+                return related[0]
+        return None
+
+
+def resolve_images(breeds: Iterable[Dict], manifest: Dict[str, Dict]) -> Tuple[Dict[str, str], list]:
+    """Resolve every breed's image; returns ({breed: file}, missing)."""
+    resolver = ImageResolver(manifest)
+    resolved = {}
+    missing = []
+
+    for breed in breeds:
+        match = resolver.resolve(breed)
+        if match is None:
+            image_filename = breed.get('image_filename', '')
+            missing.append({
+                'breed': breed['breed'],
+                'expected_image': image_filename or 'NO_IMAGE_FILENAME',
+                'clean_name': clean_name(image_filename) or breed['breed'].lower(),
+            })
+        else:
+            resolved[breed['breed']] = match
+
+    return resolved, missing
+
+
+def render_breed_images_ts(resolved: Dict[str, str]) -> str:
+    lines = [
+        "// Generated by image_manifest.py from the breed data and image manifest - do not edit by hand",
+        "// Shared breed images mapping - only includes breeds that actually exist in the data",
+        "export const breedImages: { [key: string]: any } = {",
+    ]
+    for breed_name in sorted(resolved, key=str.lower):
+        key = breed_name.lower().replace("'", "\\'")
+        lines.append(f"  '{key}': require('{REQUIRE_PREFIX}/{resolved[breed_name]}'),")
+    lines.append("};")
+    return '\n'.join(lines) + '\n' + BREED_IMAGES_FOOTER
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the image manifest and breedImages.ts.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--check', action='store_true', help="only check breedImages.ts is up to date")
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    resolved, missing = resolve_images(read_records(args.data), manifest)
+    rendered = render_breed_images_ts(resolved)
+
+    current = open(BREED_IMAGES_TS, 'r').read() if os.path.exists(BREED_IMAGES_TS) else ''
+    print(f"🐕 {len(resolved)} breeds have images, {len(missing)} missing")
+    for item in missing:
+        print(f"   ❌ {item['breed']} (expected {item['expected_image']})")
+
+    if args.check:
+        if current != rendered:
+            print(f"⚠️  {BREED_IMAGES_TS} is out of date; run python image_manifest.py")
+            sys.exit(1)
+        print(f"✅ {BREED_IMAGES_TS} is up to date")
+        return
+
+    if current != rendered:
+        with open(BREED_IMAGES_TS, 'w') as f:
+            f.write(rendered)
+        print(f"💾 Regenerated {BREED_IMAGES_TS}")
+    else:
+        print(f"✅ {BREED_IMAGES_TS} already up to date")
+
+
+if __name__ == "__main__":
+    main()
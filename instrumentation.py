@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for the data scripts.
+Functions decorated with @instrumented() record call counts, wall time and a
+per-call latency histogram; code wrapped in `with stage(name):` also records
+its tracemalloc peak and can be run under cProfile. Everything is collected
+into one JSON run report.
+
+Instrumentation is off by default and then costs one flag check per call.
+Turn it on for any script without editing it:
+
+    BREED_INSTRUMENT_REPORT=run_report.json python fix_sizes_by_weight.py
+    BREED_INSTRUMENT_REPORT=run_report.json BREED_PROFILE_STAGE=add_shelter_scores python breed_pipeline.py
+
+or from code with recorder.enable(report_file=...).
+"""
+
+import atexit
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+ENV_REPORT = 'BREED_INSTRUMENT_REPORT'    # Report path; setting it turns instrumentation on
+ENV_PROFILE = 'BREED_PROFILE_STAGE'       # Stage name to run under cProfile
+
+PROFILE_TOP_FUNCTIONS = 25
+
+
+class LatencyHistogram:
+    """Power-of-two buckets in microseconds (bucket b holds calls under 2**b us)."""
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, seconds: float):
+        micros = seconds * 1e6
+        bucket = max(0, int(micros).bit_length())
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound (seconds) of the bucket holding the given fraction of calls."""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.count,
+            'total_seconds': round(self.total, 6),
+            'mean_us': round(self.total / self.count * 1e6, 2) if self.count else None,
+            'min_us': round(self.min * 1e6, 2) if self.min is not None else None,
+            'max_us': round(self.max * 1e6, 2) if self.max is not None else None,
+            'p50_us': round(self.percentile(0.50) * 1e6, 2) if self.count else None,
+            'p95_us': round(self.percentile(0.95) * 1e6, 2) if self.count else None,
+            'p99_us': round(self.percentile(0.99) * 1e6, 2) if self.count else None,
+            'histogram_us': {f"<{1 << bucket}": n for bucket, n in sorted(self.buckets.items())},
+        }
+
+
+class Recorder:
+    """Collects function and stage measurements for one run."""
+
+    def __init__(self, report_file: Optional[str] = None, profile_stage: Optional[str] = None):
+        self.enabled = False
+        self.report_file = None
+        self.profile_stage = None
+        self.functions: Dict[str, LatencyHistogram] = {}
+        self.stages: Dict[str, Dict] = {}
+        self._stage_stack: List[Dict] = []
+        self._started = time.time()
+        if report_file:
+            self.enable(report_file, profile_stage)
+
+    @classmethod
+    def from_env(cls) -> 'Recorder':
+        return cls(os.environ.get(ENV_REPORT), os.environ.get(ENV_PROFILE))
+
+    def enable(self, report_file: Optional[str] = None, profile_stage: Optional[str] = None):
+        """Start recording; the report is written to `report_file` at exit if given."""
+        if report_file and not self.report_file:
+            atexit.register(self._write_at_exit)
+        self.enabled = True
+        self.report_file = report_file or self.report_file
+        self.profile_stage = profile_stage or self.profile_stage
+
+    def _write_at_exit(self):
+        if self.enabled and self.report_file:
+            self.write_report(self.report_file)
+
+    # Function timing
+
+    def instrumented(self, name: Optional[str] = None) -> Callable:
+        """Decorator recording calls and per-call latency of a function."""
+        def decorate(func):
+            key = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram = self.functions.get(key)
+                    if histogram is None:
+                        histogram = self.functions[key] = LatencyHistogram()
+                    histogram.add(time.perf_counter() - started)
+            return wrapper
+        return decorate
+
+    # Stages
+
+    @contextmanager
+    def stage(self, name: str):
+        """Record wall time and tracemalloc peak for a block (optionally under cProfile)."""
+        if not self.enabled:
+            yield
+            return
+
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
+        elif self._stage_stack:
+            # Bank the outer stage's peak before resetting it for this one
+            outer = self._stage_stack[-1]
+            outer['peak'] = max(outer['peak'], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        frame = {'peak': 0}
+        self._stage_stack.append(frame)
+        profiler = cProfile.Profile() if name == self.profile_stage else None
+        started = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+            peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+            self._stage_stack.pop()
+            if self._stage_stack:
+                self._stage_stack[-1]['peak'] = max(self._stage_stack[-1]['peak'], peak)
+            if owns_tracing:
+                tracemalloc.stop()
+
+            entry = self.stages.setdefault(name, {'runs': 0, 'wall_seconds': 0.0, 'peak_memory_bytes': 0})
+            entry['runs'] += 1
+            entry['wall_seconds'] = round(entry['wall_seconds'] + elapsed, 6)
+            entry['peak_memory_bytes'] = max(entry['peak_memory_bytes'], peak)
+            if profiler:
+                entry['profile'] = self._save_profile(name, profiler)
+
+    def _save_profile(self, name: str, profiler: cProfile.Profile) -> Dict:
+        """Dump .prof stats next to the report and keep the top functions in the report."""
+        prof_file = f"{os.path.splitext(self.report_file or 'instrumentation')[0]}.{name}.prof"
+        profiler.dump_stats(prof_file)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+        return {'stats_file': prof_file, 'top_cumulative': text.getvalue().strip().splitlines()}
+
+    # Reporting
+
+    def report(self) -> Dict:
+        return {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._started)),
+            'wall_seconds': round(time.time() - self._started, 3),
+            'stages': self.stages,
+            'functions': {name: histogram.to_dict() for name, histogram in sorted(self.functions.items())},
+        }
+
+    def write_report(self, report_file: Optional[str] = None) -> str:
+        report_file = report_file or self.report_file or 'instrumentation_report.json'
+        with open(report_file, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"📈 Instrumentation report saved to: {report_file}")
+        return report_file
+
+    def reset(self):
+        self.functions.clear()
+        self.stages.clear()
+        self._started = time.time()
+
+
+# Process-wide recorder the scripts share
+recorder = Recorder.from_env()
+instrumented = recorder.instrumented
+stage = recorder.stage
@@ -0,0 +1,11 @@
+// Learn more https://docs.expo.dev/guides/customizing-metro
+const { getDefaultConfig } = require('expo/metro-config');
+
+const config = getDefaultConfig(__dirname);
+
+// Bundle the prebuilt SQLite database (assets/data/dogmatch.db) as an asset
+config.resolver.assetExts.push('db');
+// ... and the binary breed bundle (assets/data/breeds.bin) the app reseeds from
+config.resolver.assetExts.push('bin');
+
+module.exports = config;
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Precomputed attribute table for every two-parent mix of AKC breeds.
+A mix's expected size, energy, trainability and grooming come from the mean
+of its parents' AKC values (binned exactly like a purebred's), its kid and pet
+compatibility from the mean of the parents' temperament scores, and its role
+from the parents' roles. The whole upper triangle of parent pairs is computed
+with array operations and saved as one compressed .npz, so resolving
+"Labrador Retriever / Poodle Mix" is a dictionary lookup plus an array read.
+
+Requires numpy.
+
+Usage:
+    python mix_table.py [--akc seeder/akc-data-latest.csv] [--output seeder/build/mix_table.npz]
+    python mix_table.py --lookup "Labrador Retriever / Poodle (Standard) Mix"
+"""
+
+import argparse
+import os
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from breed_table import (AKC_FILE, ENERGY_BINS, FALLBACK_LABELS, GROOMING_BINS, SIZE_BINS,
+                         TRAINABILITY_BINS, BreedTable)
+from seeder.fix_breed_data import BreedNameIndex, determine_role, kid_friendliness, pet_friendliness
+
+MIX_TABLE_FILE = 'seeder/build/mix_table.npz'
+TABLE_FORMAT = 1
+
+KG_TO_LB = 2.20462
+CM_TO_IN = 1 / 2.54
+
+ROLE_LABELS = ('Companion', 'Guardian', 'Both')
+
+# Category columns: (AKC source column, bins, fallback label)
+CATEGORY_COLUMNS = {
+    'energy_level': ('energy_level_value', ENERGY_BINS, FALLBACK_LABELS['energy_level']),
+    'trainability': ('trainability_value', TRAINABILITY_BINS, FALLBACK_LABELS['trainability']),
+    'grooming_needs': ('grooming_frequency_value', GROOMING_BINS, FALLBACK_LABELS['grooming_needs']),
+}
+
+# "A / B Mix", "A x B", "A & B cross", "A + B"; "and" is left alone (Black and Tan Coonhound)
+PARENT_SEPARATOR = re.compile(r'\s*[/&+]\s*|\s+x\s+', re.IGNORECASE)
+MIX_SUFFIX = re.compile(r'\s+(?:mix(?:ed)?(?:\s+breed)?|cross(?:breed)?)\s*$', re.IGNORECASE)
+
+
+def pair_count(breed_count: int) -> int:
+    """Unordered parent pairs, including a breed with itself."""
+    return breed_count * (breed_count + 1) // 2
+
+
+def pair_index(i: int, j: int, breed_count: int) -> int:
+    """Row of pair (i, j) in the row-major upper triangle (order doesn't matter)."""
+    if i > j:
+        i, j = j, i
+    return i * (2 * breed_count - i + 1) // 2 + (j - i)
+
+
+def _pair_mean(values: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Mean of both parents' values; one parent's value if the other is missing."""
+    a, b = values[i], values[j]
+    return np.where(np.isnan(a), b, np.where(np.isnan(b), a, (a + b) / 2))
+
+
+def _codes(values: np.ndarray, bins) -> np.ndarray:
+    """Category codes, with NaN mapped to the fallback slot after the bins' labels."""
+    bounds, labels = bins
+    codes = BreedTable.bucket_codes(values, bounds).astype(np.uint8)
+    codes[np.isnan(values)] = len(labels)
+    return codes
+
+
+def build_arrays(table: BreedTable) -> Dict[str, np.ndarray]:
+    """Every attribute of every unordered parent pair, as flat arrays."""
+    i, j = np.triu_indices(len(table))
+    numeric = table.numeric
+    temperaments = table.text['temperament']
+    demeanors = table.text['demeanor_category']
+    groups = table.text['group']
+
+    # Per-breed scores; only these 277 calls go through the scalar rule functions
+    kid_scores = np.array([kid_friendliness(t, d) for t, d in zip(temperaments, demeanors)], dtype=np.float32)
+    pet_scores = np.array([pet_friendliness(t, d) for t, d in zip(temperaments, demeanors)], dtype=np.float32)
+    roles = np.array([ROLE_LABELS.index(determine_role(g, t)) for g, t in zip(groups, temperaments)], dtype=np.uint8)
+
+    arrays = {
+        'names': np.asarray(table.names, dtype=str),
+        'size': _codes(_pair_mean(table.average_height_inches(), i, j), SIZE_BINS),
+        # Kids default to yes on a tie, pets need a positive score (as for purebreds)
+        'good_with_kids': ((kid_scores[i] + kid_scores[j]) / 2 >= 0).astype(np.uint8),
+        'good_with_pets': ((pet_scores[i] + pet_scores[j]) / 2 > 0).astype(np.uint8),
+        'companion_or_guardian': np.where(roles[i] == roles[j], roles[i], ROLE_LABELS.index('Both')).astype(np.uint8),
+    }
+    for key, (column, bins, _) in CATEGORY_COLUMNS.items():
+        arrays[key] = _codes(_pair_mean(numeric[column], i, j), bins)
+
+    arrays['weight_lb'] = np.stack([_pair_mean(numeric['min_weight'], i, j),
+                                    _pair_mean(numeric['max_weight'], i, j)], axis=1).astype(np.float32) * KG_TO_LB
+    arrays['height_in'] = np.stack([_pair_mean(numeric['min_height'], i, j),
+                                    _pair_mean(numeric['max_height'], i, j)], axis=1).astype(np.float32) * CM_TO_IN
+    return arrays
+
+
+def build_mix_table(akc_file: str = AKC_FILE, output_file: str = MIX_TABLE_FILE) -> int:
+    """Compute and save the pairwise table; returns the number of pairs."""
+    started = time.perf_counter()
+    table = BreedTable.from_csv(akc_file)
+    arrays = build_arrays(table)
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    # np.savez appends .npz to names without it, so write through a file handle
+    temp_file = f"{output_file}.tmp"
+    with open(temp_file, 'wb') as f:
+        np.savez_compressed(f, format=np.array(TABLE_FORMAT), **arrays)
+    os.replace(temp_file, output_file)
+
+    pairs = len(arrays['size'])
+    elapsed = time.perf_counter() - started
+    print(f"🧬 Built mix table for {len(table)} breeds: {pairs:,} parent pairs in {elapsed:.2f}s "
+          f"({os.path.getsize(output_file):,} bytes) -> {output_file}")
+    return pairs
+
+
+class MixTable:
+    """Loaded pairwise table; answers mix lookups by parent names or by label."""
+
+    LABELS = {
+        'size': SIZE_BINS[1] + (FALLBACK_LABELS['size'],),
+        **{key: bins[1] + (fallback,) for key, (_, bins, fallback) in CATEGORY_COLUMNS.items()},
+        'companion_or_guardian': ROLE_LABELS,
+    }
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.names = [str(name) for name in arrays['names']]
+        self.position = {name: i for i, name in enumerate(self.names)}
+        self.name_index = BreedNameIndex({name: {'position': i} for i, name in enumerate(self.names)})
+
+    @classmethod
+    def load(cls, table_file: str = MIX_TABLE_FILE) -> 'MixTable':
+        with np.load(table_file) as data:
+            if int(data['format']) != TABLE_FORMAT:
+                raise ValueError(f"Unsupported mix table format: {int(data['format'])}")
+            return cls({key: data[key] for key in data.files if key != 'format'})
+
+    def __len__(self) -> int:
+        return len(self.arrays['size'])
+
+    def parent_position(self, name: str) -> Optional[int]:
+        """AKC position of a parent breed, by exact name or find_best_match rules."""
+        position = self.position.get(name)
+        if position is None:
+            match = self.name_index.find_best_match(name)
+            position = match['position'] if match else None
+        return position
+
+    def pair(self, i: int, j: int) -> Dict:
+        row = pair_index(i, j, len(self.names))
+        arrays = self.arrays
+        entry = {'parents': (self.names[i], self.names[j])}
+        for key, labels in self.LABELS.items():
+            entry[key] = labels[arrays[key][row]]
+        entry['good_with_kids'] = int(arrays['good_with_kids'][row])
+        entry['good_with_pets'] = int(arrays['good_with_pets'][row])
+        entry['weight_lb'] = _range(arrays['weight_lb'][row])
+        entry['height_in'] = _range(arrays['height_in'][row])
+        return entry
+
+    def lookup(self, parent_a: str, parent_b: str) -> Dict:
+        """Attributes of a mix of two AKC breeds (exact names; order doesn't matter)."""
+        return self.pair(self.position[parent_a], self.position[parent_b])
+
+    def resolve(self, label: str) -> Optional[Dict]:
+        """Attributes for a shelter-style mix label, or None if a parent isn't recognised."""
+        text = MIX_SUFFIX.sub('', label.strip())
+        parents = [part for part in PARENT_SEPARATOR.split(text) if part]
+        if not parents or len(parents) > 2:
+            return None
+
+        positions = [self.parent_position(parent) for parent in parents]
+        if None in positions:
+            return None
+        # "Beagle Mix": a mix of unknown second parent, best described by the breed itself
+        i, j = positions if len(positions) == 2 else positions * 2
+        return {'breed': label, **self.pair(i, j)}
+
+
+def _range(values: np.ndarray) -> Optional[Tuple[float, float]]:
+    if np.isnan(values).any():
+        return None
+    return round(float(values[0]), 1), round(float(values[1]), 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the mixed-breed attribute table.")
+    parser.add_argument('--akc', default=AKC_FILE, help=f"AKC data (default: {AKC_FILE})")
+    parser.add_argument('--output', default=MIX_TABLE_FILE, help=f"table file (default: {MIX_TABLE_FILE})")
+    parser.add_argument('--lookup', nargs='+', metavar='LABEL', help="resolve mix labels using an existing table")
+    args = parser.parse_args()
+
+    try:
+        if args.lookup:
+            mixes = MixTable.load(args.output)
+            for label in args.lookup:
+                entry = mixes.resolve(label)
+                print(f"🐕 {label}: {entry if entry else 'parents not recognised'}")
+        else:
+            build_mix_table(args.akc, args.output)
+    except Exception as e:
+        print(f"❌ Error with mix table: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Materialized match results for every answer combination of the app/flow
+questionnaire (size, energy, kids, pets, grooming: 5 x 4 x 3 x 3 x 4 = 720).
+Like findBestMatches, each combination ranks every visible breed, keeps only
+the answered size and drops breeds under the matcher's score cutoff; the rest
+are ordered by breed_ranking's soft score and the top RESULT_LIMIT stored.
+"No" to kids or pets asks for nothing, so only "Yes" counts as an answer.
+A list shorter than MIN_RESULTS is topped up from the cheapest relaxations
+(widening answers to their neighbouring levels, or dropping answers, cheaper
+for low-weight questions), so the results screen is never short or empty.
+
+Identical result lists are stored once, and combinations are laid out in
+mixed-radix order of the answers, so the app finds a combination's list with
+one index computation (see utils/questionnaireResults.ts).
+
+Usage:
+    python questionnaire_results.py [--data seeder/dog_breeds_with_shelter_scores.json] [--output ...]
+"""
+
+import argparse
+import itertools
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from breed_bitmap_index import BitmapIndex, iter_bits
+from breed_ranking import DEFAULT_WEIGHTS, ORDINAL_ATTRIBUTES, BreedMatrix
+from data_versioning import version_info
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+RESULTS_FILE = 'assets/data/questionnaire_results.json'
+RESULTS_FORMAT = 1
+
+# Flow screens in order, with their options exactly as the screens offer them
+# ('Any' and null mean "not important"). Keep in sync with app/flow/*.tsx.
+FLOW_QUESTIONS = [
+    ('size', 'size', ['Toy', 'Small', 'Medium', 'Large', 'Any']),
+    ('energyLevel', 'energy_level', ['Low', 'Moderate', 'High', 'Any']),
+    ('goodWithKids', 'good_with_kids', [True, False, None]),
+    ('goodWithPets', 'good_with_pets', [True, False, None]),
+    ('groomingNeeds', 'grooming_needs', ['Low', 'Medium', 'High', 'Any']),
+]
+
+# Same visibility rules, size restriction and cutoff as findBestMatches in hooks/useBreedMatcher.ts
+HIDDEN_BREEDS = {"cirneco dell'etna"}
+MIN_SHELTER_SCORE = 3
+MATCH_CUTOFF = 35
+RESULT_LIMIT = 30
+MIN_RESULTS = 10   # Shorter lists are topped up from relaxed answers
+
+WIDEN_COST = 0.4   # Share of a question's weight lost by also accepting neighbouring levels
+
+# calculateBreedScore's points for the questions the flow never asks
+# (trainability and role 'Any', senior and special needs null), and its criteria count
+UNASKED_POINTS = 2 + 2 + 1 + 1
+CRITERIA_COUNT = 9
+
+
+def _filters(answers: Sequence) -> Dict:
+    filters = {'prioritize_adoptable': True}  # The flow always prioritizes adoptable breeds
+    for (_, attribute, _), answer in zip(FLOW_QUESTIONS, answers):
+        # 'Any', null and a "No" to kids or pets leave the question unanswered
+        if answer is not None and answer is not False and answer != 'Any':
+            filters[attribute] = [answer] if isinstance(answer, str) else answer
+    return filters
+
+
+def matcher_score(record: Dict, filters: Dict) -> int:
+    """
+    calculateBreedScore for flow answers, for findBestMatches' cutoff. Only
+    breeds of the answered size are scored, so a size answer is always a match.
+    """
+    points, penalty, perfect = 25 + UNASKED_POINTS, 0, 0
+
+    if 'size' in filters:
+        points += 15
+        perfect += 1
+    else:
+        points += 2
+
+    for attribute, unanswered, exact, near, far, far_penalty in (
+            ('energy_level', 3, 10, 6, 0, 0), ('grooming_needs', 2, 15, 5, 2, 12)):
+        if attribute not in filters:
+            points += unanswered
+            continue
+        levels = ORDINAL_ATTRIBUTES[attribute]
+        distance = abs(levels.index(filters[attribute][0]) - levels.index(record[attribute]))
+        if distance == 0:
+            points += exact
+            perfect += 1
+        elif distance == 1:
+            points += near
+        else:
+            points += far
+            penalty += far_penalty
+
+    for attribute in ('good_with_kids', 'good_with_pets'):
+        if attribute not in filters:
+            points += 2
+        elif bool(record[attribute]) == filters[attribute]:
+            points += 8
+            perfect += 1
+        else:
+            penalty += 12
+
+    ratio = perfect / CRITERIA_COUNT
+    bonus = 10 if ratio >= 0.8 else 6 if ratio >= 0.6 else 3 if ratio >= 0.4 else 0
+    score = max(0, min(100, points + bonus - penalty))
+    if 40 <= score < 70:
+        score = min(100, score + 5)
+    return score
+
+
+def _widened(attribute: str, wanted: List[str]) -> List[str]:
+    levels = ORDINAL_ATTRIBUTES[attribute]
+    codes = {levels.index(value) for value in wanted}
+    codes |= {code + step for code in codes for step in (-1, 1)}
+    return [levels[code] for code in sorted(codes) if 0 <= code < len(levels)]
+
+
+def relaxations(filters: Dict) -> List[Tuple[float, Dict, Dict]]:
+    """Every (cost, relaxed filters, description) for a profile, cheapest first."""
+    answered = [attribute for attribute in DEFAULT_WEIGHTS if attribute in filters]
+    choices = []
+    for attribute in answered:
+        options = [('keep', 0.0)]
+        if attribute in ORDINAL_ATTRIBUTES:
+            options.append(('widen', WIDEN_COST * DEFAULT_WEIGHTS[attribute]))
+        options.append(('drop', DEFAULT_WEIGHTS[attribute]))
+        choices.append(options)
+
+    candidates = []
+    for combination in itertools.product(*choices):
+        relaxed = dict(filters)
+        description = {'widened': [], 'dropped': []}
+        for attribute, (action, _) in zip(answered, combination):
+            if action == 'widen':
+                relaxed[attribute] = _widened(attribute, filters[attribute])
+                description['widened'].append(attribute)
+            elif action == 'drop':
+                del relaxed[attribute]
+                description['dropped'].append(attribute)
+        candidates.append((sum(cost for _, cost in combination), relaxed, description))
+    # Stable sort: equal costs keep product order, which tries keeping answers first
+    candidates.sort(key=lambda candidate: candidate[0])
+    return candidates
+
+
+class ResultsBuilder:
+    """Ranks the visible breeds for each combination, topping up short lists from relaxations."""
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.index = BitmapIndex.build(records)
+        self.matrix = BreedMatrix.from_records(records)
+        self.visible = [row for row, record in enumerate(records)
+                        if record['breed'].lower() not in HIDDEN_BREEDS
+                        and (record.get('shelter_availability_score') or 0) >= MIN_SHELTER_SCORE]
+        self.visible_mask = sum(1 << row for row in self.visible)
+
+    def matching_rows(self, filters: Dict) -> List[int]:
+        """Visible rows matching every filter exactly (used for relaxations)."""
+        return list(iter_bits(self.index.mask(filters) & self.visible_mask, len(self.records)))
+
+    def candidate_rows(self, filters: Dict) -> List[int]:
+        """Visible rows findBestMatches would keep: the answered size, at or over the cutoff."""
+        size = filters.get('size')
+        return [row for row in self.visible
+                if (not size or self.records[row]['size'] in size)
+                and matcher_score(self.records[row], filters) >= MATCH_CUTOFF]
+
+    def ranked(self, rows: List[int], profile: Dict) -> List[int]:
+        """Rows by soft score against the original answers."""
+        scores = self.matrix.scores(profile)
+        shelter = self.matrix.shelter_scores
+        return sorted(rows, key=lambda row: (-scores[row], -shelter[row], self.records[row]['breed']))
+
+    def shown(self, rows: List[int]) -> List[int]:
+        """Rows in order with one bulldog only (as findBestMatches shows), capped."""
+        result, bulldog_seen = [], False
+        for row in rows:
+            if 'bulldog' in self.records[row]['breed'].lower():
+                if bulldog_seen:
+                    continue
+                bulldog_seen = True
+            result.append(row)
+            if len(result) == RESULT_LIMIT:
+                break
+        return result
+
+    def results_for(self, answers: Sequence) -> Tuple[List[int], Optional[Dict]]:
+        """(ranked rows, last relaxation used to top them up, or None) for one answer combination."""
+        filters = _filters(answers)
+        rows = self.shown(self.ranked(self.candidate_rows(filters), filters))
+        relaxation = None
+        for _, relaxed, description in relaxations(filters)[1:]:
+            if len(rows) >= MIN_RESULTS:
+                break
+            extra = [row for row in self.matching_rows(relaxed) if row not in rows]
+            if extra:
+                rows = self.shown(rows + self.ranked(extra, filters))
+                relaxation = description
+        if not rows:
+            raise ValueError(f"No visible breeds at all for answers {answers}")
+        return rows, relaxation
+
+
+def build_results(input_file: str = BREED_DATA_FILE, output_file: str = RESULTS_FILE,
+                  version_file: Optional[str] = None) -> Dict:
+    """Write the results file. `input_file` may be the attributes-only JSON Lines
+    file; the dataset hash is then taken from `version_file`, the full data the
+    app's data version covers (descriptions included)."""
+    records = list(read_records(input_file))
+    builder = ResultsBuilder(records)
+
+    breed_ids: Dict[int, int] = {}     # record row -> position in the output's breed list
+    lists: Dict[Tuple[int, ...], int] = {}
+    relaxation_ids: Dict[str, int] = {'null': 0}
+    combination_lists, combination_relaxations = [], []
+
+    for answers in itertools.product(*(options for _, _, options in FLOW_QUESTIONS)):
+        rows, relaxation = builder.results_for(answers)
+        key = tuple(breed_ids.setdefault(row, len(breed_ids)) for row in rows)
+        combination_lists.append(lists.setdefault(key, len(lists)))
+        relaxation_key = json.dumps(relaxation, sort_keys=True)
+        combination_relaxations.append(relaxation_ids.setdefault(relaxation_key, len(relaxation_ids)))
+
+    breeds = [None] * len(breed_ids)
+    for row, position in breed_ids.items():
+        breeds[position] = records[row]['breed']
+
+    output = {
+        'format': RESULTS_FORMAT,
+        'dataset_hash': version_info(version_file or input_file)['dataset_hash'],
+        'questions': [{'key': key, 'options': options} for key, _, options in FLOW_QUESTIONS],
+        'breeds': breeds,
+        'lists': [list(key) for key in lists],
+        'relaxations': [json.loads(text) for text in relaxation_ids],
+        'combinations': {'list': combination_lists, 'relaxation': combination_relaxations},
+    }
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, separators=(',', ':'), ensure_ascii=False)
+        f.write('\n')
+
+    relaxed = sum(1 for relaxation in combination_relaxations if relaxation)
+    print(f"🗂️  Materialized {len(combination_lists)} answer combinations "
+          f"({relaxed} relaxed) into {len(lists)} distinct result lists")
+    print(f"💾 Saved {output_file} ({os.path.getsize(output_file):,} bytes)")
+    return output
+
+
+def lookup(results: Dict, preferences: Dict) -> Tuple[List[str], Optional[Dict]]:
+    """Python twin of getPrecomputedMatches: (breed names, relaxation) for UserPreferences."""
+    index = 0
+    for question in results['questions']:
+        options = question['options']
+        index = index * len(options) + options.index(preferences.get(question['key']))
+    names = [results['breeds'][i] for i in results['lists'][results['combinations']['list'][index]]]
+    return names, results['relaxations'][results['combinations']['relaxation'][index]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Materialize questionnaire results for every answer combination.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--output', default=RESULTS_FILE, help=f"results file (default: {RESULTS_FILE})")
+    args = parser.parse_args()
+
+    try:
+        build_results(args.data, args.output)
+    except Exception as e:
+        print(f"❌ Error materializing questionnaire results: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Streaming record I/O for the breed data scripts.
+Reads breed records one at a time from a JSON array or JSON Lines file and
+writes them back out as they are produced, so a stage can be written as a
+generator and a multi-gigabyte export flows through in constant memory.
+
+JSON array output matches json.dump(records, f, indent=2) byte for byte, so
+switching a script to streaming doesn't change its snapshot files.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+CHUNK_SIZE = 1 << 16
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
+_decoder = json.JSONDecoder()
+
+
+def detect_format(path: str) -> str:
+    """'jsonl' for JSON Lines files, 'array' for a top-level JSON array."""
+    if path.endswith(JSON_LINES_EXTENSIONS):
+        return 'jsonl'
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            ch = f.read(1)
+            if not ch or not ch.isspace():
+                break
+    return 'array' if ch == '[' else 'jsonl'
+
+
+def _read_json_lines(f) -> Iterator[Dict]:
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _read_json_array(f) -> Iterator[Dict]:
+    """Incrementally decode the elements of a top-level JSON array."""
+    buffer = ''
+    position = 0
+    eof = False
+    started = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    while True:
+        # Skip whitespace and separators
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or (started and buffer[position] == ',')):
+                position += 1
+            if position < len(buffer) or not fill():
+                break
+
+        if position >= len(buffer):
+            raise ValueError("Unexpected end of file in JSON array")
+
+        if not started:
+            if buffer[position] != '[':
+                raise ValueError("Expected a JSON array")
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        while True:
+            try:
+                record, end = _decoder.raw_decode(buffer, position)
+                # A value touching the end of the buffer may be cut short; read more first
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            if not fill():
+                record, end = _decoder.raw_decode(buffer, position)
+                break
+
+        position = end
+        yield record
+
+
+def read_records(path: str) -> Iterator[Dict]:
+    """Yield records from a JSON array or JSON Lines file one at a time."""
+    fmt = detect_format(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _read_json_lines(f) if fmt == 'jsonl' else _read_json_array(f)
+        yield from reader
+
+
+class RecordWriter:
+    """
+    Writes records incrementally. Output goes to a temporary file that replaces
+    `path` on close, so a stage can safely read and write the same file.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, ensure_ascii: bool = True):
+        self.path = path
+        self.fmt = fmt or ('jsonl' if path.endswith(JSON_LINES_EXTENSIONS) else 'array')
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        self.temp_path = f"{path}.tmp"
+        self.file = open(self.temp_path, 'w', encoding='utf-8')
+
+    def write(self, record: Dict):
+        if self.fmt == 'jsonl':
+            self.file.write(json.dumps(record, ensure_ascii=self.ensure_ascii))
+            self.file.write('\n')
+        else:
+            body = json.dumps(record, indent=2, ensure_ascii=self.ensure_ascii).replace('\n', '\n  ')
+            self.file.write(('[\n  ' if self.count == 0 else ',\n  ') + body)
+        self.count += 1
+
+    def close(self):
+        if self.fmt == 'array':
+            self.file.write('\n]' if self.count else '[]')
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self):
+        self.file.close()
+        os.remove(self.temp_path)
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_records(path: str, records: Iterable[Dict], fmt: Optional[str] = None,
+                  ensure_ascii: bool = True) -> int:
+    """Stream `records` to `path`; returns how many were written."""
+    with RecordWriter(path, fmt, ensure_ascii) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+
+def chunked(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Group a record stream into lists of at most `size` records."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -5,8 +5,16 @@ This script adds a shelter_availability_score field to each breed based on
 how commonly they are found in shelters and rescues.
 """
 
-import json
 import os
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# record_stream lives at the repo root, one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from instrumentation import instrumented
+from record_stream import read_records, write_records
 
 # Shelter availability scores (1-10) for breeds
 # Higher scores = more commonly available in shelters
@@ -24,8 +32,8 @@ SHELTER_SCORES = {
     "scottish terrier": 9, "cairn terrier": 9, "norwich terrier": 9, "norfolk terrier": 9,
     "border terrier": 9, "welsh terrier": 9, "irish terrier": 9,
     "australian terrier": 9, "silky terrier": 9, "tibetan terrier": 9,
-    # Yorkie mixes (extremely common in shelters)
-    "yorkipoo": 9, "morkie": 9, "shorkie": 9, "yorkie mix": 9, "yorkshire mix": 9,
+    # Yorkie mixes (extremely common in shelters; yorkipoo, morkie and shorkie are listed above)
+    "yorkie mix": 9, "yorkshire mix": 9,
     
     # Score 8: Common in shelters
     "golden retriever": 8, "border collie": 8, "australian cattle dog": 8, 
@@ -57,77 +65,148 @@ SHELTER_SCORES = {
     "lapphund": 1, "vallhund": 1, "swedish lapphund": 1, "norwegian lundehund": 1
 }
 
+# Fallback rules checked after an exact miss, in order: (substrings, score)
+NAME_RULES = [
+    (('doodle', 'poo', 'mix'), 9),        # Most doodles and mixes are very common in shelters
+    (('terrier',), 8),                    # Most terriers are common in shelters
+    (('yorkie', 'yorkshire', 'york'), 9), # Yorkies and Yorkie mixes are extremely common in shelters
+]
+DEFAULT_SCORE = 5  # Breeds not in our research
+CACHE_SIZE = 65536
+
+class ShelterScoreResolver:
+    """
+    Shelter scores compiled once from a score table.
+    Resolution order: exact match, the NAME_RULES, then the first table key
+    (in table order) that appears in the name or contains it, then
+    DEFAULT_SCORE. The partial step uses an Aho-Corasick automaton over the keys
+    (key in name) and a precomputed substring table (name in key), so a lookup
+    is linear in the name length instead of the table size. Results are kept in
+    a bounded LRU cache, since intake labels repeat heavily.
+    """
+    
+    def __init__(self, scores: Dict[str, int] = SHELTER_SCORES, cache_size: int = CACHE_SIZE):
+        self.scores = dict(scores)
+        keys = list(self.scores)
+        
+        # Every substring of every key -> position of the first key containing it
+        self.contained_in = {}
+        for position, key in enumerate(keys):
+            for start in range(len(key) + 1):
+                for end in range(start, len(key) + 1):
+                    self.contained_in.setdefault(key[start:end], position)
+        
+        self._build_automaton(keys)
+        self.keys = keys
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+    
+    def _build_automaton(self, keys: List[str]):
+        """Aho-Corasick goto/fail tables; best[state] is the earliest key ending there."""
+        goto = [{}]
+        best = [None]
+        for position, key in enumerate(keys):
+            state = 0
+            for ch in key:
+                if ch not in goto[state]:
+                    goto[state][ch] = len(goto)
+                    goto.append({})
+                    best.append(None)
+                state = goto[state][ch]
+            if best[state] is None:
+                best[state] = position
+        
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # Inherit matches that end here via the failure chain
+            inherited = best[fail[state]]
+            if inherited is not None and (best[state] is None or inherited < best[state]):
+                best[state] = inherited
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[child] = target if target != child else 0
+        
+        self.goto, self.fail, self.best = goto, fail, best
+    
+    def _first_key_in(self, text: str) -> Optional[int]:
+        """Table position of the earliest key occurring in `text`."""
+        goto, fail, best = self.goto, self.fail, self.best
+        state = 0
+        found = None
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if best[state] is not None and (found is None or best[state] < found):
+                found = best[state]
+        return found
+    
+    def _resolve(self, breed_name: str) -> int:
+        breed_lower = breed_name.lower().strip()
+        
+        if breed_lower in self.scores:
+            return self.scores[breed_lower]
+        
+        for substrings, score in NAME_RULES:
+            if any(substring in breed_lower for substring in substrings):
+                return score
+        
+        candidates = [p for p in (self._first_key_in(breed_lower), self.contained_in.get(breed_lower)) if p is not None]
+        if candidates:
+            return self.scores[self.keys[min(candidates)]]
+        
+        return DEFAULT_SCORE
+
+_resolver = ShelterScoreResolver()
+
+@instrumented('get_shelter_score')
 def get_shelter_score(breed_name):
     """Get shelter availability score for a breed."""
-    breed_lower = breed_name.lower().strip()
-    
-    # Check exact match first
-    if breed_lower in SHELTER_SCORES:
-        return SHELTER_SCORES[breed_lower]
-    
-    # Special handling for doodles and terrier mixes
-    if any(doodle in breed_lower for doodle in ['doodle', 'poo', 'mix']):
-        return 9  # Most doodles and mixes are very common in shelters
-    
-    # Check for terrier variations
-    if 'terrier' in breed_lower:
-        # Most terriers are common in shelters
-        return 8
-    
-    # Check for Yorkie variations (very common in shelters)
-    if any(yorkie in breed_lower for yorkie in ['yorkie', 'yorkshire', 'york']):
-        return 9  # Yorkies and Yorkie mixes are extremely common in shelters
-    
-    # Check partial matches for variations
-    for key, score in SHELTER_SCORES.items():
-        if key in breed_lower or breed_lower in key:
-            return score
-    
-    # Default score for breeds not in our research
-    return 5
+    return _resolver.resolve(breed_name)
+
+def score_breeds(breeds):
+    """Yield each breed record with its shelter_availability_score added."""
+    for breed in breeds:
+        breed['shelter_availability_score'] = get_shelter_score(breed['breed'])
+        yield breed
 
-def add_shelter_scores():
+def add_shelter_scores(input_file="dog_breeds_corrected.json",
+                       output_file="dog_breeds_with_shelter_scores.json"):
     """Add shelter availability scores to breed data."""
     
-    # Load existing breed data
-    input_file = "dog_breeds_corrected.json"
-    output_file = "dog_breeds_with_shelter_scores.json"
-    
     if not os.path.exists(input_file):
         print(f"❌ Input file {input_file} not found!")
         return
     
-    print(f"📖 Loading breed data from {input_file}...")
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        breeds = json.load(f)
+    print(f"📖 Streaming breed data from {input_file}...")
     
-    print(f"🐕 Found {len(breeds)} breeds to process")
+    samples = []
+    score_counts = {}
     
-    # Add shelter scores to each breed
-    updated_breeds = []
-    for breed in breeds:
-        breed_copy = breed.copy()
-        breed_copy['shelter_availability_score'] = get_shelter_score(breed['breed'])
-        updated_breeds.append(breed_copy)
+    def track(breeds):
+        """Collect samples and the score distribution as records stream past."""
+        for breed in breeds:
+            score = breed['shelter_availability_score']
+            if len(samples) < 10:
+                samples.append((breed['breed'], score))
+            score_counts[score] = score_counts.get(score, 0) + 1
+            yield breed
     
-    # Save updated data
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(updated_breeds, f, indent=2, ensure_ascii=False)
+    # Records are scored and written one at a time
+    count = write_records(output_file, track(score_breeds(read_records(input_file))), ensure_ascii=False)
     
+    print(f"🐕 Processed {count} breeds")
     print(f"✅ Updated breed data saved to {output_file}")
     
     # Show some examples
     print("\n📊 Sample breeds with shelter scores:")
-    for breed in updated_breeds[:10]:
-        score = breed['shelter_availability_score']
-        print(f"  {breed['breed']}: Score {score}")
-    
-    # Count by score
-    score_counts = {}
-    for breed in updated_breeds:
-        score = breed['shelter_availability_score']
-        score_counts[score] = score_counts.get(score, 0) + 1
+    for breed_name, score in samples:
+        print(f"  {breed_name}: Score {score}")
     
     print("\n📈 Score distribution:")
     for score in sorted(score_counts.keys()):
@@ -6,23 +6,33 @@ with accurate data from the AKC dataset.
 
 import json
 import csv
+import os
 import re
+import sys
 from typing import Dict, List, Optional
 
-def load_corrupted_breeds() -> List[str]:
+# instrumentation lives at the repo root, one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from instrumentation import instrumented
+
+def load_corrupted_breeds(input_file: str = 'dog_breeds_cleaned_real.json') -> List[str]:
     """Extract breed names from the corrupted dataset (names are correct)."""
-    with open('dog_breeds_cleaned_real.json', 'r') as f:
-        corrupted_data = json.load(f)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        if input_file.endswith('.txt'):
+            # Plain list of names, one per line (e.g. breed_names.txt)
+            breed_names = [line.strip() for line in f if line.strip()]
+        else:
+            corrupted_data = json.load(f)
+            breed_names = [breed['breed'] for breed in corrupted_data]
     
-    breed_names = [breed['breed'] for breed in corrupted_data]
     print(f"Found {len(breed_names)} breed names in corrupted dataset")
     return breed_names
 
-def load_akc_data() -> Dict[str, Dict]:
+def load_akc_data(akc_file: str = 'akc-data-latest.csv') -> Dict[str, Dict]:
     """Load and parse the AKC dataset."""
     akc_breeds = {}
     
-    with open('akc-data-latest.csv', 'r', encoding='utf-8') as f:
+    with open(akc_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             breed_name = row[''].strip()  # First column is breed name
@@ -79,6 +89,119 @@ def find_best_match(target_breed: str, akc_breeds: Dict[str, Dict]) -> Optional[
     
     return best_match
 
+class BreedNameIndex:
+    """
+    Prebuilt inverted index over AKC breed names.
+    Gives the same answers as find_best_match (exact → substring → ≥50% word
+    overlap, first breed in AKC order wins ties) but only scores the breeds
+    that share n-grams or words with the target instead of the whole registry.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, akc_breeds: Dict[str, Dict]):
+        self.akc_breeds = akc_breeds
+        self.names = list(akc_breeds)
+        self.lowered = [name.lower() for name in self.names]
+        self.first_position = {}  # lowercase name -> first position in AKC order
+        self.name_lengths = set()
+        self.grams = {}           # n-gram -> ascending positions of names containing it
+        self.words = {}           # (word, word count) -> ascending positions
+        self.word_sets = []
+
+        for position, name in enumerate(self.lowered):
+            self.first_position.setdefault(name, position)
+            self.name_lengths.add(len(name))
+
+            for gram in self._name_grams(name):
+                self.grams.setdefault(gram, []).append(position)
+
+            words = set(name.split())
+            self.word_sets.append(words)
+            for word in words:
+                self.words.setdefault((word, len(words)), []).append(position)
+
+    def _name_grams(self, name: str) -> set:
+        """All substrings of length 1..NGRAM, so short queries can be looked up too."""
+        return {name[i:i + n] for n in range(1, self.NGRAM + 1) for i in range(len(name) - n + 1)}
+
+    def _query_grams(self, text: str) -> set:
+        if len(text) < self.NGRAM:
+            return {text}
+        return {text[i:i + self.NGRAM] for i in range(len(text) - self.NGRAM + 1)}
+
+    def _substring_position(self, target: str) -> Optional[int]:
+        """First AKC position where the name contains the target or vice versa."""
+        if not target:
+            return 0 if self.names else None
+
+        # AKC names that are substrings of the target: look up each substring
+        best = None
+        for length in range(len(target) + 1):
+            if length not in self.name_lengths:
+                continue
+            for start in range(len(target) - length + 1):
+                position = self.first_position.get(target[start:start + length])
+                if position is not None and (best is None or position < best):
+                    best = position
+
+        # AKC names containing the target: intersect n-gram postings, rarest first
+        postings = []
+        for gram in self._query_grams(target):
+            if gram not in self.grams:
+                return best
+            postings.append(self.grams[gram])
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return best
+
+        for position in sorted(candidates):
+            if best is not None and position >= best:
+                break
+            if target in self.lowered[position]:
+                return position
+        return best
+
+    def _word_overlap_position(self, target: str) -> Optional[int]:
+        """Best word-overlap score above 50%, first AKC position on ties."""
+        target_words = set(target.split())
+        if not target_words:
+            return None
+
+        # A score above 0.5 needs the AKC name to have fewer than 2x the target's words
+        common_counts = {}
+        for word in target_words:
+            for word_count in range(1, 2 * len(target_words)):
+                for position in self.words.get((word, word_count), ()):
+                    common_counts[position] = common_counts.get(position, 0) + 1
+
+        best_position = None
+        best_score = 0
+        for position in sorted(common_counts):
+            score = common_counts[position] / max(len(target_words), len(self.word_sets[position]))
+            if score > best_score and score > 0.5:
+                best_score = score
+                best_position = position
+        return best_position
+
+    def find_best_match(self, target_breed: str) -> Optional[Dict]:
+        """Indexed equivalent of find_best_match(target_breed, akc_breeds)."""
+        target_normalized = normalize_breed_name(target_breed)
+
+        if target_normalized in self.akc_breeds:
+            return self.akc_breeds[target_normalized]
+
+        target_lower = target_normalized.lower()
+        position = self._substring_position(target_lower)
+        if position is None:
+            position = self._word_overlap_position(target_lower)
+
+        return self.akc_breeds[self.names[position]] if position is not None else None
+
 def map_size(min_height: float, max_height: float) -> str:
     """Map height to size categories."""
     avg_height = (min_height + max_height) / 2
@@ -122,8 +245,8 @@ def map_grooming(grooming_value: float, grooming_category: str) -> str:
     else:
         return "High"
 
-def determine_good_with_kids(temperament: str, demeanor_category: str) -> bool:
-    """Determine if breed is good with kids based on temperament."""
+def kid_friendliness(temperament: str, demeanor_category: str) -> int:
+    """Kid-friendly minus kid-unfriendly trait count (0 or more means good with kids)."""
     kid_friendly_traits = [
         'gentle', 'patient', 'friendly', 'calm', 'even-tempered', 
         'good-natured', 'tolerant', 'playful', 'affectionate'
@@ -141,11 +264,15 @@ def determine_good_with_kids(temperament: str, demeanor_category: str) -> bool:
     friendly_score = sum(1 for trait in kid_friendly_traits if trait in temp_lower or trait in demeanor_lower)
     unfriendly_score = sum(1 for trait in kid_unfriendly_traits if trait in temp_lower or trait in demeanor_lower)
     
+    return friendly_score - unfriendly_score
+
+def determine_good_with_kids(temperament: str, demeanor_category: str) -> bool:
+    """Determine if breed is good with kids based on temperament."""
     # Default to True if no strong indicators either way
-    return friendly_score >= unfriendly_score
+    return kid_friendliness(temperament, demeanor_category) >= 0
 
-def determine_good_with_pets(temperament: str, demeanor_category: str) -> bool:
-    """Determine if breed is good with other pets."""
+def pet_friendliness(temperament: str, demeanor_category: str) -> int:
+    """Pet-friendly minus pet-unfriendly trait count (above 0 means good with pets)."""
     pet_friendly_traits = [
         'social', 'friendly', 'gentle', 'tolerant', 'easy-going',
         'peaceful', 'good-natured'
@@ -162,7 +289,11 @@ def determine_good_with_pets(temperament: str, demeanor_category: str) -> bool:
     friendly_score = sum(1 for trait in pet_friendly_traits if trait in temp_lower or trait in demeanor_lower)
     unfriendly_score = sum(1 for trait in pet_unfriendly_traits if trait in temp_lower or trait in demeanor_lower)
     
-    return friendly_score > unfriendly_score
+    return friendly_score - unfriendly_score
+
+def determine_good_with_pets(temperament: str, demeanor_category: str) -> bool:
+    """Determine if breed is good with other pets."""
+    return pet_friendliness(temperament, demeanor_category) > 0
 
 def determine_role(group: str, temperament: str) -> str:
     """Determine primary role based on breed group and temperament."""
@@ -181,6 +312,7 @@ def determine_role(group: str, temperament: str) -> str:
     
     return "Companion"
 
+@instrumented('create_breed_entry')
 def create_breed_entry(breed_name: str, akc_data: Dict) -> Dict:
     """Create a breed entry in our format from AKC data."""
     try:
@@ -237,12 +369,15 @@ def create_fallback_entry(breed_name: str) -> Dict:
         "image_filename": f"{breed_name.lower().replace(' ', '_').replace('-', '_')}.jpg"
     }
 
-def main():
+def main(input_file: str = 'dog_breeds_cleaned_real.json',
+         akc_file: str = 'akc-data-latest.csv',
+         output_file: str = 'dog_breeds_corrected.json'):
     print("Starting breed data correction process...")
     
     # Load data
-    breed_names = load_corrupted_breeds()
-    akc_breeds = load_akc_data()
+    breed_names = load_corrupted_breeds(input_file)
+    akc_breeds = load_akc_data(akc_file)
+    name_index = BreedNameIndex(akc_breeds)
     
     # Process breeds
     corrected_breeds = []
@@ -253,7 +388,7 @@ def main():
         print(f"Processing: {breed_name}")
         
         # Find matching AKC data
-        akc_match = find_best_match(breed_name, akc_breeds)
+        akc_match = name_index.find_best_match(breed_name)
         
         if akc_match:
             breed_entry = create_breed_entry(breed_name, akc_match)
@@ -271,14 +406,14 @@ def main():
             print(f"  ⚠ Used fallback (no match found)")
     
     # Save corrected data
-    with open('dog_breeds_corrected.json', 'w') as f:
+    with open(output_file, 'w') as f:
         json.dump(corrected_breeds, f, indent=2)
     
     print(f"\n✅ Correction complete!")
     print(f"Total breeds: {len(corrected_breeds)}")
     print(f"Matched with AKC data: {matched_count}")
     print(f"Used fallback data: {fallback_count}")
-    print(f"Saved to: dog_breeds_corrected.json")
+    print(f"Saved to: {output_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
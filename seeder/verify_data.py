@@ -3,20 +3,35 @@
 Script to verify the corrected breed data looks good
 """
 
-import json
+import os
+import sys
 
-def main():
+# record_stream lives at the repo root, one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from record_stream import read_records
+
+def main(input_file='dog_breeds_corrected.json'):
     print("🔍 Verifying corrected breed data...")
     
-    with open('dog_breeds_corrected.json', 'r') as f:
-        breeds = json.load(f)
+    problem_breeds = ['Rottweiler', 'Yorkshire Terrier', 'Boxer', 'Dachshund']
+    
+    # One streaming pass: keep only the sample and the breeds we check below
+    total = 0
+    sample = []
+    found = {}
+    for breed in read_records(input_file):
+        total += 1
+        if len(sample) < 5:
+            sample.append(breed)
+        if breed['breed'] in problem_breeds and breed['breed'] not in found:
+            found[breed['breed']] = breed
     
-    print(f"Total breeds: {len(breeds)}")
+    print(f"Total breeds: {total}")
     print("\n📊 Sample of corrected data:")
     print("=" * 50)
     
     # Show first 5 breeds
-    for i, breed in enumerate(breeds[:5]):
+    for i, breed in enumerate(sample):
         print(f"\n{i+1}. {breed['breed']}")
         print(f"   Size: {breed['size']}")
         print(f"   Energy: {breed['energy_level']}")
@@ -29,11 +44,10 @@ def main():
     print("\n" + "=" * 50)
     
     # Check for some specific breeds that were corrupted
-    problem_breeds = ['Rottweiler', 'Yorkshire Terrier', 'Boxer', 'Dachshund']
     print(f"\n🔍 Checking previously corrupted breeds:")
     
     for breed_name in problem_breeds:
-        breed = next((b for b in breeds if b['breed'] == breed_name), None)
+        breed = found.get(breed_name)
         if breed:
             print(f"\n✅ {breed_name}:")
             print(f"   Size: {breed['size']} (should be appropriate)")
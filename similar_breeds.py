@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Precomputed "breeds like this one" index.
+Each breed becomes a weighted feature vector: its questionnaire levels (size,
+energy, trainability, grooming, role, kids/pets) scaled to 0-1, plus the AKC
+registry's height, weight, energy, shedding and demeanor values, min-max
+normalized over the registry. Vectors are quantized to one byte per feature,
+and every breed's top-k nearest neighbours are computed with blocked matrix
+products and stored next to them in one compressed .npz.
+
+Up to EXACT_LIMIT breeds the neighbours are exact. Beyond that (synthetic or
+listing-scale data) vectors are first grouped around sqrt(n) k-means centroids
+and each group is only compared with the groups nearest to it, which keeps the
+build around n^1.5 distance computations instead of n^2.
+
+Requires numpy.
+
+Usage:
+    python similar_breeds.py [--data seeder/dog_breeds_with_shelter_scores.json] [--k 10]
+    python similar_breeds.py --query "Labrador Retriever" "Beagle"
+"""
+
+import argparse
+import os
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from breed_ranking import ORDINAL_ATTRIBUTES
+from breed_table import AKC_FILE, BreedTable
+from record_stream import read_records
+from seeder.fix_breed_data import BreedNameIndex
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+INDEX_FILE = 'seeder/build/similar_breeds.npz'
+INDEX_FORMAT = 1
+
+DEFAULT_K = 10
+EXACT_LIMIT = 20_000       # Above this many breeds, neighbours come from the clustered search
+BLOCK_SIZE = 1024          # Query rows per distance block
+PROBE_CLUSTERS = 8         # Neighbouring clusters searched for each cluster
+KMEANS_SAMPLE = 20_000
+KMEANS_ITERATIONS = 10
+
+# Questionnaire levels in order; a breed's value is its position scaled to 0-1.
+# Role is ordered with Both between the two, unlike breed_ranking.ROLE_LEVELS.
+ORDINAL_LEVELS = {
+    **ORDINAL_ATTRIBUTES,
+    'companion_or_guardian': ('Companion', 'Both', 'Guardian'),
+}
+BOOLEAN_FEATURES = ['good_with_kids', 'good_with_pets']
+
+# AKC columns (averaged where there is a min and max), normalized over the registry
+AKC_FEATURES = {
+    'height': ('min_height', 'max_height'),
+    'weight': ('min_weight', 'max_weight'),
+    'energy_value': ('energy_level_value',),
+    'shedding_value': ('shedding_value',),
+    'demeanor_value': ('demeanor_value',),
+}
+
+# Relative importance of each feature in the distance
+FEATURE_WEIGHTS = {
+    'size': 2.0,
+    'energy_level': 1.5,
+    'trainability': 1.0,
+    'grooming_needs': 1.0,
+    'companion_or_guardian': 0.75,
+    'good_with_kids': 0.75,
+    'good_with_pets': 0.75,
+    'height': 1.5,
+    'weight': 1.5,
+    'energy_value': 1.0,
+    'shedding_value': 1.0,
+    'demeanor_value': 0.5,
+}
+
+FEATURES = list(ORDINAL_LEVELS) + BOOLEAN_FEATURES + list(AKC_FEATURES)
+
+LISTING_ID = re.compile(r'\s+#\d+$')
+
+
+class FeatureEncoder:
+    """Turns breed records into weighted vectors, filling AKC values by name match."""
+
+    def __init__(self, table: BreedTable):
+        self.name_index = BreedNameIndex({name: {'position': i} for i, name in enumerate(table.names)})
+        columns = []
+        for sources in AKC_FEATURES.values():
+            stacked = np.stack([table.numeric[source] for source in sources])
+            present = (~np.isnan(stacked)).sum(axis=0)
+            # Mean of whichever of min/max is present, NaN if neither is
+            columns.append(np.where(present > 0, np.nansum(stacked, axis=0) / np.maximum(present, 1), np.nan))
+        akc = np.stack(columns, axis=1)
+
+        low, high = np.nanmin(akc, axis=0), np.nanmax(akc, axis=0)
+        akc = (akc - low) / np.where(high > low, high - low, 1)
+        # Breeds missing a value get the registry median for it
+        medians = np.nanmedian(akc, axis=0)
+        self.akc = np.where(np.isnan(akc), medians, akc).astype(np.float32)
+        self.akc_default = medians.astype(np.float32)
+        self.weights = np.sqrt([FEATURE_WEIGHTS[feature] for feature in FEATURES]).astype(np.float32)
+
+        self.akc_position = lru_cache(maxsize=65536)(self._akc_position)
+
+    def _akc_position(self, breed_name: str) -> Optional[int]:
+        match = self.name_index.find_best_match(breed_name)
+        return match['position'] if match else None
+
+    def akc_values(self, breed_name: str) -> np.ndarray:
+        # Listings are "<label> #<id>"; only the label says anything about the breed
+        position = self.akc_position(LISTING_ID.sub('', breed_name))
+        return self.akc[position] if position is not None else self.akc_default
+
+    def encode_one(self, record: Dict) -> np.ndarray:
+        values = []
+        for attribute, levels in ORDINAL_LEVELS.items():
+            value = record.get(attribute)
+            values.append(levels.index(value) / (len(levels) - 1) if value in levels else 0.5)
+        for attribute in BOOLEAN_FEATURES:
+            values.append(1.0 if record.get(attribute) else 0.0)
+        vector = np.concatenate([np.asarray(values, dtype=np.float32), self.akc_values(record['breed'])])
+        return vector * self.weights
+
+    def encode(self, records: Iterable[Dict]) -> Tuple[List[str], np.ndarray]:
+        names, vectors = [], []
+        for record in records:
+            names.append(record['breed'])
+            vectors.append(self.encode_one(record))
+        return names, np.stack(vectors) if vectors else np.zeros((0, len(FEATURES)), dtype=np.float32)
+
+
+def quantize(vectors: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """One byte per feature: (codes, per-feature step) with vector ~= codes * step."""
+    step = (weights / 255).astype(np.float32)
+    codes = np.clip(np.rint(vectors / step), 0, 255).astype(np.uint8)
+    return codes, step
+
+
+def _block_top_k(queries: np.ndarray, query_ids: np.ndarray, candidates: np.ndarray,
+                 candidate_ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Top-k (ids, squared distances) of each query among the candidates, excluding itself."""
+    distances = (np.einsum('ij,ij->i', queries, queries)[:, None]
+                 + np.einsum('ij,ij->i', candidates, candidates)[None, :]
+                 - 2 * queries @ candidates.T)
+    np.maximum(distances, 0, out=distances)
+    distances[query_ids[:, None] == candidate_ids[None, :]] = np.inf
+
+    take = min(k, len(candidate_ids))
+    nearest = np.argpartition(distances, take - 1, axis=1)[:, :take] if take < len(candidate_ids) \
+        else np.tile(np.arange(len(candidate_ids)), (len(queries), 1))
+    nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+    # Closest first; equal distances keep row order so the table is deterministic
+    order = np.lexsort((candidate_ids[nearest], nearest_distances), axis=1)
+    nearest = np.take_along_axis(nearest, order, axis=1)
+    return candidate_ids[nearest], np.take_along_axis(nearest_distances, order, axis=1)
+
+
+def _store(neighbors, distances, ids, found_ids, found_distances, k):
+    width = found_ids.shape[1]
+    neighbors[ids, :width] = found_ids
+    distances[ids, :width] = found_distances
+    if width < k:
+        neighbors[ids, width:] = -1
+        distances[ids, width:] = np.inf
+
+
+def exact_neighbors(vectors: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact top-k for every row, one block of queries at a time."""
+    count = len(vectors)
+    ids = np.arange(count)
+    neighbors = np.empty((count, k), dtype=np.int32)
+    distances = np.empty((count, k), dtype=np.float32)
+    for start in range(0, count, BLOCK_SIZE):
+        block = ids[start:start + BLOCK_SIZE]
+        found_ids, found_distances = _block_top_k(vectors[block], block, vectors, ids, k)
+        _store(neighbors, distances, block, found_ids, found_distances, k)
+    return neighbors, distances
+
+
+def kmeans(vectors: np.ndarray, clusters: int, seed: int = 0) -> np.ndarray:
+    """Centroids from Lloyd iterations on a sample of the vectors."""
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(len(vectors), min(len(vectors), KMEANS_SAMPLE), replace=False)]
+    centroids = sample[rng.choice(len(sample), clusters, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = assign_clusters(sample, centroids)
+        for cluster in range(clusters):
+            members = sample[assignment == cluster]
+            if len(members):
+                centroids[cluster] = members.mean(axis=0)
+    return centroids
+
+
+def assign_clusters(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.int32)
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+    for start in range(0, len(vectors), BLOCK_SIZE * 16):
+        block = vectors[start:start + BLOCK_SIZE * 16]
+        assignment[start:start + len(block)] = np.argmin(centroid_norms[None, :] - 2 * block @ centroids.T, axis=1)
+    return assignment
+
+
+def clustered_neighbors(vectors: np.ndarray, k: int, probe: int = PROBE_CLUSTERS) -> Tuple[np.ndarray, np.ndarray]:
+    """Approximate top-k: each cluster is searched against its `probe` nearest clusters."""
+    count = len(vectors)
+    clusters = max(1, int(np.sqrt(count)))
+    centroids = kmeans(vectors, clusters)
+    assignment = assign_clusters(vectors, centroids)
+    members = [np.flatnonzero(assignment == cluster) for cluster in range(clusters)]
+    near_clusters, _ = exact_neighbors(centroids, min(probe, clusters - 1)) if clusters > 1 else (None, None)
+
+    neighbors = np.empty((count, k), dtype=np.int32)
+    distances = np.empty((count, k), dtype=np.float32)
+    for cluster, ids in enumerate(members):
+        if not len(ids):
+            continue
+        searched = [cluster] + ([c for c in near_clusters[cluster] if c >= 0] if near_clusters is not None else [])
+        candidate_ids = np.concatenate([members[c] for c in searched])
+        candidates = vectors[candidate_ids]
+        for start in range(0, len(ids), BLOCK_SIZE):
+            block = ids[start:start + BLOCK_SIZE]
+            found_ids, found_distances = _block_top_k(vectors[block], block, candidates, candidate_ids, k)
+            _store(neighbors, distances, block, found_ids, found_distances, k)
+    return neighbors, distances
+
+
+def top_k_neighbors(vectors: np.ndarray, k: int, exact_limit: int = EXACT_LIMIT) -> Tuple[np.ndarray, np.ndarray]:
+    if len(vectors) <= exact_limit:
+        return exact_neighbors(vectors, k)
+    return clustered_neighbors(vectors, k)
+
+
+def build_similarity_index(input_file: str = BREED_DATA_FILE, akc_file: str = AKC_FILE,
+                           output_file: str = INDEX_FILE, k: int = DEFAULT_K,
+                           exact_limit: int = EXACT_LIMIT) -> int:
+    """Encode every breed, compute its neighbours and save the table; returns the breed count."""
+    started = time.perf_counter()
+    encoder = FeatureEncoder(BreedTable.from_csv(akc_file, load_text=False))
+    names, vectors = encoder.encode(read_records(input_file))
+    codes, step = quantize(vectors, encoder.weights)
+    # Neighbours are computed on the quantized vectors, the same ones queries use
+    neighbors, distances = top_k_neighbors(codes.astype(np.float32) * step, k, exact_limit)
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    temp_file = f"{output_file}.tmp"
+    with open(temp_file, 'wb') as f:
+        np.savez_compressed(f, format=np.array(INDEX_FORMAT), names=np.asarray(names, dtype=str),
+                            features=np.asarray(FEATURES, dtype=str), vectors=codes, step=step,
+                            neighbors=neighbors, distances=np.sqrt(distances).astype(np.float16))
+    os.replace(temp_file, output_file)
+
+    method = 'exact' if len(names) <= exact_limit else 'clustered'
+    print(f"🧭 Similar-breeds index: {len(names):,} breeds x {k} neighbours ({method}) "
+          f"in {time.perf_counter() - started:.2f}s ({os.path.getsize(output_file):,} bytes) -> {output_file}")
+    return len(names)
+
+
+class SimilarBreeds:
+    """Loaded neighbour table, plus on-the-fly search for records not in it."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], encoder: Optional[FeatureEncoder] = None):
+        self.names = [str(name) for name in arrays['names']]
+        self.position = {name: i for i, name in enumerate(self.names)}
+        self.neighbors = arrays['neighbors']
+        self.distances = arrays['distances']
+        self.vectors = arrays['vectors'].astype(np.float32) * arrays['step']
+        self.encoder = encoder
+
+    @classmethod
+    def load(cls, index_file: str = INDEX_FILE, akc_file: Optional[str] = AKC_FILE) -> 'SimilarBreeds':
+        """Load a saved index; akc_file=None skips the encoder (no nearest_to_record)."""
+        with np.load(index_file) as data:
+            if int(data['format']) != INDEX_FORMAT:
+                raise ValueError(f"Unsupported similar-breeds index format: {int(data['format'])}")
+            if [str(feature) for feature in data['features']] != FEATURES:
+                raise ValueError("Similar-breeds index was built with different features; rebuild it")
+            arrays = {key: data[key] for key in data.files}
+        encoder = FeatureEncoder(BreedTable.from_csv(akc_file, load_text=False)) if akc_file else None
+        return cls(arrays, encoder)
+
+    def similar(self, breed_name: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Precomputed nearest breeds as (name, distance), closest first."""
+        row = self.position[breed_name]
+        pairs = zip(self.neighbors[row], self.distances[row])
+        return [(self.names[i], float(d)) for i, d in pairs if i >= 0][:k]
+
+    def nearest_to_record(self, record: Dict, k: int = DEFAULT_K) -> List[Tuple[str, float]]:
+        """Nearest indexed breeds to any record (e.g. a new listing), by a full scan."""
+        if self.encoder is None:
+            raise ValueError("SimilarBreeds was loaded without an encoder")
+        vector = self.encoder.encode_one(record)
+        distances = np.sqrt(np.maximum(((self.vectors - vector) ** 2).sum(axis=1), 0))
+        if record.get('breed') in self.position:
+            distances[self.position[record['breed']]] = np.inf
+        take = min(k, len(distances))
+        nearest = np.argpartition(distances, take - 1)[:take]
+        nearest = nearest[np.lexsort((nearest, distances[nearest]))]
+        return [(self.names[i], float(distances[i])) for i in nearest]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the similar-breeds index.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--akc', default=AKC_FILE, help=f"AKC data (default: {AKC_FILE})")
+    parser.add_argument('--output', default=INDEX_FILE, help=f"index file (default: {INDEX_FILE})")
+    parser.add_argument('--k', type=int, default=DEFAULT_K)
+    parser.add_argument('--exact-limit', type=int, default=EXACT_LIMIT,
+                        help="largest dataset searched exactly (default: %(default)s)")
+    parser.add_argument('--query', nargs='+', metavar='BREED', help="print neighbours from an existing index")
+    args = parser.parse_args()
+
+    try:
+        if args.query:
+            index = SimilarBreeds.load(args.output, akc_file=None)
+            for name in args.query:
+                print(f"🐕 {name}: " + ', '.join(f"{other} ({distance:.2f})"
+                                                for other, distance in index.similar(name, args.k)))
+        else:
+            build_similarity_index(args.data, args.akc, args.output, args.k, args.exact_limit)
+    except Exception as e:
+        print(f"❌ Error with similar-breeds index: {e}")
+        import traceback
+        traceback.print_exc()
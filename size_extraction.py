@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Shared weight/height extraction for the size scripts.
+One pre-compiled pattern finds every weight and height range in a description
+in a single scan, understands lb/kg/in/cm, and normalizes everything to pounds
+and inches. Puppy weights are skipped, and parent-breed measurements are only
+used when a description gives none for the breed itself.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+Range = Tuple[float, float]
+
+_NUMBER = r'\d+(?:\.\d+)?'
+
+# Longer unit spellings come first so "inches" isn't read as "in"
+SIZE_PATTERN = re.compile(
+    rf'(?P<low>{_NUMBER})'
+    rf'(?:\s*(?:-|–|—|to|and)\s*(?P<high>{_NUMBER}))?'
+    r'\s*(?P<unit>pounds?|lbs?\.?|kilograms?|kilos?|kgs?|inches|inch|in\.|feet|foot|ft\.?|centimet(?:er|re)s?|cms?)'
+    r'(?![A-Za-z])',
+    re.IGNORECASE,
+)
+
+UNITS = {
+    'pound': ('weight', 1.0), 'pounds': ('weight', 1.0),
+    'lb': ('weight', 1.0), 'lbs': ('weight', 1.0), 'lb.': ('weight', 1.0), 'lbs.': ('weight', 1.0),
+    'kilogram': ('weight', 2.20462), 'kilograms': ('weight', 2.20462),
+    'kilo': ('weight', 2.20462), 'kilos': ('weight', 2.20462),
+    'kg': ('weight', 2.20462), 'kgs': ('weight', 2.20462),
+    'inch': ('height', 1.0), 'inches': ('height', 1.0), 'in.': ('height', 1.0),
+    'foot': ('height', 12.0), 'feet': ('height', 12.0), 'ft': ('height', 12.0), 'ft.': ('height', 12.0),
+    'centimeter': ('height', 1 / 2.54), 'centimeters': ('height', 1 / 2.54),
+    'centimetre': ('height', 1 / 2.54), 'centimetres': ('height', 1 / 2.54),
+    'cm': ('height', 1 / 2.54), 'cms': ('height', 1 / 2.54),
+}
+
+# Words just before a measurement that tell us what it describes
+CONTEXT_WINDOW = 80
+PUPPY_CONTEXT = re.compile(r'\b(?:pupp(?:y|ies)|newborns?|at birth|litters?|weeks? old|months? old)\b', re.IGNORECASE)
+PARENT_CONTEXT = re.compile(r'\b(?:parents?|mother|father|sire|dam)\b', re.IGNORECASE)
+
+# Joins batched descriptions; \s doesn't match NUL, so no match can span two documents
+SEPARATOR = '\x00'
+
+
+class SizeInfo(NamedTuple):
+    weight_lb: Optional[Range]   # (min, max) in pounds
+    height_in: Optional[Range]   # (min, max) in inches
+
+
+def _tidy(value: float) -> float:
+    """Round to one decimal and drop the fraction when it's whole (keeps 20 as 20)."""
+    value = round(value, 1)
+    return int(value) if value == int(value) else value
+
+
+def _source(context: str) -> Optional[str]:
+    """Who a measurement describes, judged from its preceding words; None means skip it."""
+    if PUPPY_CONTEXT.search(context):
+        return None
+    if PARENT_CONTEXT.search(context):
+        return 'parent'
+    return 'adult'
+
+
+def _sentence_context(text: str, start: int, floor: int) -> str:
+    """Text from the start of the sentence (at most CONTEXT_WINDOW chars) up to `start`."""
+    window_start = max(floor, start - CONTEXT_WINDOW)
+    window = text[window_start:start]
+    sentence_break = max(window.rfind('. '), window.rfind('! '), window.rfind('? '))
+    return window[sentence_break + 1:] if sentence_break >= 0 else window
+
+
+def _merge(current: Optional[Range], low: float, high: float) -> Range:
+    if current is None:
+        return (low, high)
+    return (min(current[0], low), max(current[1], high))
+
+
+def _extract_from(text: str, doc_starts: List[int]) -> List[SizeInfo]:
+    """
+    Scan `text` (one or many joined descriptions) once.
+    All adult measurements of a kind are merged into one range (so "males up to
+    150 pounds; females 100 to 120 pounds" gives 100-150); parent-breed figures
+    are only used when the description gives nothing for the breed itself.
+    """
+    found = [{} for _ in doc_starts]  # doc -> {(kind, source): range}
+
+    for match in SIZE_PATTERN.finditer(text):
+        doc = bisect_right(doc_starts, match.start()) - 1
+        kind, factor = UNITS[match.group('unit').lower()]
+
+        source = _source(_sentence_context(text, match.start(), doc_starts[doc]))
+        if source is None:
+            continue
+
+        low = float(match.group('low')) * factor
+        high = float(match.group('high')) * factor if match.group('high') else low
+        key = (kind, source)
+        found[doc][key] = _merge(found[doc].get(key), min(low, high), max(low, high))
+
+    results = []
+    for ranges in found:
+        picked = {}
+        for kind in ('weight', 'height'):
+            chosen = ranges.get((kind, 'adult')) or ranges.get((kind, 'parent'))
+            picked[kind] = (_tidy(chosen[0]), _tidy(chosen[1])) if chosen else None
+        results.append(SizeInfo(picked['weight'], picked['height']))
+    return results
+
+
+def extract_sizes(description: str) -> SizeInfo:
+    """Weight (lb) and height (in) ranges for a single description."""
+    return _extract_from(description or '', [0])[0]
+
+
+def extract_sizes_batch(descriptions: Iterable[str]) -> List[SizeInfo]:
+    """Extract sizes for a whole list of descriptions with one regex pass."""
+    descriptions = [description or '' for description in descriptions]
+    if not descriptions:
+        return []
+
+    doc_starts = []
+    offset = 0
+    for description in descriptions:
+        doc_starts.append(offset)
+        offset += len(description) + len(SEPARATOR)
+
+    return _extract_from(SEPARATOR.join(descriptions), doc_starts)
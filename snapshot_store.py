@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for breed data snapshots.
+Each record is stored once in an append-only pack, keyed by the hash of its
+canonical JSON, and a snapshot is a manifest of (breed, record hash) entries.
+Manifests are themselves stored as a parent plus the entries that changed, so
+adding a version costs space for its changed records only; every
+MAX_CHAIN_DEPTH-th version (or one that changed most entries) is stored in
+full to keep lookups short.
+
+Two versions are diffed by walking their manifests once: only breeds whose
+record hash differs are read from the pack and compared field by field.
+
+breed_pipeline.py adds every dog_breeds_*.json stage output to the store under
+the stage name, so `diff fix_breed_sizes@1 fix_breed_sizes` shows what the
+last change to a fix script did to its output.
+
+Usage:
+    python snapshot_store.py add seeder/dog_breeds_corrected.json [--name corrected]
+    python snapshot_store.py log
+    python snapshot_store.py diff seeder/dog_breeds_corrected.json seeder/dog_breeds_sizes_fixed.json
+    python snapshot_store.py diff corrected sizes_fixed [--delta delta.json]
+    python snapshot_store.py export sizes_fixed -o dog_breeds_sizes_fixed.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from data_versioning import diff_records
+from record_stream import read_records, write_records
+
+STORE_DIR = 'seeder/build/snapshots'
+PACK_FILE = 'objects.pack'
+INDEX_FILE = 'objects.idx'
+REFS_FILE = 'refs.json'
+LOG_FILE = 'log.jsonl'
+MANIFEST_DIR = 'manifests'
+STORE_FORMAT = 1
+
+MAX_CHAIN_DEPTH = 16      # Manifests between full copies
+FULL_MANIFEST_SHARE = 0.5  # Store a manifest in full when more entries than this changed
+
+Entry = Tuple[str, str]   # (breed, record hash)
+
+
+class FieldChange(NamedTuple):
+    breed: str
+    field: str
+    old: object
+    new: object
+
+
+class SnapshotDiff(NamedTuple):
+    old: str                  # Snapshot ids
+    new: str
+    inserted: List[str]       # Breeds only in the new snapshot
+    deleted: List[str]        # Breeds only in the old snapshot
+    changes: List[FieldChange]
+
+    @property
+    def updated(self) -> List[str]:
+        return list(dict.fromkeys(change.breed for change in self.changes))
+
+
+def object_hash(record: Dict) -> str:
+    """Hash of a record's canonical JSON over all of its fields."""
+    canonical = json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def snapshot_id(entries: List[Entry]) -> str:
+    """Id of a snapshot: hash of its record hashes in order."""
+    digest = hashlib.sha256()
+    for _, record_hash in entries:
+        digest.update(record_hash.encode('ascii'))
+    return digest.hexdigest()
+
+
+def is_ascii_file(path: str) -> bool:
+    """True when a file has no non-ASCII bytes (its JSON was written with ensure_ascii)."""
+    with open(path, 'rb') as f:
+        return all(chunk.isascii() for chunk in iter(lambda: f.read(1 << 20), b''))
+
+
+def _write_json(path: str, data, **kwargs):
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(temp_file, path)
+
+
+class SnapshotStore:
+    """Record pack, manifests, named refs and a history log under one directory."""
+
+    def __init__(self, root: str = STORE_DIR):
+        self.root = root
+        self.pack_path = os.path.join(root, PACK_FILE)
+        self.index_path = os.path.join(root, INDEX_FILE)
+        self.manifest_dir = os.path.join(root, MANIFEST_DIR)
+        self._index: Optional[Dict[str, List[int]]] = None
+        self._manifests: Dict[str, Dict] = {}
+        self._entries: Dict[str, List[Entry]] = {}
+        self._loose: Dict[str, Dict] = {}   # Records of files loaded for reading only
+
+    # Record objects
+
+    @property
+    def index(self) -> Dict[str, List[int]]:
+        """{record hash: [offset, length]} into the pack."""
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r') as f:
+                    self._index = json.load(f)
+        return self._index
+
+    def read_objects(self, hashes: Iterable[str]) -> Dict[str, Dict]:
+        """Records by hash, read in pack order."""
+        hashes = set(hashes)
+        records = {record_hash: self._loose[record_hash] for record_hash in hashes if record_hash in self._loose}
+        wanted = sorted(hashes - records.keys(), key=lambda h: self.index[h][0])
+        if not wanted:
+            return records
+        with open(self.pack_path, 'rb') as pack:
+            for record_hash in wanted:
+                offset, length = self.index[record_hash]
+                pack.seek(offset)
+                records[record_hash] = json.loads(pack.read(length))
+        return records
+
+    # Manifests
+
+    def manifest(self, snapshot: str) -> Dict:
+        if snapshot not in self._manifests:
+            with open(os.path.join(self.manifest_dir, f"{snapshot}.json"), 'r', encoding='utf-8') as f:
+                self._manifests[snapshot] = json.load(f)
+        return self._manifests[snapshot]
+
+    def entries(self, snapshot: str) -> List[Entry]:
+        """(breed, record hash) per record, in file order, following the parent chain."""
+        if snapshot not in self._entries:
+            manifest = self.manifest(snapshot)
+            if 'entries' in manifest:
+                entries = [tuple(entry) for entry in manifest['entries']]
+            else:
+                entries = list(self.entries(manifest['parent']))
+                del entries[manifest['length']:]
+                entries.extend([None] * (manifest['length'] - len(entries)))
+                for position, entry in manifest['set']:
+                    entries[position] = tuple(entry)
+            self._entries[snapshot] = entries
+        return self._entries[snapshot]
+
+    def records(self, snapshot: str) -> Iterator[Dict]:
+        entries = self.entries(snapshot)
+        objects = self.read_objects(record_hash for _, record_hash in entries)
+        for _, record_hash in entries:
+            yield objects[record_hash]
+
+    def _manifest_for(self, entries: List[Entry], parent: Optional[str]) -> Dict:
+        """Delta manifest against `parent` where that is small and the chain is short."""
+        if parent:
+            depth = self.manifest(parent).get('depth', 0) + 1
+            base = self.entries(parent)
+            changed = [[position, list(entry)] for position, entry in enumerate(entries)
+                       if position >= len(base) or base[position] != entry]
+            if depth <= MAX_CHAIN_DEPTH and len(changed) <= FULL_MANIFEST_SHARE * len(entries):
+                return {'parent': parent, 'depth': depth, 'length': len(entries), 'set': changed}
+        return {'depth': 0, 'entries': [list(entry) for entry in entries]}
+
+    # Refs and history
+
+    def refs(self) -> Dict[str, List[str]]:
+        """{name: [snapshot ids, oldest first]}."""
+        path = os.path.join(self.root, REFS_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def log(self) -> List[Dict]:
+        path = os.path.join(self.root, LOG_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def resolve(self, spec: str) -> str:
+        """
+        Snapshot id for a ref name ("fix_breed_sizes"), an older version of a
+        ref ("fix_breed_sizes@1" is the one before the latest) or an id prefix.
+        """
+        refs = self.refs()
+        name, _, back = spec.partition('@')
+        if name in refs:
+            history = refs[name]
+            steps = int(back or 0)
+            if steps >= len(history):
+                raise ValueError(f"{name} has only {len(history)} versions")
+            return history[-1 - steps]
+        matches = [file[:-5] for file in os.listdir(self.manifest_dir)
+                   if file.startswith(spec) and file.endswith('.json')] if os.path.isdir(self.manifest_dir) else []
+        if len(matches) != 1:
+            raise ValueError(f"Unknown snapshot: {spec}" if not matches else f"Ambiguous snapshot id: {spec}")
+        return matches[0]
+
+    # Writing
+
+    def add(self, records: Iterable[Dict], name: Optional[str] = None, source: Optional[str] = None,
+            ensure_ascii: Optional[bool] = None) -> str:
+        """
+        Store a snapshot (new records only) and return its id; `name` ref points at it.
+        `ensure_ascii` records how the source file escaped non-ASCII text, so
+        export can write it back byte for byte.
+        """
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        index = self.index
+        entries: List[Entry] = []
+        breeds = set()
+        new_objects = 0
+
+        with open(self.pack_path, 'ab') as pack:
+            offset = pack.tell()
+            for record in records:
+                if record['breed'] in breeds:
+                    raise ValueError(f"Duplicate breed in snapshot: {record['breed']}")
+                breeds.add(record['breed'])
+                record_hash = object_hash(record)
+                if record_hash not in index:
+                    data = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+                    pack.write(data)
+                    index[record_hash] = [offset, len(data) - 1]
+                    offset += len(data)
+                    new_objects += 1
+                entries.append((record['breed'], record_hash))
+
+        # The pack is written before the index, so an interrupted add only leaves unreferenced bytes
+        if new_objects:
+            _write_json(self.index_path, index, separators=(',', ':'))
+
+        snapshot = snapshot_id(entries)
+        manifest_path = os.path.join(self.manifest_dir, f"{snapshot}.json")
+        refs = self.refs()
+        history = refs.get(name, []) if name else []
+        if not os.path.exists(manifest_path):
+            parent = history[-1] if history else self._latest()
+            manifest = {'format': STORE_FORMAT, **self._manifest_for(entries, parent)}
+            if ensure_ascii is not None:
+                manifest['ensure_ascii'] = ensure_ascii
+            _write_json(manifest_path, manifest, separators=(',', ':'))
+            self._manifests[snapshot] = manifest
+        elif ensure_ascii is not None and self.manifest(snapshot).get('ensure_ascii') != ensure_ascii:
+            # Same records written the other way; the latest file decides
+            manifest = {**self.manifest(snapshot), 'ensure_ascii': ensure_ascii}
+            _write_json(manifest_path, manifest, separators=(',', ':'))
+            self._manifests[snapshot] = manifest
+        self._entries[snapshot] = entries
+
+        if name and (not history or history[-1] != snapshot):
+            refs[name] = history + [snapshot]
+            _write_json(os.path.join(self.root, REFS_FILE), refs, indent=2, sort_keys=True)
+        with open(os.path.join(self.root, LOG_FILE), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'snapshot': snapshot, 'name': name, 'source': source,
+                                'records': len(entries), 'new_records': new_objects,
+                                'created': time.strftime('%Y-%m-%dT%H:%M:%S')}, ensure_ascii=False) + '\n')
+        return snapshot
+
+    def add_file(self, path: str, name: Optional[str] = None) -> str:
+        return self.add(read_records(path), name, source=path, ensure_ascii=is_ascii_file(path))
+
+    def load_file(self, path: str) -> str:
+        """Snapshot id for a data file, held in memory so it can be diffed without being stored."""
+        entries = []
+        for record in read_records(path):
+            record_hash = object_hash(record)
+            self._loose[record_hash] = record
+            entries.append((record['breed'], record_hash))
+        snapshot = snapshot_id(entries)
+        self._entries[snapshot] = entries
+        return snapshot
+
+    def ensure_ascii(self, snapshot: str) -> bool:
+        """Whether the snapshot's source file escaped non-ASCII text (True if unknown)."""
+        return self.manifest(snapshot).get('ensure_ascii', True)
+
+    def _latest(self) -> Optional[str]:
+        history = self.log()
+        return history[-1]['snapshot'] if history else None
+
+    # Reading
+
+    def diff(self, old: str, new: str) -> SnapshotDiff:
+        """Field-level differences between two snapshots, keyed by breed."""
+        old_hashes = dict(self.entries(old))
+        new_entries = self.entries(new)
+        new_hashes = dict(new_entries)
+
+        inserted = [breed for breed, _ in new_entries if breed not in old_hashes]
+        deleted = [breed for breed in old_hashes if breed not in new_hashes]
+        updated = [breed for breed, record_hash in new_entries
+                   if breed in old_hashes and old_hashes[breed] != record_hash]
+
+        objects = self.read_objects([old_hashes[breed] for breed in updated] +
+                                    [new_hashes[breed] for breed in updated])
+        changes = []
+        for breed in updated:
+            before, after = objects[old_hashes[breed]], objects[new_hashes[breed]]
+            for field in list(dict.fromkeys([*before, *after])):
+                if before.get(field) != after.get(field) or (field in before) != (field in after):
+                    changes.append(FieldChange(breed, field, before.get(field), after.get(field)))
+        return SnapshotDiff(old, new, inserted, deleted, changes)
+
+    def delta(self, old: str, new: str) -> Dict:
+        """data_versioning delta between two snapshots, ready for `data_versioning.py apply`."""
+        return diff_records(self.records(old), self.records(new))
+
+    def stats(self) -> Dict[str, int]:
+        manifest_bytes = sum(os.path.getsize(os.path.join(self.manifest_dir, file))
+                             for file in os.listdir(self.manifest_dir)) if os.path.isdir(self.manifest_dir) else 0
+        return {
+            'snapshots': len(os.listdir(self.manifest_dir)) if os.path.isdir(self.manifest_dir) else 0,
+            'records': len(self.index),
+            'pack_bytes': os.path.getsize(self.pack_path) if os.path.exists(self.pack_path) else 0,
+            'index_bytes': os.path.getsize(self.index_path) if os.path.exists(self.index_path) else 0,
+            'manifest_bytes': manifest_bytes,
+        }
+
+
+def _short(value, width: int = 60, start: int = 0) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    if start:
+        text = '...' + text[start:]
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def _change_text(change: FieldChange) -> str:
+    """Old -> new, starting long strings just before the first edit."""
+    start = 0
+    if isinstance(change.old, str) and isinstance(change.new, str):
+        common = os.path.commonprefix([change.old, change.new])
+        start = max(0, len(common) - 20)
+    return f"{_short(change.old, start=start)} -> {_short(change.new, start=start)}"
+
+
+def print_diff(diff: SnapshotDiff, limit: int = 50):
+    print(f"🔀 {diff.old[:12]} -> {diff.new[:12]}: {len(diff.inserted)} inserted, "
+          f"{len(diff.updated)} updated ({len(diff.changes)} fields), {len(diff.deleted)} deleted")
+    for breed in diff.inserted[:limit]:
+        print(f"   + {breed}")
+    for breed in diff.deleted[:limit]:
+        print(f"   - {breed}")
+    for change in diff.changes[:limit]:
+        print(f"   ~ {change.breed} {change.field}: {_change_text(change)}")
+    hidden = max(0, len(diff.inserted) - limit) + max(0, len(diff.deleted) - limit) + max(0, len(diff.changes) - limit)
+    if hidden:
+        print(f"   ... {hidden} more (use --limit)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed snapshots of the breed data.")
+    parser.add_argument('--store', default=STORE_DIR, help=f"store directory (default: {STORE_DIR})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="store data files as snapshots")
+    add.add_argument('files', nargs='+')
+    add.add_argument('--name', help="ref name (default: the file name without dog_breeds_ and .json)")
+
+    commands.add_parser('log', help="list stored snapshots")
+
+    diff = commands.add_parser('diff', help="field-level diff of two snapshots or data files")
+    diff.add_argument('old', help="ref, ref@N, snapshot id prefix or data file")
+    diff.add_argument('new')
+    diff.add_argument('--limit', type=int, default=50, help="changes to print per kind")
+    diff.add_argument('--delta', help="also write a data_versioning delta to this file")
+
+    export = commands.add_parser('export', help="write a snapshot back out as a data file")
+    export.add_argument('snapshot')
+    export.add_argument('-o', '--output', required=True)
+    export.add_argument('--unicode', action='store_true',
+                        help="write non-ASCII text unescaped (default: as the source file did)")
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.store)
+
+    def snapshot(spec: str) -> str:
+        """Data files are only loaded into memory: reading commands never write to the store."""
+        return store.load_file(spec) if os.path.isfile(spec) else store.resolve(spec)
+
+    if args.command == 'add':
+        for path in args.files:
+            name = args.name or os.path.basename(path).replace('dog_breeds_', '').rsplit('.', 1)[0]
+            before = len(store.index)
+            snapshot_hash = store.add_file(path, name)
+            print(f"📸 {name}: {snapshot_hash[:12]} ({len(store.entries(snapshot_hash))} records, "
+                  f"{len(store.index) - before} new)")
+        stats = store.stats()
+        print(f"💾 {stats['snapshots']} snapshots, {stats['records']} distinct records, "
+              f"{stats['pack_bytes'] + stats['index_bytes'] + stats['manifest_bytes']:,} bytes in {args.store}")
+    elif args.command == 'log':
+        for entry in store.log():
+            print(f"{entry['created']}  {entry['snapshot'][:12]}  {str(entry['name'] or '-').ljust(32)} "
+                  f"{entry['records']:>7} records, {entry['new_records']:>7} new  {entry['source'] or ''}")
+    elif args.command == 'diff':
+        old, new = snapshot(args.old), snapshot(args.new)
+        started = time.perf_counter()
+        result = store.diff(old, new)
+        print_diff(result, args.limit)
+        print(f"⏱️  Diffed in {time.perf_counter() - started:.3f}s")
+        if args.delta:
+            with open(args.delta, 'w', encoding='utf-8') as f:
+                json.dump(store.delta(old, new), f, indent=2, ensure_ascii=False)
+            print(f"📦 Delta written to {args.delta}")
+    elif args.command == 'export':
+        snapshot_hash = store.resolve(args.snapshot)
+        count = write_records(args.output, store.records(snapshot_hash),
+                              ensure_ascii=not args.unicode and store.ensure_ascii(snapshot_hash))
+        print(f"📤 Exported {count} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Seeded generator for synthetic breed data at production volumes.
+Produces records in the dog_breeds_with_shelter_scores.json schema - new
+breeds, designer and shelter mixes, and per-animal shelter listings - using
+the real breeds as templates so attribute distributions stay realistic.
+Descriptions carry weight/height phrases (in lb/kg/inches/cm, with the odd
+puppy weight) that agree with each record's size, so the size scripts have
+something real to extract.
+
+Output is streamed, so millions of rows can be written in constant memory,
+and the same seed and arguments always give the same file.
+
+Usage:
+    python synthetic_data.py --count 1000000 --output seeder/build/synthetic.jsonl
+    python synthetic_data.py --count 10000 --kinds listings --seed 7 --output listings.json
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from breed_ranking import ORDINAL_ATTRIBUTES
+from record_stream import read_records, write_records
+from seeder.add_shelter_scores import get_shelter_score
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+DEFAULT_SEED = 42
+KINDS = ('breeds', 'mixes', 'listings')
+# Share of each kind in a mixed dataset; shelters mostly list individual animals
+DEFAULT_MIX = {'breeds': 0.05, 'mixes': 0.15, 'listings': 0.80}
+
+# Adult weight (lb) and height (in) ranges per size level, matching classify_size_by_weight
+SIZE_RANGES = dict(zip(ORDINAL_ATTRIBUTES['size'], [
+    ((4, 11), (6, 10)),
+    ((12, 24), (10, 16)),
+    ((25, 59), (16, 24)),
+    ((60, 99), (24, 30)),
+    ((100, 180), (28, 35)),
+]))
+
+NAME_PREFIXES = ['American', 'English', 'Northern', 'Alpine', 'Royal', 'Miniature', 'Standard',
+                 'Coastal', 'Highland', 'Silver', 'Black', 'Red', 'Spotted', 'Wirehaired', 'Smooth',
+                 'Carpathian', 'Baltic', 'Andean', 'Moorland', 'Prairie', 'Danube', 'Atlas']
+NAME_BASES = ['Terrier', 'Hound', 'Spaniel', 'Retriever', 'Shepherd', 'Mastiff', 'Setter',
+              'Pointer', 'Collie', 'Sheepdog', 'Spitz', 'Bulldog', 'Pinscher', 'Schnauzer',
+              'Laika', 'Griffon', 'Cur', 'Herder', 'Water Dog', 'Sighthound']
+PET_NAMES = ['Bella', 'Max', 'Luna', 'Charlie', 'Daisy', 'Rocky', 'Penny', 'Duke', 'Rosie',
+             'Bear', 'Lola', 'Tucker', 'Sadie', 'Buster', 'Maggie', 'Zeus', 'Ruby', 'Milo',
+             'Coco', 'Jax', 'Nala', 'Oreo', 'Pepper', 'Scout', 'Willow', 'Biscuit', 'Hazel']
+TRAITS = ['affectionate', 'playful', 'gentle', 'curious', 'loyal', 'alert', 'easygoing',
+          'energetic', 'devoted', 'spirited', 'calm', 'clever', 'outgoing', 'independent']
+ROLES = ['hunting', 'herding', 'guarding livestock', 'retrieving game', 'companionship',
+         'pulling carts', 'ratting', 'tracking']
+
+BREED_SENTENCES = [
+    "The {name} is a {trait} and {trait2} dog originally developed for {role}.",
+    "Owners describe the {name} as {trait}, with a {trait2} streak that shows at play.",
+    "Bred for {role}, the {name} still brings a {trait} work ethic to family life.",
+]
+MIX_SENTENCES = [
+    "The {name} combines the {trait} nature of the {parent_a} with the {trait2} personality of the {parent_b}.",
+    "A cross between the {parent_a} and the {parent_b}, the {name} tends to be {trait} and {trait2}.",
+]
+LISTING_SENTENCES = [
+    "{pet} is a {age} {sex} {label} looking for a home.",
+    "Meet {pet}, a {trait} {age} {label} who came to us as a stray.",
+    "{pet} is a {age} {sex} {label} who was surrendered when the family moved.",
+]
+CARE_SENTENCES = [
+    "Daily walks and some time off leash keep this dog happy.",
+    "A fenced yard is a plus but not required.",
+    "Regular brushing keeps the coat in good condition.",
+    "Early socialization helps bring out the best in this dog.",
+    "Short training sessions with plenty of praise work well.",
+]
+
+
+def slugify(name: str) -> str:
+    return name.lower().replace(' / ', '_').replace(' ', '_').replace('-', '_').replace("'", '')
+
+
+class SyntheticGenerator:
+    """Deterministic record factory; every record comes from one seeded RNG."""
+
+    def __init__(self, templates: Sequence[Dict], seed: int = DEFAULT_SEED):
+        self.templates = list(templates)
+        unknown = sorted({template.get('size') for template in self.templates} - set(SIZE_RANGES), key=str)
+        if unknown:
+            raise ValueError(f"Unknown size level(s) {unknown} in templates; expected one of {', '.join(SIZE_RANGES)}")
+        self.rng = random.Random(seed)
+        self.used_names = {template['breed'] for template in self.templates}
+        self.sequence = 0
+
+    @classmethod
+    def from_breed_file(cls, input_file: str = BREED_DATA_FILE, seed: int = DEFAULT_SEED) -> 'SyntheticGenerator':
+        return cls(list(read_records(input_file)), seed)
+
+    # Text pieces
+
+    def _measurements(self, size: str, subject: str) -> str:
+        """A sentence giving adult weight and height, in a randomly chosen unit style."""
+        rng = self.rng
+        (weight_low, weight_high), (height_low, height_high) = SIZE_RANGES[size]
+        weight_min = rng.randint(weight_low, weight_high)
+        weight_max = rng.randint(weight_min, weight_high)
+        height_min = rng.randint(height_low, height_high)
+        height_max = rng.randint(height_min, height_high)
+
+        style = rng.random()
+        if style < 0.6:
+            text = f"{subject} weigh {weight_min} to {weight_max} pounds and stand {height_min}-{height_max} inches tall."
+        elif style < 0.8:
+            kg_min, kg_max = round(weight_min / 2.20462, 1), round(weight_max / 2.20462, 1)
+            cm_min, cm_max = round(height_min * 2.54), round(height_max * 2.54)
+            text = f"{subject} usually weigh {kg_min}-{kg_max} kg and measure {cm_min} to {cm_max} cm at the shoulder."
+        else:
+            text = f"{subject} reach {height_min}-{height_max} inches at the shoulder and {weight_min}-{weight_max} lbs."
+
+        # Puppy weights are noise the extractor has to skip
+        if rng.random() < 0.15:
+            text += f" Puppies weigh about {max(1, weight_min // 4)} pounds at 8 weeks old."
+        return text
+
+    def _sentence(self, templates: List[str], **values) -> str:
+        values.setdefault('trait', self.rng.choice(TRAITS))
+        values.setdefault('trait2', self.rng.choice(TRAITS))
+        values.setdefault('role', self.rng.choice(ROLES))
+        return self.rng.choice(templates).format(**values)
+
+    def _care(self, count: int = 2) -> str:
+        return ' '.join(self.rng.sample(CARE_SENTENCES, count))
+
+    def _unique_name(self, name: str) -> str:
+        if name not in self.used_names:
+            self.used_names.add(name)
+            return name
+        suffix = 2
+        while f"{name} {suffix}" in self.used_names:
+            suffix += 1
+        name = f"{name} {suffix}"
+        self.used_names.add(name)
+        return name
+
+    def _attributes(self, template: Dict, other: Optional[Dict] = None) -> Dict:
+        """Questionnaire attributes from a template (each taken from either parent for mixes)."""
+        pick = (lambda field: self.rng.choice((template, other))[field]) if other else template.get
+        return {
+            'size': pick('size'),
+            'energy_level': pick('energy_level'),
+            'good_with_kids': pick('good_with_kids'),
+            'good_with_pets': pick('good_with_pets'),
+            'trainability': pick('trainability'),
+            'grooming_needs': pick('grooming_needs'),
+            'companion_or_guardian': pick('companion_or_guardian'),
+            'senior_friendly': pick('senior_friendly'),
+            'special_needs_possible': pick('special_needs_possible'),
+        }
+
+    def _record(self, name: str, attributes: Dict, description: str, image_filename: str) -> Dict:
+        return {
+            'breed': name,
+            **attributes,
+            'description': description,
+            'image_filename': image_filename,
+            'shelter_availability_score': get_shelter_score(name),
+        }
+
+    # Record kinds
+
+    def breed(self) -> Dict:
+        """A new pure breed modelled on a real one."""
+        template = self.rng.choice(self.templates)
+        name = self._unique_name(f"{self.rng.choice(NAME_PREFIXES)} {self.rng.choice(NAME_BASES)}")
+        attributes = self._attributes(template)
+        description = ' '.join([
+            self._sentence(BREED_SENTENCES, name=name),
+            self._measurements(attributes['size'], f"Adult {name}s"),
+            self._care(),
+        ])
+        return self._record(name, attributes, description, f"{slugify(name)}.jpg")
+
+    def mix(self) -> Dict:
+        """A two-parent mix, named the way shelters or designer breeders would."""
+        parent_a, parent_b = self.rng.sample(self.templates, 2)
+        a, b = parent_a['breed'], parent_b['breed']
+        if self.rng.random() < 0.5:
+            name = f"{a} / {b} Mix"
+        else:
+            first, second = a.split()[0], b.split()[-1]
+            name = first[:max(3, len(first) // 2 + 1)] + second[len(second) // 2:].lower()
+        name = self._unique_name(name)
+        attributes = self._attributes(parent_a, parent_b)
+        description = ' '.join([
+            self._sentence(MIX_SENTENCES, name=name, parent_a=a, parent_b=b),
+            self._measurements(attributes['size'], "Adults"),
+            self._care(),
+        ])
+        return self._record(name, attributes, description, parent_a['image_filename'])
+
+    def listing(self) -> Dict:
+        """One adoptable animal; uses its (primary) breed's photo as the image."""
+        template = self.rng.choice(self.templates)
+        label = template['breed'] if self.rng.random() < 0.4 else f"{template['breed']} Mix"
+        self.sequence += 1
+        name = f"{label} #{self.sequence:07d}"
+        age = self.rng.choice(['young', 'adult', 'senior', '2-year-old', '5-year-old', '9-year-old'])
+        sex = self.rng.choice(['male', 'female'])
+        pet = self.rng.choice(PET_NAMES)
+        attributes = self._attributes(template)
+        description = ' '.join([
+            self._sentence(LISTING_SENTENCES, pet=pet, age=age, sex=sex, label=label),
+            self._measurements(attributes['size'], "Dogs like this"),
+            self._care(1),
+        ])
+        record = self._record(name, attributes, description, template['image_filename'])
+        record['shelter_availability_score'] = get_shelter_score(label)
+        return record
+
+    def generate(self, count: int, mix: Optional[Dict[str, float]] = None) -> Iterator[Dict]:
+        """Yield `count` records, drawing each kind with the given probabilities."""
+        mix = mix or DEFAULT_MIX
+        kinds = [kind for kind in KINDS if mix.get(kind)]
+        weights = [mix[kind] for kind in kinds]
+        makers = {'breeds': self.breed, 'mixes': self.mix, 'listings': self.listing}
+        for _ in range(count):
+            yield makers[self.rng.choices(kinds, weights)[0]]()
+
+
+def generate_dataset(count: int, output_file: str, kinds: Sequence[str] = KINDS,
+                     seed: int = DEFAULT_SEED, input_file: str = BREED_DATA_FILE) -> int:
+    """Stream `count` synthetic records to `output_file` (.jsonl or JSON array)."""
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    generator = SyntheticGenerator.from_breed_file(input_file, seed)
+    mix = {kind: share for kind, share in DEFAULT_MIX.items() if kind in kinds}
+    started = time.perf_counter()
+    written = write_records(output_file, generator.generate(count, mix), ensure_ascii=False)
+    elapsed = time.perf_counter() - started
+    print(f"🧪 Generated {written:,} synthetic records ({', '.join(kinds)}) in {elapsed:.1f}s -> {output_file}")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic breed and listing data.")
+    parser.add_argument('--count', type=int, default=10_000)
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS))
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--output', default='seeder/build/synthetic_breeds.jsonl')
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"template breeds (default: {BREED_DATA_FILE})")
+    args = parser.parse_args()
+
+    try:
+        generate_dataset(args.count, args.output, args.kinds, args.seed, args.data)
+    except Exception as e:
+        print(f"❌ Error generating data: {e}")
+        import traceback
+        traceback.print_exc()
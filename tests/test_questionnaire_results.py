@@ -0,0 +1,37 @@
+import itertools
+
+import pytest
+
+from questionnaire_results import FLOW_QUESTIONS, MIN_RESULTS, ResultsBuilder
+from record_stream import read_records
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+
+
+@pytest.fixture(scope='module')
+def builder():
+    return ResultsBuilder(list(read_records(BREED_DATA_FILE)))
+
+
+def test_every_combination_has_enough_results(builder):
+    for answers in itertools.product(*(options for _, _, options in FLOW_QUESTIONS)):
+        rows, _ = builder.results_for(answers)
+        assert len(rows) >= MIN_RESULTS, answers
+
+
+def test_no_to_kids_or_pets_is_no_requirement(builder):
+    assert builder.results_for(('Small', 'Low', False, False, 'Low')) == \
+        builder.results_for(('Small', 'Low', None, None, 'Low'))
+
+
+def test_answered_size_is_kept_without_relaxation(builder):
+    rows, relaxation = builder.results_for(('Toy', 'Any', True, None, 'Any'))
+    assert relaxation is None
+    assert {builder.records[row]['size'] for row in rows} == {'Toy'}
+
+
+def test_short_lists_are_topped_up_from_relaxations():
+    small = ResultsBuilder(list(read_records(BREED_DATA_FILE))[:40])
+    rows, relaxation = small.results_for(('Toy', 'High', True, True, 'High'))
+    assert len(rows) >= MIN_RESULTS
+    assert relaxation is not None
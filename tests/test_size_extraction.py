@@ -0,0 +1,22 @@
+from record_stream import read_records
+from size_extraction import SizeInfo, extract_sizes, extract_sizes_batch
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+
+
+def test_batch_matches_do_not_span_descriptions():
+    descriptions = ['ends with 10', '-20 pounds here']
+    assert extract_sizes_batch(descriptions) == [extract_sizes(d) for d in descriptions]
+    assert extract_sizes_batch(descriptions)[1] == SizeInfo((20, 20), None)
+
+
+def test_batch_matches_per_description_on_breed_data():
+    descriptions = [record.get('description', '') for record in read_records(BREED_DATA_FILE)]
+    assert extract_sizes_batch(descriptions) == [extract_sizes(d) for d in descriptions]
+
+
+def test_extract_sizes_merges_and_converts():
+    info = extract_sizes('Males reach 25 to 30 inches and up to 150 pounds; females 100-120 lbs.')
+    assert info == SizeInfo((100, 150), (25, 30))
+    assert extract_sizes('About 20 kg.').weight_lb == (44.1, 44.1)
+    assert extract_sizes('Puppies weigh 2 pounds at birth.') == SizeInfo(None, None)
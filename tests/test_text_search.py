@@ -0,0 +1,39 @@
+import pytest
+
+from text_search import stem, tokenize
+
+CONFLATED = [
+    ('loving', 'loves', 'lovely', 'loved', 'love'),
+    ('hoping', 'hopes', 'hoped'),
+    ('caring', 'cares', 'cared'),
+    ('living', 'lives'),
+    ('shedding', 'sheds', 'shed'),
+    ('running', 'runs'),
+    ('playing', 'plays', 'played'),
+    ('barking', 'barks', 'barked'),
+    ('training', 'trains', 'trained'),
+]
+
+KEPT_APART = [
+    ('hoping', 'hopping'),
+    ('caring', 'car'),
+]
+
+
+@pytest.mark.parametrize('words', CONFLATED)
+def test_stem_conflates(words):
+    assert len({stem(word) for word in words}) == 1, {word: stem(word) for word in words}
+
+
+@pytest.mark.parametrize('first, second', KEPT_APART)
+def test_stem_keeps_apart(first, second):
+    assert stem(first) != stem(second)
+
+
+def test_stem_leaves_short_and_plural_like_words():
+    for word in ('grass', 'famous', 'basis', 'bred', 'dog'):
+        assert stem(word) == word
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize('A loving dog that sheds') == ['love', 'dog', 'shed']
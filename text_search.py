@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text index over breed names, descriptions and AKC temperaments.
+Text is lowercased, split into words, stripped of stopwords and reduced with a
+light suffix stemmer ("shedding", "sheds" -> "shed"; "loving", "loves" ->
+"love"). Each posting stores its precomputed BM25 weight, so a query just adds
+up the postings of its terms into one score array and partially sorts it.
+
+The same documents are written to an FTS5 table in dogmatch.db by
+build_sqlite_db.py, so the app can run the search on device.
+
+Requires numpy.
+
+Usage:
+    python text_search.py                                   # build seeder/build/text_index.npz
+    python text_search.py --query "apartment calm low shedding"
+"""
+
+import argparse
+import os
+import re
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from breed_table import AKC_FILE, BreedTable
+from record_stream import read_records
+from seeder.fix_breed_data import BreedNameIndex
+
+BREED_DATA_FILE = 'seeder/dog_breeds_with_shelter_scores.json'
+INDEX_FILE = 'seeder/build/text_index.npz'
+INDEX_FORMAT = 1
+
+K1 = 1.2
+B = 0.75
+DEFAULT_LIMIT = 20
+
+WORD = re.compile(r"[a-z0-9]+")
+LISTING_ID = re.compile(r'\s+#\d+$')
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by can do does for from has have he her his how i if in into is it its
+may more most much not of on or our she so such than that the their them then there these they this
+those to too very was we were what when which while who will with would you your
+""".split())
+
+# Longest first; (suffix, replacement, shortest stem allowed)
+SUFFIX_RULES = [
+    ('nesses', '', 3), ('ness', '', 3), ('ities', '', 3), ('ity', '', 3),
+    ('ingly', '', 3), ('edly', '', 3), ('ies', 'y', 2), ('ing', '', 3),
+    ('ers', '', 4), ('er', '', 4), ('ed', '', 3), ('ly', '', 4),
+    ('sses', 'ss', 2), ('s', '', 3),
+]
+KEEP_DOUBLE = set('lsz')
+VOWELS = set('aeiouy')
+# Porter step 1b: a one-syllable consonant-vowel-consonant stem lost a silent e ("lov" -> "love")
+SILENT_E_SUFFIXES = ('ingly', 'edly', 'ing', 'ed')
+SHORT_STEM = re.compile(r'^[^aeiouy]*[aeiouy][^aeiouwxy]$')
+
+
+def stem(word: str) -> str:
+    """Strip one common English suffix, undoubling a final consonant or restoring a silent e."""
+    for suffix, replacement, shortest in SUFFIX_RULES:
+        if not word.endswith(suffix):
+            continue
+        base = word[:len(word) - len(suffix)]
+        if len(base) < shortest or not VOWELS.intersection(base):
+            return word
+        if suffix == 's' and base.endswith(('s', 'u', 'i')):
+            return word  # "grass", "famous", "basis"
+        if suffix in ('ing', 'ed', 'er', 'ers') and len(base) > 2 and base[-1] == base[-2] and base[-1] not in KEEP_DOUBLE | VOWELS:
+            base = base[:-1]  # "shedding" -> "shed"
+        elif suffix in SILENT_E_SUFFIXES and SHORT_STEM.match(base):
+            base += 'e'  # "loving" -> "love", matching "loves"
+        return base + replacement
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(word) for word in WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+class BreedDocuments:
+    """Searchable text for breed records: name, description and matched AKC temperament."""
+
+    def __init__(self, akc_file: str = AKC_FILE):
+        table = BreedTable.from_csv(akc_file)
+        self.temperaments = table.text['temperament']
+        self.name_index = BreedNameIndex({name: {'position': i} for i, name in enumerate(table.names)})
+
+    def temperament(self, breed_name: str) -> str:
+        match = self.name_index.find_best_match(LISTING_ID.sub('', breed_name))
+        return self.temperaments[match['position']] if match else ''
+
+    def documents(self, records: Iterable[Dict]) -> Iterator[Tuple[str, str, str]]:
+        """(breed, description, temperament) per record."""
+        cache = {}
+        for record in records:
+            label = LISTING_ID.sub('', record['breed'])
+            if label not in cache:
+                cache[label] = self.temperament(label)
+            yield record['breed'], record.get('description') or '', cache[label]
+
+
+class TextIndex:
+    """Inverted index with per-posting BM25 weights, stored as flat arrays."""
+
+    def __init__(self, names: List[str], vocabulary: List[str], offsets: np.ndarray,
+                 doc_ids: np.ndarray, weights: np.ndarray):
+        self.names = names
+        self.vocabulary = vocabulary
+        self.term_ids = {term: i for i, term in enumerate(vocabulary)}
+        self.offsets = offsets      # Postings of term t are [offsets[t], offsets[t + 1])
+        self.doc_ids = doc_ids
+        self.weights = weights
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[str, str, str]], k1: float = K1, b: float = B) -> 'TextIndex':
+        names, lengths = [], []
+        term_ids: Dict[str, int] = {}
+        posting_terms, posting_docs, posting_tf = [], [], []
+
+        for doc_id, (name, description, temperament) in enumerate(documents):
+            tokens = tokenize(f"{name} {description} {temperament}")
+            names.append(name)
+            lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                posting_terms.append(term_ids.setdefault(term, len(term_ids)))
+                posting_docs.append(doc_id)
+                posting_tf.append(tf)
+
+        terms = np.asarray(posting_terms, dtype=np.int32)
+        docs = np.asarray(posting_docs, dtype=np.int32)
+        tf = np.asarray(posting_tf, dtype=np.float32)
+        lengths = np.asarray(lengths, dtype=np.float32)
+
+        # Group postings by term (doc order kept within a term)
+        order = np.argsort(terms, kind='stable')
+        terms, docs, tf = terms[order], docs[order], tf[order]
+        df = np.bincount(terms, minlength=len(term_ids))
+        offsets = np.zeros(len(term_ids) + 1, dtype=np.int64)
+        np.cumsum(df, out=offsets[1:])
+
+        count = len(names)
+        idf = np.log(1 + (count - df + 0.5) / (df + 0.5)).astype(np.float32)
+        average_length = lengths.mean() if count else 1.0
+        norm = k1 * (1 - b + b * lengths[docs] / average_length)
+        weights = idf[terms] * tf * (k1 + 1) / (tf + norm)
+
+        return cls(names, list(term_ids), offsets, docs, weights.astype(np.float32))
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query (0 where no term matches)."""
+        scores = np.zeros(len(self.names), dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            # Each document appears once per term, so plain fancy-index adds are safe
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        return scores
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Tuple[str, float]]:
+        """Best `limit` (breed, score) pairs, highest first; ties keep document order."""
+        scores = self.scores(query)
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        matched = matched[np.lexsort((matched, -scores[matched]))]
+        return [(self.names[i], round(float(scores[i]), 4)) for i in matched[:limit]]
+
+    # Serialization
+
+    def save(self, output_file: str = INDEX_FILE):
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        temp_file = f"{output_file}.tmp"
+        with open(temp_file, 'wb') as f:
+            np.savez_compressed(f, format=np.array(INDEX_FORMAT), names=np.asarray(self.names, dtype=str),
+                                vocabulary=np.asarray(self.vocabulary, dtype=str), offsets=self.offsets,
+                                doc_ids=self.doc_ids, weights=self.weights)
+        os.replace(temp_file, output_file)
+
+    @classmethod
+    def load(cls, index_file: str = INDEX_FILE) -> 'TextIndex':
+        with np.load(index_file) as data:
+            if int(data['format']) != INDEX_FORMAT:
+                raise ValueError(f"Unsupported text index format: {int(data['format'])}")
+            return cls(data['names'].tolist(), data['vocabulary'].tolist(),
+                       data['offsets'], data['doc_ids'], data['weights'])
+
+
+def build_text_index(input_file: str = BREED_DATA_FILE, akc_file: str = AKC_FILE,
+                     output_file: str = INDEX_FILE) -> TextIndex:
+    started = time.perf_counter()
+    index = TextIndex.build(BreedDocuments(akc_file).documents(read_records(input_file)))
+    index.save(output_file)
+    print(f"🔤 Indexed {len(index.names):,} breeds: {len(index.vocabulary):,} terms, "
+          f"{len(index.doc_ids):,} postings in {time.perf_counter() - started:.2f}s")
+    print(f"💾 Saved text index to: {output_file} ({os.path.getsize(output_file):,} bytes)")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the BM25 breed text index.")
+    parser.add_argument('--data', default=BREED_DATA_FILE, help=f"breed data (default: {BREED_DATA_FILE})")
+    parser.add_argument('--akc', default=AKC_FILE, help=f"AKC data (default: {AKC_FILE})")
+    parser.add_argument('--output', default=INDEX_FILE, help=f"index file (default: {INDEX_FILE})")
+    parser.add_argument('--query', nargs='+', help="search an existing index")
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        if args.query:
+            index = TextIndex.load(args.output)
+            for query in args.query:
+                started = time.perf_counter()
+                results = index.search(query, args.limit)
+                print(f"🔎 \"{query}\" ({(time.perf_counter() - started) * 1000:.2f}ms):")
+                for position, (name, score) in enumerate(results, 1):
+                    print(f"   {position:2}. {name:<40} {score:7.3f}")
+        else:
+            build_text_index(args.data, args.akc, args.output)
+    except Exception as e:
+        print(f"❌ Error with text index: {e}")
+        import traceback
+        traceback.print_exc()
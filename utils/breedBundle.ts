@@ -0,0 +1,173 @@
+// Decoder for assets/data/breeds.bin, the binary breed bundle written by
+// breed_bundle.py (its docstring has the layout). The app reads the bundle only
+// when it reseeds, instead of parsing the breed JSON on every launch.
+import { Asset } from 'expo-asset';
+import * as FileSystem from 'expo-file-system';
+
+// One breed as in seeder/dog_breeds_with_shelter_scores.json (flags are 1/0)
+export interface BreedRecord {
+  breed: string;
+  size: string;
+  energy_level: string;
+  good_with_kids: number;
+  good_with_pets: number;
+  trainability: string;
+  grooming_needs: string;
+  companion_or_guardian: string;
+  senior_friendly: number;
+  special_needs_possible: number;
+  description: string;
+  image_filename: string;
+  shelter_availability_score: number | null;
+}
+
+const MAGIC = 'BRDB';
+const BUNDLE_FORMAT = 1;
+const WORD_CODED = 1;
+const NULL_CODE = 255;
+
+// Same order as CATEGORICAL_FIELDS and FLAG_FIELDS in breed_bundle.py
+const CATEGORICAL_FIELDS = ['size', 'energy_level', 'trainability', 'grooming_needs', 'companion_or_guardian'] as const;
+const FLAG_FIELDS = ['good_with_kids', 'good_with_pets', 'senior_friendly', 'special_needs_possible'] as const;
+
+// Native decoder where the runtime has one (Hermes may not)
+const utf8Decoder = typeof TextDecoder === 'undefined' ? null : new TextDecoder('utf-8');
+
+const decodeUtf8 = (bytes: Uint8Array, start: number, end: number): string => {
+  if (utf8Decoder) return utf8Decoder.decode(bytes.subarray(start, end));
+
+  let ascii = true;
+  for (let i = start; i < end && ascii; i++) ascii = bytes[i] < 0x80;
+  if (ascii && end - start <= 8192) {
+    return String.fromCharCode.apply(null, bytes.subarray(start, end) as unknown as number[]);
+  }
+
+  const codes: number[] = [];
+  let i = start;
+  while (i < end) {
+    const byte = bytes[i++];
+    let code: number;
+    if (byte < 0x80) {
+      code = byte;
+    } else if (byte < 0xe0) {
+      code = ((byte & 0x1f) << 6) | (bytes[i++] & 0x3f);
+    } else if (byte < 0xf0) {
+      code = ((byte & 0x0f) << 12) | ((bytes[i++] & 0x3f) << 6) | (bytes[i++] & 0x3f);
+    } else {
+      code = ((byte & 0x07) << 18) | ((bytes[i++] & 0x3f) << 12) | ((bytes[i++] & 0x3f) << 6) | (bytes[i++] & 0x3f);
+    }
+    if (code > 0xffff) {
+      code -= 0x10000;
+      codes.push(0xd800 + (code >> 10), 0xdc00 + (code & 0x3ff));
+    } else {
+      codes.push(code);
+    }
+  }
+  let text = '';
+  // fromCharCode in slices: spreading a huge array can overflow the call stack
+  for (let offset = 0; offset < codes.length; offset += 8192) {
+    text += String.fromCharCode(...codes.slice(offset, offset + 8192));
+  }
+  return text;
+};
+
+class BundleReader {
+  position = 0;
+
+  constructor(private bytes: Uint8Array) {}
+
+  byte(): number {
+    return this.bytes[this.position++];
+  }
+
+  varint(): number {
+    let value = 0;
+    let scale = 1;
+    for (;;) {
+      const byte = this.bytes[this.position++];
+      value += (byte & 0x7f) * scale;
+      if (byte < 0x80) return value;
+      scale *= 128;
+    }
+  }
+
+  strings(): string[] {
+    const count = this.varint();
+    const lengths: number[] = [];
+    for (let i = 0; i < count; i++) lengths.push(this.varint());
+    return lengths.map(length => {
+      const text = decodeUtf8(this.bytes, this.position, this.position + length);
+      this.position += length;
+      return text;
+    });
+  }
+}
+
+export const decodeBreedBundle = (bytes: Uint8Array): { datasetHash: string; breeds: BreedRecord[] } => {
+  if (String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== MAGIC) {
+    throw new Error('Not a breed bundle');
+  }
+  if (bytes[4] !== BUNDLE_FORMAT) throw new Error(`Unsupported breed bundle format: ${bytes[4]}`);
+  const flags = bytes[5];
+  let datasetHash = '';
+  for (let i = 6; i < 38; i++) datasetHash += bytes[i].toString(16).padStart(2, '0');
+
+  const reader = new BundleReader(bytes);
+  reader.position = 38;
+  const count = reader.varint();
+  const strings = reader.strings();
+  const levels = CATEGORICAL_FIELDS.map(() => {
+    const size = reader.varint();
+    const values: string[] = [];
+    for (let i = 0; i < size; i++) values.push(strings[reader.varint()]);
+    return values;
+  });
+  const tokens = flags & WORD_CODED ? reader.strings() : [];
+
+  const descriptionCount = reader.varint();
+  const descriptions: string[] = [];
+  for (let i = 0; i < descriptionCount; i++) {
+    if (flags & WORD_CODED) {
+      const length = reader.varint();
+      let text = '';
+      for (let j = 0; j < length; j++) text += tokens[reader.varint()];
+      descriptions.push(text);
+    } else {
+      descriptions.push(strings[reader.varint()]);
+    }
+  }
+
+  const breeds: BreedRecord[] = [];
+  for (let i = 0; i < count; i++) {
+    const record: Record<string, string | number | null> = { breed: strings[reader.varint()] };
+    CATEGORICAL_FIELDS.forEach((field, column) => {
+      const code = reader.byte();
+      record[field] = code === NULL_CODE ? null : levels[column][code];
+    });
+    const flagByte = reader.byte();
+    FLAG_FIELDS.forEach((field, bit) => {
+      record[field] = (flagByte >> bit) & 1;
+    });
+    record.shelter_availability_score = reader.byte() || null;
+    record.image_filename = strings[reader.varint()];
+    record.description = descriptions[reader.varint()];
+    breeds.push(record as unknown as BreedRecord);
+  }
+  return { datasetHash, breeds };
+};
+
+const base64ToBytes = (base64: string): Uint8Array => {
+  const binary = atob(base64);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  return bytes;
+};
+
+export const loadBreedBundle = async (): Promise<{ datasetHash: string; breeds: BreedRecord[] }> => {
+  const asset = Asset.fromModule(require('../assets/data/breeds.bin'));
+  await asset.downloadAsync();
+  const base64 = await FileSystem.readAsStringAsync(asset.localUri ?? asset.uri, {
+    encoding: FileSystem.EncodingType.Base64,
+  });
+  return decodeBreedBundle(base64ToBytes(base64));
+};
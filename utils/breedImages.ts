@@ -1,3 +1,4 @@
+// Generated by image_manifest.py from the breed data and image manifest - do not edit by hand
 // Shared breed images mapping - only includes breeds that actually exist in the data
 export const breedImages: { [key: string]: any } = {
   'akita': require('@/assets/images/breeds_resized/akita.png'),
@@ -64,21 +65,27 @@ export const breedImages: { [key: string]: any } = {
   'english toy spaniel': require('@/assets/images/breeds_resized/english_toy_spaniel.png'),
   'entlebucher mountain dog': require('@/assets/images/breeds_resized/entlebucher_mountain_dog.png'),
   'eurasier': require('@/assets/images/breeds_resized/eurasier.png'),
+  'feist': require('@/assets/images/breeds_resized/feist.png'),
   'field spaniel': require('@/assets/images/breeds_resized/field_spaniel.png'),
   'finnish lapphund': require('@/assets/images/breeds_resized/finnish_lapphund.png'),
   'finnish spitz': require('@/assets/images/breeds_resized/finnish_spitz.png'),
   'french bulldog': require('@/assets/images/breeds_resized/french_bulldog.png'),
+  'french spaniel': require('@/assets/images/breeds_resized/french_spaniel.png'),
+  'frenchton': require('@/assets/images/breeds_resized/frenchton.png'),
   'german pinscher': require('@/assets/images/breeds_resized/german_pinscher.png'),
   'german shepherd': require('@/assets/images/breeds_resized/german_shepherd_dog.png'),
   'german shorthaired pointer': require('@/assets/images/breeds_resized/german_shorthaired_pointer.png'),
   'german wirehaired pointer': require('@/assets/images/breeds_resized/german_wirehaired_pointer.png'),
   'giant schnauzer': require('@/assets/images/breeds_resized/giant_schnauzer.png'),
+  'glen of imaal terrier': require('@/assets/images/breeds_resized/glen_of_imaal_terrier.png'),
   'golden retriever': require('@/assets/images/breeds_resized/golden_retriever.png'),
   'goldendoodle': require('@/assets/images/breeds_resized/goldendoodle.png'),
   'great dane': require('@/assets/images/breeds_resized/great_dane.png'),
   'greater swiss mountain dog': require('@/assets/images/breeds_resized/greater_swiss_mountain_dog.png'),
   'greyhound': require('@/assets/images/breeds_resized/greyhound.png'),
   'havanese': require('@/assets/images/breeds_resized/havanese.png'),
+  'havapoo': require('@/assets/images/breeds_resized/havapoo.png'),
+  'huskydoodle': require('@/assets/images/breeds_resized/huskydoodle.png'),
   'ibizan hound': require('@/assets/images/breeds_resized/ibizan_hound.png'),
   'icelandic sheepdog': require('@/assets/images/breeds_resized/icelandic_sheepdog.png'),
   'irish setter': require('@/assets/images/breeds_resized/irish_setter.png'),
@@ -88,6 +95,8 @@ export const breedImages: { [key: string]: any } = {
   'italian greyhound': require('@/assets/images/breeds_resized/italian_greyhound.png'),
   'jack russell terrier': require('@/assets/images/breeds_resized/jack_russell_terrier.png'),
   'japanese chin': require('@/assets/images/breeds_resized/japanese_chin.png'),
+  'japanese spitz': require('@/assets/images/breeds_resized/japanese_spitz.png'),
+  'japanese terrier': require('@/assets/images/breeds_resized/japanese_terrier.png'),
   'keeshond': require('@/assets/images/breeds_resized/keeshond.png'),
   'kerry blue terrier': require('@/assets/images/breeds_resized/kerry_blue_terrier.png'),
   'komondor': require('@/assets/images/breeds_resized/komondor.png'),
@@ -104,24 +113,32 @@ export const breedImages: { [key: string]: any } = {
   'manchester terrier': require('@/assets/images/breeds_resized/manchester_terrier.png'),
   'mastiff': require('@/assets/images/breeds_resized/mastiff.png'),
   'miniature bull terrier': require('@/assets/images/breeds_resized/miniature_bull_terrier.png'),
+  'miniature poodle': require('@/assets/images/breeds_resized/miniature_poodle.png'),
   'miniature schnauzer': require('@/assets/images/breeds_resized/miniature_schnauzer.png'),
+  'morkie': require('@/assets/images/breeds_resized/morkie.png'),
+  'mountain cur': require('@/assets/images/breeds_resized/mountain_cur.png'),
   'neapolitan mastiff': require('@/assets/images/breeds_resized/neapolitan_mastiff.png'),
   'newfoundland': require('@/assets/images/breeds_resized/newfoundland.png'),
+  'newfypoo': require('@/assets/images/breeds_resized/newfypoo.png'),
   'norfolk terrier': require('@/assets/images/breeds_resized/norfolk_terrier.png'),
   'norwegian elkhound': require('@/assets/images/breeds_resized/norwegian_elkhound.png'),
   'norwich terrier': require('@/assets/images/breeds_resized/norwich_terrier.png'),
   'old english sheepdog': require('@/assets/images/breeds_resized/old_english_sheepdog.png'),
   'otterhound': require('@/assets/images/breeds_resized/otterhound.png'),
   'papillon': require('@/assets/images/breeds_resized/papillon.png'),
+  'peekapoo': require('@/assets/images/breeds_resized/peekapoo.png'),
   'pekingese': require('@/assets/images/breeds_resized/pekingese.png'),
   'pembroke welsh corgi': require('@/assets/images/breeds_resized/pembroke_welsh_corgi.png'),
   'petit basset griffon vendeen': require('@/assets/images/breeds_resized/petit_basset_griffon_vendeen.png'),
   'pharaoh hound': require('@/assets/images/breeds_resized/pharaoh_hound.png'),
+  'pitsky': require('@/assets/images/breeds_resized/pitsky.png'),
   'plott hound': require('@/assets/images/breeds_resized/plott.png'),
   'pointer': require('@/assets/images/breeds_resized/pointer.png'),
   'polish lowland sheepdog': require('@/assets/images/breeds_resized/polish_lowland_sheepdog.png'),
   'pomeranian': require('@/assets/images/breeds_resized/pomeranian.png'),
+  'pomsky': require('@/assets/images/breeds_resized/pomsky.png'),
   'poodle': require('@/assets/images/breeds_resized/poodle.png'),
+  'portuguese podengo': require('@/assets/images/breeds_resized/portuguese_podengo.png'),
   'puggle': require('@/assets/images/breeds_resized/puggle.png'),
   'puli': require('@/assets/images/breeds_resized/puli.png'),
   'rat terrier': require('@/assets/images/breeds_resized/rat_terrier.png'),
@@ -164,37 +181,20 @@ export const breedImages: { [key: string]: any } = {
   'xoloitzcuintli': require('@/assets/images/breeds_resized/xoloitzcuintli.png'),
   'yorkipoo': require('@/assets/images/breeds_resized/yorkipoo.png'),
   'yorkshire terrier': require('@/assets/images/breeds_resized/yorkshire_terrier.png'),
-  // Missing breeds that were added
-  'feist': require('@/assets/images/breeds_resized/feist.png'),
-  'french spaniel': require('@/assets/images/breeds_resized/french_spaniel.png'),
-  'frenchton': require('@/assets/images/breeds_resized/frenchton.png'),
-  'glen of imaal terrier': require('@/assets/images/breeds_resized/glen_of_imaal_terrier.png'),
-  'havapoo': require('@/assets/images/breeds_resized/havapoo.png'),
-  'huskydoodle': require('@/assets/images/breeds_resized/huskydoodle.png'),
-  'japanese spitz': require('@/assets/images/breeds_resized/japanese_spitz.png'),
-  'japanese terrier': require('@/assets/images/breeds_resized/japanese_terrier.png'),
-  'miniature poodle': require('@/assets/images/breeds_resized/miniature_poodle.png'),
-  'morkie': require('@/assets/images/breeds_resized/morkie.png'),
-  'mountain cur': require('@/assets/images/breeds_resized/mountain_cur.png'),
-  'newfypoo': require('@/assets/images/breeds_resized/newfypoo.png'),
-  'peekapoo': require('@/assets/images/breeds_resized/peekapoo.png'),
-  'pitsky': require('@/assets/images/breeds_resized/pitsky.png'),
-  'pomsky': require('@/assets/images/breeds_resized/pomsky.png'),
-  'portuguese podengo': require('@/assets/images/breeds_resized/portuguese_podengo.png'),
 };
 
 // Function to get breed image with error handling
 export const getBreedImage = (imageFilename: string, breedName: string) => {
   if (!breedName) return null;
-  
+
   // Convert breed name to lowercase for case-insensitive lookup
   const breedKey = breedName.toLowerCase();
   const image = breedImages[breedKey];
-  
+
   if (!image) {
     // console.log(`Image not found for breed: "${breedName}" (key: "${breedKey}")`);
     return null;
   }
-  
+
   return image;
-}; 
\ No newline at end of file
+};
@@ -0,0 +1,52 @@
+// Precomputed flow results, generated by questionnaire_results.py.
+// Every size/energy/kids/pets/grooming combination has a ranked breed list,
+// filtered like findBestMatches and topped up from relaxed answers where few
+// breeds match, so a lookup is one index computation instead of a scoring
+// pass over all breeds.
+import { DogBreed } from '@/database/database';
+import { BreedMatch, UserPreferences, getDefaultPreferences } from '@/hooks/useBreedMatcher';
+import dataVersion from '../seeder/data_version.json';
+import results from '../assets/data/questionnaire_results.json';
+
+// Breed columns whose answers were widened to neighbouring levels or dropped to top up a short list
+export type Relaxation = { widened: string[]; dropped: string[] } | null;
+
+// Answers the flow screens don't ask (the lists are built with their defaults,
+// including the adoptable filter and blend); other values need the full matcher
+const UNASKED_KEYS: (keyof UserPreferences)[] = [
+  'trainability', 'role', 'seniorFriendly', 'specialNeedsOk', 'prioritizeAdoptable',
+];
+
+export const getPrecomputedMatches = (
+  breeds: DogBreed[],
+  preferences: UserPreferences
+): { matches: BreedMatch[]; relaxation: Relaxation } | null => {
+  // Results built from different breed data than the app ships are stale
+  if (results.dataset_hash !== dataVersion.dataset_hash) return null;
+
+  const defaults = getDefaultPreferences();
+  if (UNASKED_KEYS.some(key => preferences[key] !== defaults[key])) return null;
+
+  let index = 0;
+  for (const question of results.questions) {
+    const options = question.options as (string | boolean | null)[];
+    const position = options.indexOf(preferences[question.key as keyof UserPreferences] as string | boolean | null);
+    if (position < 0) return null;
+    index = index * options.length + position;
+  }
+
+  const byName = new Map(breeds.map(breed => [breed.breed, breed]));
+  const matches: BreedMatch[] = [];
+  for (const breedIndex of results.lists[results.combinations.list[index]]) {
+    const breed = byName.get(results.breeds[breedIndex]);
+    if (breed) {
+      // Lists are stored by rank only; the results screen doesn't show scores
+      matches.push({ breed, score: 0, matchReasons: [] });
+    }
+  }
+
+  return {
+    matches,
+    relaxation: results.relaxations[results.combinations.relaxation[index]] as Relaxation,
+  };
+};